@@ -0,0 +1,198 @@
+"""
+Per-stage pipeline benchmark on synthetic $HOME trees.
+
+Usage (from the repo root):
+    python -m benchmarks.bench_pipeline --sizes 100 1000 10000
+    python -m benchmarks.bench_pipeline --sizes 1000 --save-baseline
+
+benchmarks/baseline.json holds the committed reference numbers. When it is
+missing (or --baseline points at a new file), the first run writes it.
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+import contextlib
+
+from datetime import datetime
+
+from .synth_data import generate_synthetic_tree
+
+DEFAULT_SIZES = [100, 1000, 10000]
+DEFAULT_BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+DEFAULT_REGRESSION_RATIO = 1.25  # Flag stages slower than baseline by more than 25%...
+MIN_REGRESSION_SECONDS = 0.005  # ...and by more than 5 ms (ignores timer noise on tiny stages)
+
+
+@contextlib.contextmanager
+def synthetic_home(home_dir):
+    """Point $HOME at the synthetic tree and disable the scan cache for honest loader timings."""
+    saved_env = {key: os.environ.get(key) for key in ("HOME", "DOTREP_SCAN_CACHE")}
+    os.environ["HOME"] = home_dir
+    os.environ["DOTREP_SCAN_CACHE"] = "0"
+    try:
+        yield
+    finally:
+        for key, value in saved_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def time_stage(results, size, stage, func, *args, repeat=1):
+    """Run func(*args) `repeat` times, record the best time, and return the last result."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    rows = len(result) if hasattr(result, "__len__") else None
+    results.append({"size": size, "stage": stage, "seconds": best, "rows_out": rows})
+    print(f"  {stage:<28} {best * 1000:10.2f} ms  rows_out={rows}")
+    return result
+
+
+def run_size(size, repeat, work_dir):
+    from db1_main_df.db11_make_main_df import consolidate_item_type, apply_output_grouping, reorder_dfm_cols_perm
+    from db1_main_df.db13_merge import df_merge_sequence
+    from db1_main_df.db10_make_df_dict import find_unmatched_items
+    from db0_load.db00_load_rp import load_rp_dataframe
+    from db0_load.db01_load_hm import load_hm_dataframe
+    from db0_load.db02_load_db import load_dotbot_yaml_dataframe
+    from db0_load.db03_load_cf import load_cf_dataframe
+    from db2_rep_df.db20_make_rpt_df import add_report_fields, assign_dot_state, assign_nosym_sort, post_build_nan_replace
+    from db2_rep_df.db21_format_rows import sort_filter_report_df
+    from db2_rep_df.db22_format_cols import reorder_dfr_cols_perm
+    from db2_rep_df.db24_match_reg import detect_full_domain_match
+    from db2_rep_df.db26_match_alert import detect_alerts
+    from report_gen import export_to_markdown
+
+    results = []
+    size_dir = os.path.join(work_dir, f"size_{size}")
+    os.makedirs(size_dir)
+
+    start = time.perf_counter()
+    paths = generate_synthetic_tree(size_dir, size)
+    print(f"size={size}: generated in {time.perf_counter() - start:.2f} s")
+
+    with synthetic_home(paths["home_dir"]):
+        repo_df = time_stage(results, size, "load_rp_dataframe", load_rp_dataframe, repeat=repeat)
+        dotbot_df = time_stage(results, size, "load_dotbot_yaml_dataframe", load_dotbot_yaml_dataframe, repeat=repeat)
+        home_df = time_stage(results, size, "load_hm_dataframe", load_hm_dataframe, dotbot_df, repeat=repeat)
+        config_df = time_stage(results, size, "load_cf_dataframe", load_cf_dataframe, paths["config_csv_path"], repeat=repeat)
+
+    # Same preparation as build_main_dataframe()
+    def merge_stage():
+        main_df = repo_df.copy()
+        main_df['item_name'] = main_df['item_name_rp']
+        main_df['item_type'] = main_df['item_type_rp']
+        main_df['unique_id'] = main_df['unique_id_rp']
+        return df_merge_sequence(main_df, home_df, dotbot_df, config_df, 'none')
+
+    main_df = time_stage(results, size, "df_merge_sequence", merge_stage, repeat=repeat)
+    main_df = consolidate_item_type(main_df)
+    main_df['sort_orig'] = main_df['sort_orig'].fillna(-1).astype('Int64')
+    main_df = reorder_dfm_cols_perm(apply_output_grouping(main_df))
+
+    report_df = reorder_dfr_cols_perm(add_report_fields(main_df.copy()))
+    # Both match stages overwrite their output columns, so repeats can reuse the same frame.
+    report_df = time_stage(results, size, "detect_full_domain_match", detect_full_domain_match, report_df, repeat=repeat)
+    report_df = time_stage(results, size, "detect_alerts", detect_alerts, report_df, repeat=repeat)
+
+    report_df = post_build_nan_replace(assign_nosym_sort(assign_dot_state(report_df)))
+    report_df = sort_filter_report_df(report_df, False, False, False, False, False)
+    fs_not_in_di, di_not_in_fs = find_unmatched_items(home_df, config_df)
+
+    markdown_path = os.path.join(size_dir, "report.md")
+    time_stage(results, size, "export_to_markdown",
+               lambda: export_to_markdown(markdown_path, df=report_df, fs_not_in_di=fs_not_in_di, di_not_in_fs=di_not_in_fs),
+               repeat=repeat)
+    return results
+
+
+def compare_to_baseline(results, baseline, ratio=DEFAULT_REGRESSION_RATIO):
+    """Return regressions: stages slower than the baseline by more than `ratio` (and MIN_REGRESSION_SECONDS)."""
+    baseline_times = {(entry["size"], entry["stage"]): entry["seconds"] for entry in baseline.get("results", [])}
+    regressions = []
+    for entry in results:
+        base_seconds = baseline_times.get((entry["size"], entry["stage"]))
+        if base_seconds is None:
+            continue
+        if entry["seconds"] > base_seconds * ratio and entry["seconds"] - base_seconds > MIN_REGRESSION_SECONDS:
+            regressions.append({**entry, "baseline_seconds": base_seconds, "ratio": entry["seconds"] / base_seconds})
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Per-stage benchmark of the dot report pipeline.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Synthetic item counts (100 to 1000000)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per stage; the best time is kept")
+    parser.add_argument("--output", default="bench_results.json", help="Where to write the JSON results")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_PATH, help="Baseline JSON to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the new baseline")
+    parser.add_argument("--ratio", type=float, default=DEFAULT_REGRESSION_RATIO, help="Slowdown ratio counted as a regression")
+    parser.add_argument("--keep", action="store_true", help="Keep the generated synthetic trees")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    import logging
+    import pandas as pd
+
+    args = parse_args(argv)
+    logging.disable(logging.INFO)
+
+    work_dir = tempfile.mkdtemp(prefix="dotrep_bench_")
+    results = []
+    try:
+        for size in args.sizes:
+            results.extend(run_size(size, args.repeat, work_dir))
+    finally:
+        if args.keep:
+            print(f"Synthetic trees kept in {work_dir}")
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.save_baseline or not os.path.exists(args.baseline):
+        # Nothing to compare against yet: this run becomes the baseline
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    with open(args.baseline, "r") as f:
+        baseline = json.load(f)
+    regressions = compare_to_baseline(results, baseline, args.ratio)
+    for entry in regressions:
+        print(
+            f"REGRESSION size={entry['size']} {entry['stage']}: "
+            f"{entry['seconds'] * 1000:.2f} ms vs {entry['baseline_seconds'] * 1000:.2f} ms (x{entry['ratio']:.2f})"
+        )
+    if not regressions:
+        print("No regressions against baseline.")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+import os
+import csv
+
+PUBLIC_REPO_REL = "._dotfiles/dotfiles_srb_repo"
+PRIVATE_REPO_REL = "._dotfiles/dotfiles_srb_repo_private"
+
+CONFIG_COLUMNS = [
+    "item_name_rp_cf", "item_name_hm_cf", "dot_struc_cf", "item_type_rp_cf", "item_type_hm_cf",
+    "cat_1_cf", "cat_1_name_cf", "comment_cf", "cat_2_cf", "repo_scope_cf", "no_show_cf",
+]
+
+# Item mix over a cycle of 20 items (each kind exercises a different report path)
+ITEM_KIND_CYCLE = (
+    ["synced"] * 10 +
+    ["private"] * 2 +
+    ["home_only"] * 3 +
+    ["stray"] * 2 +
+    ["doc_only", "overwrite", "repo_only"]
+)
+
+
+def get_item_kind(index):
+    return ITEM_KIND_CYCLE[index % len(ITEM_KIND_CYCLE)]
+
+
+def make_item(path, is_folder):
+    if is_folder:
+        os.makedirs(path, exist_ok=True)
+    else:
+        with open(path, "w"):
+            pass
+
+
+def generate_synthetic_tree(base_dir, n_items, folder_every=3):
+    """
+    Generate a synthetic $HOME with public/private repos, install.conf.yaml and dotrep_config.csv.
+
+    Args:
+        base_dir (str): Empty directory to generate into.
+        n_items (int): Number of synthetic dot items.
+        folder_every (int): Every n-th item is a folder instead of a file.
+
+    Returns:
+        dict: Paths of the generated home, repos, Dotbot YAML and config CSV.
+    """
+    home_dir = os.path.join(base_dir, "home")
+    public_repo = os.path.join(home_dir, PUBLIC_REPO_REL)
+    private_repo = os.path.join(home_dir, PRIVATE_REPO_REL)
+    os.makedirs(public_repo)
+    os.makedirs(private_repo)
+
+    yaml_lines = ["- link:"]
+    config_rows = []
+
+    for index in range(n_items):
+        kind = get_item_kind(index)
+        item_name = f".synth_{index:07d}"
+        is_folder = index % folder_every == 0
+        item_type = "folder" if is_folder else "file"
+        category = f"cat{index % 7}"
+        home_path = os.path.join(home_dir, item_name)
+
+        if kind in ("synced", "private", "overwrite", "repo_only"):
+            repo_dir, repo_rel, scope = (
+                (private_repo, PRIVATE_REPO_REL, "private") if kind == "private"
+                else (public_repo, PUBLIC_REPO_REL, "public")
+            )
+            make_item(os.path.join(repo_dir, item_name), is_folder)
+
+            if kind in ("synced", "private"):
+                os.symlink(os.path.join(repo_dir, item_name), home_path)
+            elif kind == "overwrite":
+                make_item(home_path, is_folder)  # Real item where a symlink is expected
+
+            if kind != "repo_only":
+                folder_comment = "  # folder" if is_folder else ""
+                yaml_lines.append(f"    ~/{item_name}: ~/{repo_rel}/{item_name}{folder_comment}")
+                config_rows.append([
+                    item_name, item_name, "rp>hm", item_type, f"{item_type}_sym",
+                    category, category.upper(), "", "synthetic", scope, "FALSE",
+                ])
+
+        elif kind == "home_only":
+            make_item(home_path, is_folder)
+            config_rows.append([
+                "none", item_name, "hm", "none", item_type,
+                category, category.upper(), "home only", "synthetic", "local", "FALSE",
+            ])
+
+        elif kind == "stray":
+            make_item(home_path, is_folder)  # Unmanaged item, not in any doc
+
+        elif kind == "doc_only":
+            config_rows.append([
+                item_name, item_name, "rp>hm", item_type, f"{item_type}_sym",
+                category, category.upper(), "missing from FS", "synthetic", "public", "FALSE",
+            ])
+
+    with open(os.path.join(public_repo, ".gitignore"), "w") as f:
+        f.write("# synthetic\n.synth_*9\n!.synth_0000009\n")
+
+    dotbot_yaml_path = os.path.join(public_repo, "install.conf.yaml")
+    with open(dotbot_yaml_path, "w") as f:
+        f.write("\n".join(yaml_lines) + "\n")
+
+    config_csv_path = os.path.join(base_dir, "dotrep_config.csv")
+    with open(config_csv_path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(CONFIG_COLUMNS)
+        writer.writerows(config_rows)
+
+    return {
+        "home_dir": home_dir,
+        "public_repo": public_repo,
+        "private_repo": private_repo,
+        "dotbot_yaml_path": dotbot_yaml_path,
+        "config_csv_path": config_csv_path,
+    }
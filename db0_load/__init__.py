@@ -1,38 +1,63 @@
-from db0_load.db00_load_rp import (
-    load_rp_dataframe,
-    create_git_rp_column,
-    read_gitignore_items
-)
-from db0_load.db01_load_hm import load_hm_dataframe
-
-from db0_load.db02_load_db import load_dotbot_yaml_dataframe
-
-from db0_load.db03_load_cf import (
-    correct_and_validate_user_config_df,
-    load_cf_dataframe
-)
-from db0_load.db04_load_fx import load_fx_dataframe
-
-from .db05_get_filetype import (
-    determine_item_type,
-    is_symlink,
-    is_alias,
-    get_file_type,
-    get_folder_type,
-    resolve_item_type,
-    detect_alias_type,
-    detect_symlink_target_type,
-)
+from db5_global.db56_lazy_exports import lazy_exports
+
+# Exported name -> defining module; each module is imported on first access
+LAZY_EXPORTS = {
+    "load_rp_dataframe": "db0_load.db00_load_rp",
+    "create_git_rp_column": "db0_load.db00_load_rp",
+
+    "load_hm_dataframe": "db0_load.db01_load_hm",
+
+    "load_dotbot_yaml_dataframe": "db0_load.db02_load_db",
+    "find_dotbot_configs": "db0_load.db02_load_db",
+
+    "correct_and_validate_user_config_df": "db0_load.db03_load_cf",
+    "load_cf_dataframe": "db0_load.db03_load_cf",
+
+    "FixtureIndex": "db0_load.db04_load_fx",
+    "load_fx_dataframe": "db0_load.db04_load_fx",
+
+    "determine_item_type": "db0_load.db05_get_filetype",
+    "is_symlink": "db0_load.db05_get_filetype",
+    "is_alias": "db0_load.db05_get_filetype",
+    "get_file_type": "db0_load.db05_get_filetype",
+    "get_folder_type": "db0_load.db05_get_filetype",
+    "resolve_item_type": "db0_load.db05_get_filetype",
+    "detect_alias_type": "db0_load.db05_get_filetype",
+    "detect_symlink_target_type": "db0_load.db05_get_filetype",
+
+    "determine_entry_type": "db0_load.db06_scan_dir",
+    "scan_dot_entries": "db0_load.db06_scan_dir",
+
+    "GitignoreMatcher": "db0_load.db07_gitignore",
+    "load_gitignore_matcher": "db0_load.db07_gitignore",
+    "parse_gitignore_line": "db0_load.db07_gitignore",
+
+    "cached_scan_dot_entries": "db0_load.db08_scan_cache",
+
+    "parse_dotbot_links": "db0_load.db09_dotbot_conf",
+    "load_dotbot_config_links": "db0_load.db09_dotbot_conf",
+
+    "ContentHasher": "db0_load.db10_content_hash",
+    "hash_file": "db0_load.db10_content_hash",
+
+    "PathTrie": "db0_load.db11_path_trie",
+    "scan_trie_entries": "db0_load.db11_path_trie",
+
+    "LinkResolution": "db0_load.db12_symlink_resolver",
+    "SymlinkResolver": "db0_load.db12_symlink_resolver",
+    "resolve_link_item_types": "db0_load.db12_symlink_resolver",
+}
 
 __all__ = [
     "load_rp_dataframe",
     "create_git_rp_column",
-    "read_gitignore_items",
     "load_hm_dataframe",
     "load_dotbot_yaml_dataframe",
+    "find_dotbot_configs",
     "correct_and_validate_user_config_df",
     "load_cf_dataframe",
     "load_fx_dataframe",
+    "FixtureIndex",
 
     "determine_item_type",
     "is_symlink",
@@ -42,4 +67,21 @@ __all__ = [
     "resolve_item_type",
     "detect_alias_type",
     "detect_symlink_target_type",
+    "determine_entry_type",
+    "scan_dot_entries",
+    "GitignoreMatcher",
+    "load_gitignore_matcher",
+    "parse_gitignore_line",
+    "cached_scan_dot_entries",
+    "parse_dotbot_links",
+    "load_dotbot_config_links",
+    "ContentHasher",
+    "hash_file",
+    "PathTrie",
+    "scan_trie_entries",
+    "LinkResolution",
+    "SymlinkResolver",
+    "resolve_link_item_types",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, LAZY_EXPORTS)
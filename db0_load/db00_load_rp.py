@@ -1,48 +1,76 @@
 import os
 import logging
 import pandas as pd
-import fnmatch
 
+from concurrent.futures import ThreadPoolExecutor
 from db1_main_df.db14_merge_sup import get_next_unique_id
-from .db05_get_filetype import determine_item_type
-from db5_global.db52_dtype_dict import f_types_vals
+from .db04_load_fx import parse_bool
+from .db07_gitignore import load_gitignore_matcher
+from .db08_scan_cache import cached_scan_dot_entries
+from db5_global.db52_dtype_dict import f_types_vals, astype_f_type
+from db5_global.db54_trace import traced_stage
+from db5_global.db58_settings import REPO_SCOPES_CSV_PATH
 
 EXCLUDED_REPO_ITEMS = {".git", ".gitignore", ".DS_Store"}
 
+DEFAULT_REPO_SCOPES = {
+    "public": "~/._dotfiles/dotfiles_srb_repo",
+    "private": "~/._dotfiles/dotfiles_srb_repo_private",
+}
+REPO_SCAN_MAX_WORKERS = 8
+
+
+def get_repo_scope_paths(path=REPO_SCOPES_CSV_PATH):
+    """
+    Return configured repo roots for multi-repo dotfiles scanning.
+
+    Scopes are read (in row order) from data/repo_scopes.csv with columns
+    repo_scope, repo_path and an optional enabled flag. Falls back to the
+    public/private defaults when the registry file does not exist.
+    """
+    repo_scopes = DEFAULT_REPO_SCOPES
+    if os.path.exists(path):
+        registry_df = pd.read_csv(path, dtype="string")
+        if "enabled" in registry_df.columns:
+            registry_df = registry_df[registry_df["enabled"].apply(parse_bool)]
+
+        repo_scopes = {}
+        for repo_scope, repo_path in zip(registry_df["repo_scope"], registry_df["repo_path"]):
+            if pd.isna(repo_scope) or pd.isna(repo_path):
+                continue
+            repo_scope = repo_scope.strip()
+            if repo_scope in repo_scopes:
+                raise ValueError(f"Duplicate repo scope in {path}: {repo_scope}")
+            repo_scopes[repo_scope] = repo_path.strip()
 
-def get_repo_scope_paths():
-    """Return configured repo roots for multi-repo dotfiles scanning."""
-    home_dir_path = os.path.expanduser("~")
     return {
-        "public": os.path.join(home_dir_path, "._dotfiles/dotfiles_srb_repo"),
-        "private": os.path.join(home_dir_path, "._dotfiles/dotfiles_srb_repo_private"),
+        repo_scope: os.path.expanduser(repo_path)
+        for repo_scope, repo_path in repo_scopes.items()
     }
 
 
+@traced_stage('load_rp_dataframe')
 def load_rp_dataframe():
-    repo_items = []
-    item_sources = {}
     repo_scope_paths = get_repo_scope_paths()
 
+    scan_scopes = {}
     for repo_scope, repo_path in repo_scope_paths.items():
         if not os.path.isdir(repo_path):
             logging.info(f"Repo path not found for scope '{repo_scope}': {repo_path}")
             continue
+        scan_scopes[repo_scope] = repo_path
+
+    # Scan every repo (listing + .gitignore) in a bounded thread pool; map() keeps registry order.
+    scope_dfs = []
+    if scan_scopes:
+        max_workers = min(REPO_SCAN_MAX_WORKERS, len(scan_scopes))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            scope_dfs = list(executor.map(scan_repo_scope, scan_scopes.keys(), scan_scopes.values()))
 
-        for item in os.listdir(repo_path):
-            if item.startswith("."):
-                if item in EXCLUDED_REPO_ITEMS:
-                    continue
-                item_path = os.path.join(repo_path, item)
-                item_type = determine_item_type(item_path)
-
-                item_sources.setdefault(item, set()).add(repo_scope)
-                repo_items.append({
-                    "item_name_rp": item,
-                    "item_type_rp": item_type,
-                    "repo_scope_rp": repo_scope,
-                    "unique_id_rp": get_next_unique_id(),
-                })
+    item_sources = {}
+    for scope_df in scope_dfs:
+        for item, repo_scope in zip(scope_df["item_name_rp"], scope_df["repo_scope_rp"]):
+            item_sources.setdefault(item, set()).add(repo_scope)
 
     collisions = {
         item_name: sorted(list(scopes))
@@ -55,74 +83,63 @@ def load_rp_dataframe():
             lines.append(f"- {item_name}: {', '.join(collisions[item_name])}")
         raise ValueError("\n".join(lines))
 
-    df = pd.DataFrame(
-        repo_items,
-        columns=["item_name_rp", "item_type_rp", "repo_scope_rp", "unique_id_rp"],
-    ).copy()
-
-    # Explicitly set data types.
-    df["item_name_rp"] = df["item_name_rp"].astype(f_types_vals["item_name_rp"]['dtype'])
-    df["item_type_rp"] = df["item_type_rp"].astype(f_types_vals["item_type_rp"]['dtype'])
-    df["repo_scope_rp"] = df["repo_scope_rp"].astype(f_types_vals["repo_scope_rp"]['dtype'])
+    if scope_dfs:
+        # Empty scope frames are skipped so they do not take part in dtype resolution.
+        df = pd.concat([scope_df for scope_df in scope_dfs if len(scope_df)] or scope_dfs[:1], ignore_index=True)
+        # Each scope frame has its own single-value repo_scope categories; concat falls back to object.
+        df["repo_scope_rp"] = astype_f_type(df["repo_scope_rp"], "repo_scope_rp")
+    else:
+        df = build_repo_scope_frame([], [], None)
+        df["git_rp"] = pd.Series(dtype=f_types_vals["git_rp"]['dtype'])
+
+    # Assign unique IDs in registry/directory order (the ID counter is not thread-safe).
+    df.insert(3, "unique_id_rp", [get_next_unique_id() for _ in range(len(df))])
     df["unique_id_rp"] = df["unique_id_rp"].astype(f_types_vals["unique_id_rp"]['dtype'])
 
-    # Create the git_rp column based on each repo's .gitignore.
-    df = create_git_rp_column(df, repo_scope_paths)
-
     # Input dataframe display toggle
     show_output = False
     show_full_df = False
 
     return df
 
-def create_git_rp_column(df, repo_scope_paths):
-    # Retrieve .gitignore patterns per repo scope.
-    gitignore_items_by_scope = {}
-    for repo_scope, repo_path in repo_scope_paths.items():
-        gitignore_items_by_scope[repo_scope] = read_gitignore_items(repo_path)
 
-    # Iterate through every item in the DataFrame and compare against scope-specific .gitignore items.
-    for idx, row in df.iterrows():
-        item_name = row['item_name_rp']
-        item_type = row['item_type_rp']
-        repo_scope = row.get('repo_scope_rp')
+def scan_repo_scope(repo_scope, repo_path):
+    """Scan one repo root and evaluate its .gitignore (runs in a worker thread)."""
+    dot_items = cached_scan_dot_entries(repo_path, EXCLUDED_REPO_ITEMS)
+    df = build_repo_scope_frame(dot_items["item_name"], dot_items["item_type"], repo_scope)
 
-        # Initialize the git_rp column with True (assuming it's tracked).
-        df.at[idx, 'git_rp'] = True
+    # Create the git_rp column based on this repo's .gitignore.
+    return create_git_rp_column(df, {repo_scope: repo_path})
 
-        # Compare with the corresponding scope's .gitignore patterns.
-        gitignore_items = gitignore_items_by_scope.get(repo_scope, {})
-        for pattern, pattern_type in gitignore_items.items():
-            # Use fnmatch to compare names and types.
-            if fnmatch.fnmatch(item_name, pattern) and item_type == pattern_type:
-                df.at[idx, 'git_rp'] = False
-                break
 
-    df['git_rp'] = df['git_rp'].astype(f_types_vals["git_rp"]['dtype'])
+def build_repo_scope_frame(item_names, item_types, repo_scope):
+    df = pd.DataFrame({
+        "item_name_rp": item_names,
+        "item_type_rp": item_types,
+        "repo_scope_rp": [repo_scope] * len(item_names),
+    })
 
+    # Explicitly set data types.
+    df["item_name_rp"] = df["item_name_rp"].astype(f_types_vals["item_name_rp"]['dtype'])
+    df["item_type_rp"] = astype_f_type(df["item_type_rp"], "item_type_rp")
+    df["repo_scope_rp"] = astype_f_type(df["repo_scope_rp"], "repo_scope_rp")
     return df
 
+def create_git_rp_column(df, repo_scope_paths):
+    # Initialize the git_rp column with True (assuming it's tracked).
+    df['git_rp'] = True
 
-def read_gitignore_items(repo_path):
-    gitignore_path = os.path.join(repo_path, ".gitignore")
-    if not os.path.exists(gitignore_path):
-        return {}
-
-    gitignore_items = {}
-
-    with open(gitignore_path, 'r') as f:
-        for line in f:
-            pattern = line.strip()
-            if not pattern or pattern.startswith('#'):
-                continue
-
-            # Remove leading and trailing slashes for comparison purposes
-            pattern_cleaned = pattern.lstrip('/').rstrip('/')
+    # Compile each scope's .gitignore once and evaluate all of that scope's items in one call.
+    for repo_scope, repo_path in repo_scope_paths.items():
+        matcher = load_gitignore_matcher(repo_path)
+        if not matcher.rules:
+            continue
 
-            # Determine type based on whether it had a trailing slash originally
-            item_type = 'folder' if pattern.endswith('/') else 'file'
+        in_scope = df['repo_scope_rp'] == repo_scope
+        scope_items = df.loc[in_scope, 'item_name_rp']
+        is_dir = df.loc[in_scope, 'item_type_rp'] == 'folder'  # Symlinks are not directories to git
+        df.loc[in_scope, 'git_rp'] = ~matcher.match_series(scope_items, is_dir)
 
-            # Store the cleaned pattern and its type
-            gitignore_items[pattern_cleaned] = item_type
+    df['git_rp'] = df['git_rp'].astype(f_types_vals["git_rp"]['dtype'])
 
-    return gitignore_items
+    return df
@@ -3,30 +3,49 @@ import logging
 import pandas as pd
 
 from db1_main_df.db14_merge_sup import get_next_unique_id
-from .db05_get_filetype import determine_item_type
-from db5_global.db52_dtype_dict import f_types_vals
-
-def load_hm_dataframe():
-    dot_items = []
+from .db08_scan_cache import cached_scan_dot_entries
+from .db02_load_db import get_dotbot_target_trie
+from .db11_path_trie import scan_trie_entries
+from .db12_symlink_resolver import SymlinkResolver
+from db5_global.db52_dtype_dict import f_types_vals, astype_f_type
+from db5_global.db54_trace import traced_stage
+
+@traced_stage('load_hm_dataframe')
+def load_hm_dataframe(dotbot_df=None):
+    """
+    Root-level dot items of $HOME, plus the nested Dotbot destinations of dotbot_df.
+
+    Args:
+        dotbot_df (pd.DataFrame, optional): The loaded Dotbot frame; its nested
+            destinations (e.g. .config/nvim) are scanned too. Passed in rather
+            than re-parsed so each config is read once per run. Without it only
+            root-level items are listed.
+    """
     home_dir_path = os.path.expanduser("~")  # Define the home directory path
 
-    for item in os.listdir(home_dir_path):
-        if item.startswith("."):
-            item_path = os.path.join(home_dir_path, item)
-            item_type = determine_item_type(item_path)
-            item_name_hm = item  # Define item_name_hm based on the item name
+    # One resolver for both scans: links into the same repo share its resolved parent directories
+    resolver = SymlinkResolver()
+
+    # Single scandir pass (or unchanged snapshot) returns column arrays
+    dot_items = cached_scan_dot_entries(home_dir_path, resolver=resolver)
 
-            dot_items.append({
-                "item_name_hm": item, 
-                "item_type_hm": item_type, 
-                "unique_id_hm": get_next_unique_id()
-            })
+    # Nested Dotbot targets (e.g. .config/nvim): descend only into directories leading to them
+    if dotbot_df is not None:
+        nested_items = scan_trie_entries(home_dir_path, get_dotbot_target_trie(dotbot_df), resolver)
+        dot_items = {
+            "item_name": dot_items["item_name"] + nested_items["item_name"],
+            "item_type": dot_items["item_type"] + nested_items["item_type"],
+        }
 
-    df = pd.DataFrame(dot_items).copy()
+    df = pd.DataFrame({
+        "item_name_hm": dot_items["item_name"],
+        "item_type_hm": dot_items["item_type"],
+        "unique_id_hm": [get_next_unique_id() for _ in dot_items["item_name"]],
+    })
 
     # Explicitly set data types using the 'dtype' value from the f_types_vals dictionary
     df["item_name_hm"] = df["item_name_hm"].astype(f_types_vals["item_name_hm"]['dtype'])
-    df["item_type_hm"] = df["item_type_hm"].astype(f_types_vals["item_type_hm"]['dtype'])
+    df["item_type_hm"] = astype_f_type(df["item_type_hm"], "item_type_hm")
     df["unique_id_hm"] = df["unique_id_hm"].astype(f_types_vals["unique_id_hm"]['dtype'])
 
     # Input dataframe display toggle
@@ -1,7 +1,21 @@
 import os
+import logging
 import pandas as pd
+
+from concurrent.futures import ThreadPoolExecutor
 from db1_main_df.db14_merge_sup import get_next_unique_id
-from db5_global.db52_dtype_dict import f_types_vals
+from .db00_load_rp import get_repo_scope_paths
+from .db09_dotbot_conf import (
+    eval_if_enabled,
+    evaluate_link_condition,
+    find_dotbot_config,
+    load_dotbot_config_links,
+)
+from .db11_path_trie import PathTrie
+from db5_global.db52_dtype_dict import f_types_vals, astype_f_type
+from db5_global.db54_trace import traced_stage
+
+DOTBOT_PARSE_MAX_WORKERS = 8
 
 
 def infer_repo_scope_from_source(src_path_token):
@@ -13,58 +27,119 @@ def infer_repo_scope_from_source(src_path_token):
     return "local"
 
 
+def get_source_repo_root(source_path, repo_scope_paths):
+    """(repo scope, repo root) of the deepest registered root containing the source, or (None, None)."""
+    best_scope, best_root = None, None
+    for repo_scope, repo_path in repo_scope_paths.items():
+        repo_root = os.path.abspath(repo_path)
+        if (source_path == repo_root or source_path.startswith(repo_root + os.sep)) and len(repo_root) > len(best_root or ""):
+            best_scope, best_root = repo_scope, repo_root
+    return best_scope, best_root
+
+
+def get_source_repo_scope(source_path, repo_scope_paths):
+    """Repo scope whose root contains the source (deepest root wins); falls back to path inference."""
+    repo_scope, _repo_root = get_source_repo_root(source_path, repo_scope_paths)
+    return repo_scope or infer_repo_scope_from_source(source_path)
+
+
+def get_relative_item_name(path, root):
+    """Path relative to root ('.zshrc' at the top level, '.config/nvim' when nested); basename outside root."""
+    if root and path.startswith(root + os.sep):
+        return os.path.relpath(path, root)
+    return os.path.basename(path)
+
+
+def load_dotbot_config_link_sets(repo_scope_paths):
+    """(config paths, parsed links per config) for every repo scope, parsed concurrently in registry order."""
+    config_paths = find_dotbot_configs(repo_scope_paths)
+    config_links = []
+    if config_paths:
+        max_workers = min(DOTBOT_PARSE_MAX_WORKERS, len(config_paths))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            config_links = list(executor.map(load_dotbot_config_links, config_paths))
+    return config_paths, config_links
+
+
+def get_dotbot_target_trie(dotbot_df):
+    """PathTrie of the nested Dotbot destinations under $HOME, from the loaded Dotbot frame's home names."""
+    return PathTrie(item_name for item_name in dotbot_df['item_name_hm_db'].dropna() if os.sep in item_name)
+
+
+def find_dotbot_configs(repo_scope_paths=None):
+    """Install configs of every repo scope that has one, in registry order."""
+    if repo_scope_paths is None:
+        repo_scope_paths = get_repo_scope_paths()
+    config_paths = []
+    for repo_path in repo_scope_paths.values():
+        config_path = find_dotbot_config(repo_path) if os.path.isdir(repo_path) else None
+        if config_path and config_path not in config_paths:
+            config_paths.append(config_path)
+    return config_paths
+
+
+@traced_stage('load_dotbot_yaml_dataframe')
 def load_dotbot_yaml_dataframe():
-    dotbot_yaml_path = os.path.join(os.path.expanduser("~"), "._dotfiles/dotfiles_srb_repo/install.conf.yaml")
+    repo_scope_paths = get_repo_scope_paths()
+    home_path = os.path.abspath(os.path.expanduser("~"))
+
+    # Parse (or load from the parse cache) every config concurrently; map() keeps registry order.
+    config_paths, config_links = load_dotbot_config_link_sets(repo_scope_paths)
+    if not config_paths:
+        logging.warning("No Dotbot install config found in any repo scope")
+
+    evaluate_conditions = eval_if_enabled()
+    condition_results = {}
+    seen_destinations = {}
     dotbot_entries = []
 
-    with open(dotbot_yaml_path, 'r') as file:
-        for line in file:
-
-            line = line.strip()
-            if line and not line.startswith('#'):  # Skip empty lines and full-line comments
-                # Split the line into destination and source paths
-                parts = line.split(':', 1)
-                if len(parts) == 2:
-                    dst, src = parts
-                    dst = dst.strip()
-                    src = src.strip()
-
-                    # Ensure src is not empty before attempting to process it
-                    if src:
-                        src_path_token = src.split()[0]
-                        # Determine the actual types for both destination and source (repo and home)
-                        item_type_home = 'folder_sym' if '# folder' in src else 'file_sym'  # Symlink in Home
-                        item_type_repo = 'folder' if item_type_home == 'folder_sym' else 'file'  # Actual type in Repo
-                        repo_scope_db = infer_repo_scope_from_source(src_path_token)
-
-                        # Extract just the file or folder name from the paths
-                        name_dst = os.path.basename(dst)
-                        name_src = os.path.basename(src_path_token)
-
-                        dotbot_entries.append({
-                            'item_name_hm_db': name_dst,  # Destination in the Home folder (symlink)
-                            'item_name_rp_db': name_src,  # Source from the Repo folder
-                            'item_type_hm_db': item_type_home,  # Type for Home (symlink)
-                            'item_type_rp_db': item_type_repo,  # Type for Repo (actual item)
-                            'repo_scope_db': repo_scope_db,
-                            'unique_id_db': get_next_unique_id(),  # Assign a unique ID
-                        })
+    for config_path, links in zip(config_paths, config_links):
+        base_dir = os.path.dirname(os.path.abspath(config_path))
+        for link in links:
+            if evaluate_conditions and link['if'] and not evaluate_link_condition(link['if'], base_dir, condition_results):
+                continue
+
+            for destination, source in link['targets']:
+                if destination in seen_destinations:
+                    logging.warning(f"Dotbot link {destination} defined in {seen_destinations[destination]} and {config_path}; keeping the first")
+                    continue
+                seen_destinations[destination] = config_path
+
+                # Declared type: the `# folder` hint, else what the source actually is
+                is_folder = (link['folder_hint'] and not link['glob']) or os.path.isdir(source)
+                item_type_home = 'folder_sym' if is_folder else 'file_sym'  # Symlink in Home
+                item_type_repo = 'folder' if is_folder else 'file'  # Actual type in Repo
+
+                # Names are full paths relative to $HOME / the repo root, so nested items match exactly
+                repo_scope, repo_root = get_source_repo_root(source, repo_scope_paths)
+                item_name_hm_db = get_relative_item_name(destination, home_path)
+                item_name_rp_db = get_relative_item_name(source, repo_root)
+
+                dotbot_entries.append({
+                    'item_name_hm_db': item_name_hm_db,  # Destination in the Home folder (symlink)
+                    'item_name_rp_db': item_name_rp_db,  # Source from the Repo folder
+                    'item_type_hm_db': item_type_home,  # Type for Home (symlink)
+                    'item_type_rp_db': item_type_repo,  # Type for Repo (actual item)
+                    'repo_scope_db': repo_scope or infer_repo_scope_from_source(source),
+                    'unique_id_db': get_next_unique_id(),  # Assign a unique ID
+                    # Merge on the repo item when both ends are top-level (the repo scan only lists
+                    # those), otherwise on the home path; df_merge_sequence() keys a top-level repo
+                    # item linked to a nested destination on that path too
+                    'item_name_db_m_key': (item_name_rp_db if repo_root and os.sep not in item_name_rp_db
+                                           and os.sep not in item_name_hm_db else item_name_hm_db),
+                })
 
     # Create the DataFrame with both home and repo item names and types
     dotbot_yaml_df = pd.DataFrame(dotbot_entries, columns=[
-        'item_name_hm_db', 'item_name_rp_db', 'item_type_hm_db', 'item_type_rp_db', 'repo_scope_db', 'unique_id_db']).copy()
-
-    # Add the new merge key column
-    dotbot_yaml_df['item_name_db_m_key'] = dotbot_yaml_df.apply(
-        lambda row: row['item_name_rp_db'] if pd.notna(row['item_name_rp_db']) and row['item_name_rp_db'] else row['item_name_hm_db'], axis=1
-    )
+        'item_name_hm_db', 'item_name_rp_db', 'item_type_hm_db', 'item_type_rp_db', 'repo_scope_db', 'unique_id_db',
+        'item_name_db_m_key'])
 
     # Explicitly set data types using the f_types_vals dictionary
     dotbot_yaml_df["item_name_hm_db"] = dotbot_yaml_df["item_name_hm_db"].astype(f_types_vals["item_name_hm_db"]['dtype'])
     dotbot_yaml_df["item_name_rp_db"] = dotbot_yaml_df["item_name_rp_db"].astype(f_types_vals["item_name_rp_db"]['dtype'])
-    dotbot_yaml_df["item_type_hm_db"] = dotbot_yaml_df["item_type_hm_db"].astype(f_types_vals["item_type_hm_db"]['dtype'])
-    dotbot_yaml_df["item_type_rp_db"] = dotbot_yaml_df["item_type_rp_db"].astype(f_types_vals["item_type_rp_db"]['dtype'])
-    dotbot_yaml_df["repo_scope_db"] = dotbot_yaml_df["repo_scope_db"].astype(f_types_vals["repo_scope_db"]['dtype'])
+    dotbot_yaml_df["item_type_hm_db"] = astype_f_type(dotbot_yaml_df["item_type_hm_db"], "item_type_hm_db")
+    dotbot_yaml_df["item_type_rp_db"] = astype_f_type(dotbot_yaml_df["item_type_rp_db"], "item_type_rp_db")
+    dotbot_yaml_df["repo_scope_db"] = astype_f_type(dotbot_yaml_df["repo_scope_db"], "repo_scope_db")
     dotbot_yaml_df["unique_id_db"] = dotbot_yaml_df["unique_id_db"].astype(f_types_vals["unique_id_db"]['dtype'])
     dotbot_yaml_df["item_name_db_m_key"] = dotbot_yaml_df["item_name_db_m_key"].astype(f_types_vals["item_name_rp_db"]['dtype'])
 
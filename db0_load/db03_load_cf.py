@@ -1,7 +1,19 @@
+import os
 import logging
+import numpy as np
 import pandas as pd
 from db1_main_df.db14_merge_sup import get_next_unique_id
-from db5_global.db52_dtype_dict import f_types_vals
+from db5_global.db52_dtype_dict import (
+    f_types_vals,
+    astype_f_type,
+    get_read_dtype,
+    get_unknown_category_mask,
+    get_unknown_category_fallback,
+)
+from db5_global.db54_trace import traced_stage
+from db5_global.db58_settings import CONFIG_CSV_PATH
+
+CONFIG_CATEGORY_COLUMNS = ["dot_struc_cf", "item_type_rp_cf", "item_type_hm_cf"]
 
 def correct_and_validate_user_config_df(user_config_df):
     # Correct values: Replace NaN with empty strings in 'comment_cf' field
@@ -9,6 +21,30 @@ def correct_and_validate_user_config_df(user_config_df):
     return user_config_df
 
 
+def coerce_config_categories(user_config_df, user_config_file_path=CONFIG_CSV_PATH):
+    """
+    Replace hand-edited values outside the fixed category sets, warning once per cell.
+
+    Item types become 'unknown' and dot_struc_cf becomes missing, so one typo
+    (e.g. item_type_hm_cf=file_link) flags that row instead of failing the load.
+    """
+    for column in CONFIG_CATEGORY_COLUMNS:
+        unknown = get_unknown_category_mask(user_config_df[column], column)
+        if not unknown.any():
+            continue
+        fallback = get_unknown_category_fallback(column)
+        categories = ', '.join(f_types_vals[column]['dtype'].categories)
+        for position in np.flatnonzero(unknown):
+            row = user_config_df.iloc[position]
+            item_name = row['item_name_hm_cf'] if pd.notna(row['item_name_hm_cf']) else row['item_name_rp_cf']
+            logging.warning(
+                f"{user_config_file_path} row {position + 1} ({item_name}): unexpected {column} value "
+                f"{row[column]!r} (expected one of: {categories}); using {fallback if fallback is not pd.NA else 'no value'}"
+            )
+        user_config_df.loc[unknown, column] = fallback
+    return user_config_df
+
+
 def infer_repo_scope_from_dot_struc(dot_struc_val):
     """Backfill repo scope when older config files do not include repo_scope_cf."""
     if pd.isna(dot_struc_val):
@@ -19,23 +55,26 @@ def infer_repo_scope_from_dot_struc(dot_struc_val):
         return "local"
     return "local"
 
-def load_cf_dataframe():
+@traced_stage('load_cf_dataframe')
+def load_cf_dataframe(user_config_file_path=CONFIG_CSV_PATH):
     try:
-        user_config_file_path = "./data/dotrep_config.csv"
-        
         # Load the CSV with explicit data types for the columns using the 'dtype' value from f_types_vals
+        # (fixed-category columns are parsed as string and validated below)
         user_config_df = pd.read_csv(user_config_file_path, dtype={
             "item_name_rp_cf": f_types_vals["item_name_rp_cf"]['dtype'],
             "item_name_hm_cf": f_types_vals["item_name_hm_cf"]['dtype'],
-            "dot_struc_cf": f_types_vals["dot_struc_cf"]['dtype'],
-            "item_type_rp_cf": f_types_vals["item_type_rp_cf"]['dtype'],
-            "item_type_hm_cf": f_types_vals["item_type_hm_cf"]['dtype'],
+            "dot_struc_cf": get_read_dtype("dot_struc_cf"),
+            "item_type_rp_cf": get_read_dtype("item_type_rp_cf"),
+            "item_type_hm_cf": get_read_dtype("item_type_hm_cf"),
             "cat_1_cf": f_types_vals["cat_1_cf"]['dtype'],
             "cat_1_name_cf": f_types_vals["cat_1_name_cf"]['dtype'],
             "cat_2_cf": f_types_vals["cat_2_cf"]['dtype'],
             "comment_cf": f_types_vals["comment_cf"]['dtype'],
             "no_show_cf": f_types_vals["no_show_cf"]['dtype']
         }).copy()
+        user_config_df = coerce_config_categories(user_config_df, user_config_file_path)
+        for column in CONFIG_CATEGORY_COLUMNS:
+            user_config_df[column] = astype_f_type(user_config_df[column], column)
 
         # Backward-compatible repo scope support:
         # - If column is missing, infer from dot_struc_cf.
@@ -52,9 +91,7 @@ def load_cf_dataframe():
             user_config_df["repo_scope_cf"] = user_config_df["repo_scope_cf"].fillna(
                 user_config_df["dot_struc_cf"].apply(infer_repo_scope_from_dot_struc)
             )
-        user_config_df["repo_scope_cf"] = user_config_df["repo_scope_cf"].astype(
-            f_types_vals["repo_scope_cf"]['dtype']
-        )
+        user_config_df["repo_scope_cf"] = astype_f_type(user_config_df["repo_scope_cf"], "repo_scope_cf")
 
         # Record the original order of rows
         user_config_df['sort_orig'] = (user_config_df.index + 1).astype(f_types_vals["sort_orig"]['dtype'])  # Convert to Int64 explicitly
@@ -66,9 +103,11 @@ def load_cf_dataframe():
         # Apply the correction and validation function
         user_config_df = correct_and_validate_user_config_df(user_config_df)
 
-        # Add the new merge key column
+        # Add the new merge key column: the repo name, or the home path for a nested
+        # destination (Dotbot rows key those on their home path too)
         user_config_df['item_name_cf_m_key'] = user_config_df.apply(
-            lambda row: row['item_name_rp_cf'] if pd.notna(row['item_name_rp_cf']) and row['item_name_rp_cf'] != "none" else row['item_name_hm_cf'], axis=1
+            lambda row: row['item_name_rp_cf'] if pd.notna(row['item_name_rp_cf']) and row['item_name_rp_cf'] != "none"
+            and not (pd.notna(row['item_name_hm_cf']) and os.sep in row['item_name_hm_cf']) else row['item_name_hm_cf'], axis=1
         )
 
         user_config_df["item_name_cf_m_key"] = user_config_df["item_name_cf_m_key"].astype(f_types_vals["item_name_rp_cf"]['dtype'])
@@ -85,5 +124,6 @@ def load_cf_dataframe():
 
         return user_config_df
     except Exception as e:
-        logging.error(f"Error loading user_config CSV: {e}")
-        return pd.DataFrame()
+        # An empty frame would only fail later inside the merge, far from the cause
+        logging.error(f"Error loading user_config CSV {user_config_file_path}: {e}")
+        raise
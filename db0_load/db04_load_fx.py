@@ -1,8 +1,9 @@
 import os
 import pandas as pd
+from db5_global.db54_trace import traced_stage
+from db5_global.db58_settings import FIXTURE_CSV_PATH, TRUE_VALUES
 
 
-FIXTURE_CSV_PATH = "./data/test_fixtures.csv"
 FIXTURE_COLUMNS = [
     "fixture_id",
     "item_name",
@@ -15,6 +16,7 @@ FIXTURE_COLUMNS = [
     "notes",
 ]
 BOOL_COLUMNS = {"enabled", "suppress_unmatched", "suppress_alert"}
+SUPPRESS_COLUMNS = ["suppress_unmatched", "suppress_alert"]
 
 
 def parse_bool(value):
@@ -22,12 +24,52 @@ def parse_bool(value):
         return False
     if isinstance(value, bool):
         return value
-    return str(value).strip().lower() in {"1", "true", "t", "yes", "y", "on"}
+    return str(value).strip().lower() in TRUE_VALUES
 
 
+class FixtureIndex:
+    """
+    Parsed fixture catalog plus the lookups the report build needs, computed once.
+
+    - df: the fixture rows (bool columns parsed, text columns stripped)
+    - enabled_names: item names of enabled fixtures
+    - flags: item name -> {'suppress_unmatched', 'suppress_alert'}, OR-ed over its enabled rows
+    - suppress_alert_names: enabled items whose alerts are suppressed
+    - records: display rows for the markdown fixture section (missing text as '')
+    """
+
+    def __init__(self, df):
+        self.df = df
+
+        item_names = df["item_name"].astype("string")
+        named = (item_names.notna() & (item_names != "")).to_numpy(dtype=bool)
+        enabled_df = df.loc[named & df["enabled"].to_numpy(dtype=bool)]
+
+        self.enabled_names = frozenset(enabled_df["item_name"])
+        self.flags = (
+            enabled_df.groupby("item_name", sort=False)[SUPPRESS_COLUMNS].any().to_dict(orient="index")
+            if len(enabled_df) else {}
+        )
+        self.suppress_alert_names = frozenset(
+            item_name for item_name, flags in self.flags.items() if flags["suppress_alert"]
+        )
+
+        text_columns = [col for col in FIXTURE_COLUMNS if col not in BOOL_COLUMNS]
+        self.records = df.astype({col: "string" for col in text_columns}).fillna(
+            {col: "" for col in text_columns}
+        ).to_dict(orient="records")
+
+    def __len__(self):
+        return len(self.df)
+
+
+@traced_stage('load_fx_dataframe')
 def load_fx_dataframe(path=FIXTURE_CSV_PATH):
+    """Load data/test_fixtures.csv and return its FixtureIndex (empty when the file is missing)."""
     if not os.path.exists(path):
-        return pd.DataFrame(columns=FIXTURE_COLUMNS)
+        return FixtureIndex(pd.DataFrame({
+            col: pd.Series(dtype="bool" if col in BOOL_COLUMNS else "string") for col in FIXTURE_COLUMNS
+        }))
 
     df = pd.read_csv(path, dtype="string").copy()
 
@@ -38,8 +80,8 @@ def load_fx_dataframe(path=FIXTURE_CSV_PATH):
 
     for col in FIXTURE_COLUMNS:
         if col in BOOL_COLUMNS:
-            df[col] = df[col].apply(parse_bool)
+            df[col] = df[col].apply(parse_bool).astype("bool")
         else:
             df[col] = df[col].astype("string").str.strip()
 
-    return df
+    return FixtureIndex(df)
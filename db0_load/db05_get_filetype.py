@@ -1,15 +1,15 @@
 import os
-
-import subprocess
-import plistlib
 import stat
 
-def determine_item_type(item_path):
+from .db12_symlink_resolver import SymlinkResolver, get_link_item_type
+
+def determine_item_type(item_path, resolver=None):
     """
     Determine the type of a given file system item.
 
     Args:
         item_path (str): The full path to the item.
+        resolver (SymlinkResolver): Shared resolver for symlink targets (optional).
 
     Returns:
         str: A string representing the item type. Possible values:
@@ -22,13 +22,8 @@ def determine_item_type(item_path):
     """
     if os.path.islink(item_path):
         # It's a symlink, determine the type it points to
-        target_path = os.path.realpath(item_path)
-        if os.path.isdir(target_path):
-            return "folder_sym"
-        elif os.path.isfile(target_path):
-            return "file_sym"
-        else:
-            return "unknown"
+        resolver = resolver or SymlinkResolver()
+        return get_link_item_type(resolver.resolve_links([item_path])[item_path])
 
     elif os.path.isdir(item_path):
         return "folder"
@@ -49,6 +44,7 @@ def is_symlink(path):
 def is_alias(path):
     """Determine if the given path is an alias on macOS."""
     # Use a subprocess call to check for alias attributes using macOS specific command
+    import subprocess
     try:
         result = subprocess.run(['xattr', '-p', 'com.apple.FinderInfo', path],
                                 stdout=subprocess.PIPE, stderr=subprocess.PIPE)
@@ -83,6 +79,7 @@ def resolve_item_type(path):
 def detect_alias_type(path):
     """Detect the target type of an alias."""
     # Assuming the alias points to either a file or folder, we use the same logic to determine target type
+    import subprocess
     target = subprocess.run(['readlink', path], stdout=subprocess.PIPE).stdout.decode().strip()
     if os.path.isfile(target):
         return 'file'
@@ -91,12 +88,8 @@ def detect_alias_type(path):
     else:
         return 'unknown'
 
-def detect_symlink_target_type(path):
-    """Detect the target type of a symlink."""
-    target = os.readlink(path)
-    if os.path.isfile(target):
-        return 'file'
-    elif os.path.isdir(target):
-        return 'folder'
-    else:
-        return 'unknown'
\ No newline at end of file
+def detect_symlink_target_type(path, resolver=None):
+    """Detect the target type of a symlink (relative targets resolve from the link's directory)."""
+    resolver = resolver or SymlinkResolver()
+    target_kind = resolver.resolve_links([path])[path].target_kind
+    return target_kind if target_kind in ('file', 'folder') else 'unknown'
\ No newline at end of file
@@ -0,0 +1,101 @@
+import os
+import stat
+
+from .db12_symlink_resolver import resolve_link_item_types
+
+
+def determine_entry_type(entry):
+    """
+    Determine the item type of an os.DirEntry with as few syscalls as possible.
+
+    Mirrors determine_item_type(), but reuses the DirEntry d_type and its cached
+    lstat result. Only symlinks cost an extra stat() call (to classify the target);
+    scans classify their symlinks in one batch with get_entry_types() instead.
+
+    Args:
+        entry (os.DirEntry): The directory entry from os.scandir().
+
+    Returns:
+        str: "file", "folder", "file_sym", "folder_sym", "alias" or "unknown".
+    """
+    try:
+        if entry.is_symlink():
+            # It's a symlink, determine the type it points to
+            try:
+                target_mode = os.stat(entry.path).st_mode
+            except OSError:
+                return "unknown"  # Dangling link or symlink loop
+            if stat.S_ISDIR(target_mode):
+                return "folder_sym"
+            elif stat.S_ISREG(target_mode):
+                return "file_sym"
+            return "unknown"
+
+        if entry.is_dir(follow_symlinks=False):
+            return "folder"
+
+        if entry.is_file(follow_symlinks=False):
+            # Determine if it's an alias on macOS
+            if entry.name.endswith('.alias'):
+                return "alias"
+            return "file"
+    except OSError:
+        pass
+
+    return "unknown"
+
+
+def entry_is_symlink(entry):
+    try:
+        return entry.is_symlink()
+    except OSError:
+        return False  # determine_entry_type() reports it as "unknown"
+
+
+def get_entry_types(entries, resolver=None):
+    """
+    Item types of a batch of os.DirEntry objects.
+
+    Symlinks are not stat()ed one by one: their targets are resolved in a
+    single SymlinkResolver call, which shares resolved parent directories.
+    """
+    item_types = []
+    link_positions = {}
+    for entry in entries:
+        if entry_is_symlink(entry):
+            link_positions[len(item_types)] = entry.path
+            item_types.append(None)
+        else:
+            item_types.append(determine_entry_type(entry))
+
+    if link_positions:
+        link_types = resolve_link_item_types(list(link_positions.values()), resolver)
+        for position, link_type in zip(link_positions, link_types):
+            item_types[position] = link_type
+    return item_types
+
+
+def scan_dot_entries(root_path, excluded_names=(), resolver=None):
+    """
+    Scan the top level of root_path for dot items in a single directory pass.
+
+    Args:
+        root_path (str): Directory to scan.
+        excluded_names (Iterable[str]): Entry names to skip.
+        resolver (SymlinkResolver): Shared resolver for symlink targets (optional).
+
+    Returns:
+        dict: Column arrays {"item_name": [...], "item_type": [...]} in directory
+        order, plus "link_name": the names that are symlinks.
+    """
+    with os.scandir(root_path) as it:
+        entries = [
+            entry for entry in it
+            if entry.name.startswith(".") and entry.name not in excluded_names
+        ]
+
+    return {
+        "item_name": [entry.name for entry in entries],
+        "item_type": get_entry_types(entries, resolver),
+        "link_name": [entry.name for entry in entries if entry_is_symlink(entry)],
+    }
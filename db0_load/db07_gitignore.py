@@ -0,0 +1,153 @@
+import os
+import re
+from collections import namedtuple
+
+import pandas as pd
+
+# One parsed .gitignore line: regex source, '!' negation, trailing-'/' directory-only flag
+GitignoreRule = namedtuple("GitignoreRule", ["pattern", "regex", "negate", "dir_only"])
+
+
+def translate_gitignore_glob(pattern):
+    """Translate a gitignore glob (without leading '!' or trailing '/') to a regex source."""
+    regex = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == '*':
+            j = i
+            while j < n and pattern[j] == '*':
+                j += 1
+            at_segment_start = i == 0 or pattern[i - 1] == '/'
+            at_segment_end = j == n or pattern[j] == '/'
+            if j - i == 2 and at_segment_start and at_segment_end:
+                if j == n:
+                    regex.append('.*')  # Trailing '**' matches everything inside
+                else:
+                    regex.append('(?:.*/)?')  # '**/' matches zero or more directories
+                    j += 1
+            else:
+                regex.append('[^/]*')
+            i = j
+            continue
+        if c == '?':
+            regex.append('[^/]')
+        elif c == '[':
+            j = i + 1
+            if j < n and pattern[j] in '!^':
+                j += 1
+            if j < n and pattern[j] == ']':
+                j += 1
+            while j < n and pattern[j] != ']':
+                j += 1
+            if j >= n:
+                regex.append('\\[')  # Unterminated class is a literal '['
+            else:
+                char_class = pattern[i + 1:j].replace('\\', '\\\\')
+                if char_class[0] in '!^':
+                    char_class = '^' + char_class[1:]
+                regex.append(f'[{char_class}]')
+                i = j
+        elif c == '\\' and i + 1 < n:
+            regex.append(re.escape(pattern[i + 1]))
+            i += 1
+        else:
+            regex.append(re.escape(c))
+        i += 1
+    return ''.join(regex)
+
+
+def parse_gitignore_line(line):
+    """Parse one .gitignore line into a GitignoreRule, or None for blanks and comments."""
+    pattern = line.rstrip('\r\n')
+    if not pattern or pattern.startswith('#'):
+        return None
+
+    # Trailing spaces are ignored unless escaped with a backslash
+    while pattern.endswith(' ') and not pattern.endswith('\\ '):
+        pattern = pattern[:-1]
+
+    negate = pattern.startswith('!')
+    if negate:
+        pattern = pattern[1:]
+
+    dir_only = pattern.endswith('/')
+    if dir_only:
+        pattern = pattern[:-1]
+    if not pattern:
+        return None
+
+    # A slash at the beginning or in the middle anchors the pattern to the repo root
+    anchored = '/' in pattern
+    regex = translate_gitignore_glob(pattern.lstrip('/'))
+    if not anchored:
+        regex = '(?:.*/)?' + regex
+
+    return GitignoreRule(pattern=line.strip(), regex=regex, negate=negate, dir_only=dir_only)
+
+
+class GitignoreMatcher:
+    """
+    All rules of one .gitignore compiled into a single regex (one per item kind).
+
+    Alternatives are ordered last-rule-first, so the first alternative that
+    matches is the rule git would apply (the last matching line wins).
+    """
+
+    def __init__(self, rules):
+        self.rules = list(rules)
+        self._dir_regex = self._compile(include_dir_only=True)
+        self._file_regex = self._compile(include_dir_only=False)
+
+    def _compile(self, include_dir_only):
+        alternatives = [
+            f"(?P<r{idx}>{rule.regex})"
+            for idx, rule in reversed(list(enumerate(self.rules)))
+            if include_dir_only or not rule.dir_only
+        ]
+        if not alternatives:
+            return None
+        return re.compile('|'.join(alternatives), re.DOTALL)
+
+    def match_rule(self, path, is_dir=False):
+        """Return the GitignoreRule deciding path, or None if no rule matches."""
+        regex = self._dir_regex if is_dir else self._file_regex
+        if regex is None:
+            return None
+        match = regex.fullmatch(path)
+        if match is None:
+            return None
+        return self.rules[int(match.lastgroup[1:])]
+
+    def is_ignored(self, path, is_dir=False):
+        """Return True if the repo-relative path is ignored."""
+        parts = path.strip('/').split('/')
+
+        # Git cannot re-include a path whose parent directory is excluded
+        for depth in range(1, len(parts)):
+            rule = self.match_rule('/'.join(parts[:depth]), is_dir=True)
+            if rule is not None and not rule.negate:
+                return True
+
+        rule = self.match_rule('/'.join(parts), is_dir=is_dir)
+        return rule is not None and not rule.negate
+
+    def match_series(self, paths, is_dir):
+        """Evaluate a whole Series of paths; is_dir is a boolean Series aligned with paths."""
+        ignored = [
+            False if pd.isna(path) else self.is_ignored(path, bool(path_is_dir))
+            for path, path_is_dir in zip(paths, is_dir)
+        ]
+        return pd.Series(ignored, index=paths.index, dtype=bool)
+
+
+def load_gitignore_matcher(repo_path):
+    """Compile the .gitignore at the root of repo_path (an empty matcher if there is none)."""
+    gitignore_path = os.path.join(repo_path, ".gitignore")
+    if not os.path.exists(gitignore_path):
+        return GitignoreMatcher([])
+
+    with open(gitignore_path, 'r') as f:
+        rules = [parse_gitignore_line(line) for line in f]
+
+    return GitignoreMatcher(rule for rule in rules if rule is not None)
@@ -0,0 +1,141 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import tempfile
+
+from .db06_scan_dir import scan_dot_entries
+from .db12_symlink_resolver import resolve_link_item_types
+
+# Snapshot cache for top-level directory scans (set DOTREP_SCAN_CACHE=0 to disable)
+SCAN_CACHE_ENV = "DOTREP_SCAN_CACHE"
+SCAN_CACHE_DIR_ENV = "DOTREP_CACHE_DIR"
+CACHE_SUBDIR = "mac-dot-report"  # Under $XDG_CACHE_HOME (default ~/.cache) unless DOTREP_CACHE_DIR is set
+SCAN_CACHE_VERSION = 2
+
+# Directories modified this recently are not cached: a change within the same
+# mtime tick would leave (st_dev, st_ino, st_mtime_ns) unchanged.
+RACY_MTIME_WINDOW_NS = 2_000_000_000
+
+
+def scan_cache_enabled():
+    return str(os.getenv(SCAN_CACHE_ENV, "1")).strip().lower() not in {"0", "false", "f", "no", "n", "off"}
+
+
+def get_default_cache_dir():
+    cache_home = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, CACHE_SUBDIR)
+
+
+def get_scan_cache_dir():
+    return os.getenv(SCAN_CACHE_DIR_ENV) or get_default_cache_dir()
+
+
+def get_directory_key(dir_stat):
+    """Identity + change key of a directory: (st_dev, st_ino, st_mtime_ns)."""
+    return [dir_stat.st_dev, dir_stat.st_ino, dir_stat.st_mtime_ns]
+
+
+def get_snapshot_path(root_path, cache_dir=None):
+    cache_dir = cache_dir or get_scan_cache_dir()
+    root_hash = hashlib.sha1(os.path.abspath(root_path).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(cache_dir, f"scan_{root_hash}.json")
+
+
+def load_scan_snapshot(snapshot_path, root_path, dir_key, excluded_names):
+    """Return cached column arrays if the snapshot matches the directory key, else None."""
+    try:
+        with open(snapshot_path, "r") as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if (
+        snapshot.get("version") != SCAN_CACHE_VERSION
+        or snapshot.get("root") != os.path.abspath(root_path)
+        or snapshot.get("key") != dir_key
+        or snapshot.get("excluded") != sorted(excluded_names)
+    ):
+        return None
+
+    return {
+        "item_name": snapshot["item_name"],
+        "item_type": snapshot["item_type"],
+        "link_name": snapshot["link_name"],
+    }
+
+
+def write_json_atomic(output_path, payload):
+    """Write payload as JSON via temp file + rename so readers never see a partial file."""
+    output_dir = os.path.dirname(output_path)
+    os.makedirs(output_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=output_dir, prefix=".cache_", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def save_scan_snapshot(snapshot_path, root_path, dir_key, excluded_names, dot_items):
+    snapshot = {
+        "version": SCAN_CACHE_VERSION,
+        "root": os.path.abspath(root_path),
+        "key": dir_key,
+        "excluded": sorted(excluded_names),
+        "item_name": dot_items["item_name"],
+        "item_type": dot_items["item_type"],
+        "link_name": dot_items["link_name"],
+    }
+    try:
+        write_json_atomic(snapshot_path, snapshot)
+    except OSError as e:
+        logging.warning(f"Could not write scan snapshot for {root_path}: {e}")
+
+
+def refresh_link_types(root_path, dot_items, resolver=None):
+    """Replace the cached item types of symlink entries with freshly resolved ones."""
+    link_names = set(dot_items["link_name"])
+    if not link_names:
+        return dot_items
+    positions = [i for i, item_name in enumerate(dot_items["item_name"]) if item_name in link_names]
+    link_types = resolve_link_item_types(
+        [os.path.join(root_path, dot_items["item_name"][i]) for i in positions], resolver
+    )
+    item_types = list(dot_items["item_type"])
+    for position, link_type in zip(positions, link_types):
+        item_types[position] = link_type
+    return {**dot_items, "item_type": item_types}
+
+
+def cached_scan_dot_entries(root_path, excluded_names=(), resolver=None):
+    """
+    scan_dot_entries() backed by an on-disk snapshot per scanned root.
+
+    The snapshot is reused while the root's (st_dev, st_ino, st_mtime_ns) is
+    unchanged; otherwise the directory is rescanned and the snapshot replaced.
+    Replacing or retargeting a symlink changes the root, but its target can
+    change type without doing so, so symlink entries are re-resolved on
+    every cache hit instead of trusting their stored type.
+    """
+    if not scan_cache_enabled():
+        return scan_dot_entries(root_path, excluded_names, resolver)
+
+    dir_key = get_directory_key(os.stat(root_path))
+    snapshot_path = get_snapshot_path(root_path)
+
+    dot_items = load_scan_snapshot(snapshot_path, root_path, dir_key, excluded_names)
+    if dot_items is not None:
+        return refresh_link_types(root_path, dot_items, resolver)
+
+    dot_items = scan_dot_entries(root_path, excluded_names, resolver)
+
+    # Re-stat after the scan: only cache if the directory did not change meanwhile and is not racy.
+    dir_key_after = get_directory_key(os.stat(root_path))
+    if dir_key_after == dir_key and time.time_ns() - dir_key[2] > RACY_MTIME_WINDOW_NS:
+        save_scan_snapshot(snapshot_path, root_path, dir_key, excluded_names, dot_items)
+
+    return dot_items
@@ -0,0 +1,264 @@
+import os
+import glob
+import json
+import time
+import hashlib
+import logging
+
+import yaml
+
+from .db08_scan_cache import (
+    RACY_MTIME_WINDOW_NS,
+    get_scan_cache_dir,
+    scan_cache_enabled,
+    write_json_atomic,
+)
+
+# Dotbot install configs: discovered per repo scope, parsed once per content hash
+DOTBOT_CONFIG_NAMES = ("install.conf.yaml", "install.conf.yml")
+DOTBOT_CACHE_VERSION = 2
+FOLDER_COMMENT = "# folder"  # Declared-type hint: `~/.x: ~/repo/.x  # folder`
+
+# `if:` conditions are shell commands. They are only run when explicitly enabled
+# (fleet mode reads other accounts' configs); otherwise every link is expected.
+EVAL_IF_ENV = "DOTREP_DOTBOT_EVAL_IF"
+
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def eval_if_enabled():
+    return str(os.getenv(EVAL_IF_ENV, "")).strip().lower() in {"1", "true", "t", "yes", "y", "on"}
+
+
+def find_dotbot_config(repo_path):
+    """Return the repo's Dotbot install config path, or None."""
+    for config_name in DOTBOT_CONFIG_NAMES:
+        config_path = os.path.join(repo_path, config_name)
+        if os.path.isfile(config_path):
+            return config_path
+    return None
+
+
+def read_folder_hints(config_text):
+    """Destinations whose line carries the `# folder` comment (comments are dropped by the YAML parser)."""
+    hints = set()
+    for line in config_text.splitlines():
+        if FOLDER_COMMENT not in line or ':' not in line:
+            continue
+        destination = line.split(':', 1)[0].strip().lstrip('-').strip().strip('\'"')
+        if destination:
+            hints.add(destination)
+    return hints
+
+
+def get_default_source(destination):
+    """Dotbot's implicit source for `~/.vimrc:` (null): the destination basename without the leading dot."""
+    basename = os.path.basename(destination.rstrip('/'))
+    return basename[1:] if basename.startswith('.') else basename
+
+
+def resolve_path(path, base_dir=None):
+    path = os.path.normpath(os.path.expandvars(os.path.expanduser(path)))
+    return os.path.join(base_dir, path) if base_dir and not os.path.isabs(path) else path
+
+
+def parse_dotbot_links(config_text, base_dir, config_path="install.conf.yaml"):
+    """
+    Parse the `link` directives of a Dotbot config.
+
+    Supports `defaults: {link: ...}`, null/string sources and the mapping form
+    with path, glob, if, relink, create, exclude and prefix. Sources are resolved
+    against the config's directory, destinations against $HOME.
+
+    Returns:
+        list[dict]: One entry per link, in file order.
+    """
+    config = yaml.load(config_text, Loader=YAML_LOADER) or []
+    if not isinstance(config, list):
+        raise ValueError(f"Dotbot config must be a list of directives: {config_path}")
+
+    folder_hints = read_folder_hints(config_text)
+    link_defaults = {}
+    links = []
+
+    for directive in config:
+        if not isinstance(directive, dict):
+            continue
+        for action, data in directive.items():
+            if action == 'defaults' and isinstance(data, dict):
+                link_defaults = data.get('link') or {}
+            if action != 'link' or not data:
+                continue
+            if not isinstance(data, dict):
+                logging.warning(f"Skipping malformed link directive in {config_path}")
+                continue
+
+            for destination, source in data.items():
+                options = dict(link_defaults)
+                if isinstance(source, dict):
+                    options.update(source)
+                    source = source.get('path')
+                if source is not None and not isinstance(source, str):
+                    logging.warning(f"Skipping link with invalid source in {config_path}: {destination}")
+                    continue
+                if source is None:
+                    source = get_default_source(destination)
+
+                exclude = options.get('exclude') or []
+                links.append({
+                    'destination': resolve_path(destination) + ('/' if destination.endswith('/') else ''),
+                    'source': resolve_path(source, base_dir),
+                    'glob': bool(options.get('glob', False)),
+                    'if': options.get('if'),
+                    'relink': bool(options.get('relink', False)),
+                    'create': bool(options.get('create', False)),
+                    'exclude': [resolve_path(pattern, base_dir) for pattern in exclude],
+                    'prefix': options.get('prefix') or '',
+                    'folder_hint': destination in folder_hints,
+                })
+
+    return links
+
+
+def get_glob_root(pattern):
+    """
+    The one directory a glob pattern lists, or None when matching walks further.
+
+    Only a pattern whose magic is confined to its last component (`dir/*.zsh`)
+    is decided by a single directory listing. With `**` or magic in a parent
+    component (`dir/*/file`), a new match inside an existing subdirectory
+    leaves every directory above it unchanged, so such patterns are not cached.
+    """
+    if '**' in pattern:
+        return None
+    parent = os.path.dirname(pattern)
+    if glob.has_magic(parent):
+        return None
+    return parent or os.curdir
+
+
+def get_glob_key(patterns):
+    """(st_dev, st_ino, st_mtime_ns) of every pattern's listed directory, or None if any cannot be cached."""
+    glob_key = []
+    for pattern in patterns:
+        glob_root = get_glob_root(pattern)
+        if glob_root is None:
+            return None
+        try:
+            dir_stat = os.stat(glob_root)
+        except OSError:
+            return None
+        if time.time_ns() - dir_stat.st_mtime_ns <= RACY_MTIME_WINDOW_NS:
+            return None
+        glob_key.append([dir_stat.st_dev, dir_stat.st_ino, dir_stat.st_mtime_ns])
+    return glob_key
+
+
+def expand_glob_link(link):
+    """Dotbot glob semantics: one match links to the destination itself, several go into it."""
+    matches = sorted(glob.glob(link['source'], recursive=True))
+    if link['exclude']:
+        excluded = set()
+        for pattern in link['exclude']:
+            excluded.update(glob.glob(pattern, recursive=True))
+        matches = [match for match in matches if match not in excluded]
+
+    if len(matches) == 1 and not link['destination'].endswith('/'):
+        return [[link['destination'].rstrip('/'), matches[0]]]
+    return [
+        [os.path.join(link['destination'], link['prefix'] + os.path.basename(match)), match]
+        for match in matches
+    ]
+
+
+def get_dotbot_cache_path(config_path, content_hash):
+    path_hash = hashlib.sha1(f"{os.path.abspath(config_path)}\0{os.path.expanduser('~')}".encode("utf-8")).hexdigest()[:16]
+    return os.path.join(get_scan_cache_dir(), f"dotbot_{path_hash}_{content_hash[:16]}.json")
+
+
+def prune_dotbot_cache(cache_path):
+    """Remove entries for earlier contents of the same config (same path prefix, other content hash)."""
+    cache_prefix = os.path.basename(cache_path).rsplit("_", 1)[0]
+    for stale_path in glob.glob(os.path.join(os.path.dirname(cache_path), f"{cache_prefix}_*.json")):
+        if stale_path != cache_path:
+            try:
+                os.unlink(stale_path)
+            except OSError:
+                pass
+
+
+def load_dotbot_cache(cache_path, content_hash):
+    try:
+        with open(cache_path, "r") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if cached.get("version") != DOTBOT_CACHE_VERSION or cached.get("content_hash") != content_hash:
+        return None
+    return cached
+
+
+def load_dotbot_config_links(config_path):
+    """
+    Parse a Dotbot config and expand its globs, backed by an on-disk cache.
+
+    The parse is keyed by the file's SHA-256 (and $HOME, which `~` expands to).
+    Each glob expansion is also cached and reused while the directories listed
+    by its source and exclude patterns keep their (st_dev, st_ino,
+    st_mtime_ns); patterns that walk deeper (`**`, or magic before the last
+    component) are always re-expanded.
+
+    Returns:
+        list[dict]: Links with a 'targets' list of [destination, source] pairs.
+    """
+    with open(config_path, "rb") as f:
+        config_bytes = f.read()
+    content_hash = hashlib.sha256(config_bytes).hexdigest()
+
+    use_cache = scan_cache_enabled()
+    cache_path = get_dotbot_cache_path(config_path, content_hash) if use_cache else None
+    cached = load_dotbot_cache(cache_path, content_hash) if use_cache else None
+
+    if cached is not None:
+        links = cached["links"]
+    else:
+        links = parse_dotbot_links(config_bytes.decode("utf-8"), os.path.dirname(os.path.abspath(config_path)), config_path)
+
+    cache_dirty = cached is None
+    for link in links:
+        if not link['glob']:
+            link['targets'] = [[link['destination'].rstrip('/'), link['source']]]
+            continue
+        # Exclude patterns change the result too, so their directories are part of the key
+        glob_key = get_glob_key([link['source'], *link['exclude']])
+        if glob_key is not None and link.get('glob_key') == glob_key:
+            continue  # Cached expansion still valid
+        link['targets'] = expand_glob_link(link)
+        cache_dirty = cache_dirty or link.get('glob_key') != glob_key
+        link['glob_key'] = glob_key
+
+    if use_cache and cache_dirty:
+        try:
+            write_json_atomic(cache_path, {
+                "version": DOTBOT_CACHE_VERSION,
+                "config_path": os.path.abspath(config_path),
+                "content_hash": content_hash,
+                "links": links,
+            })
+            prune_dotbot_cache(cache_path)
+        except OSError as e:
+            logging.warning(f"Could not write Dotbot parse cache for {config_path}: {e}")
+
+    return links
+
+
+def evaluate_link_condition(condition, base_dir, results):
+    """Run a Dotbot `if:` command (once per distinct command); exit status 0 keeps the link."""
+    if condition not in results:
+        import subprocess  # Only configs with `if:` conditions need it
+        completed = subprocess.run(
+            condition, shell=True, cwd=base_dir,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        results[condition] = completed.returncode == 0
+    return results[condition]
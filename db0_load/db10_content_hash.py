@@ -0,0 +1,185 @@
+import os
+import json
+import mmap
+import stat
+import time
+import hashlib
+import logging
+
+from concurrent.futures import ThreadPoolExecutor
+
+from .db08_scan_cache import (
+    RACY_MTIME_WINDOW_NS,
+    get_scan_cache_dir,
+    scan_cache_enabled,
+    write_json_atomic,
+)
+
+# Content hashes of repo/home copies, cached per file by (st_dev, st_ino, st_size, st_mtime_ns)
+CONTENT_HASH_CACHE_NAME = "content_hashes.json"
+CONTENT_HASH_CACHE_VERSION = 1
+CONTENT_HASH_MAX_WORKERS = 8  # hashlib releases the GIL on large buffers, so threads hash in parallel
+CONTENT_HASH_DIGEST_SIZE = 16
+MMAP_WINDOW_BYTES = 64 * 1024 * 1024  # Hashed per update() call; bounds the mapped pages touched at once
+
+
+def new_digest():
+    return hashlib.blake2b(digest_size=CONTENT_HASH_DIGEST_SIZE)
+
+
+def hash_file(path):
+    """Hex digest of a regular file's content, read through mmap."""
+    digest = new_digest()
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size:  # Empty files cannot be mapped
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if hasattr(mapped, "madvise"):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                view = memoryview(mapped)
+                try:
+                    for offset in range(0, size, MMAP_WINDOW_BYTES):
+                        digest.update(view[offset:offset + MMAP_WINDOW_BYTES])
+                finally:
+                    view.release()
+    return digest.hexdigest()
+
+
+def get_file_key(file_stat):
+    return [file_stat.st_dev, file_stat.st_ino, file_stat.st_size, file_stat.st_mtime_ns]
+
+
+def walk_item(path):
+    """
+    Entries of a file or folder item, without following symlinks.
+
+    Returns:
+        list[tuple]: (relative path, kind, value, stat) with kind 'f' (regular
+        file, value None until hashed), 'd' (directory), 'l' (symlink, value
+        is its target) or 'o' (other).
+    """
+    entries = []
+    top_stat = os.lstat(path)
+    if not stat.S_ISDIR(top_stat.st_mode):
+        return [("", "f", None, top_stat)] if stat.S_ISREG(top_stat.st_mode) else [("", "o", None, top_stat)]
+
+    pending = [("", path)]
+    while pending:
+        rel_dir, dir_path = pending.pop()
+        entries.append((rel_dir, "d", None, None))
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                rel_path = os.path.join(rel_dir, entry.name)
+                if entry.is_symlink():
+                    entries.append((rel_path, "l", os.readlink(entry.path), None))
+                elif entry.is_dir(follow_symlinks=False):
+                    pending.append((rel_path, entry.path))
+                elif entry.is_file(follow_symlinks=False):
+                    entries.append((rel_path, "f", None, entry.stat(follow_symlinks=False)))
+                else:
+                    entries.append((rel_path, "o", None, None))
+    return entries
+
+
+class ContentHasher:
+    """
+    Hashes file and folder items in a thread pool, backed by an on-disk cache.
+
+    A file is only read when its (st_dev, st_ino, st_size, st_mtime_ns) is not
+    in the cache. Files modified within the racy mtime window are hashed but
+    not cached. A folder's digest covers the relative paths, kinds, file
+    digests and symlink targets of everything below it.
+    """
+
+    def __init__(self, max_workers=CONTENT_HASH_MAX_WORKERS):
+        self.max_workers = max_workers
+        self.use_cache = scan_cache_enabled()
+        self.cache_path = os.path.join(get_scan_cache_dir(), CONTENT_HASH_CACHE_NAME)
+        self.cache = self.load_cache() if self.use_cache else {}
+        self.seen = {}
+
+    def load_cache(self):
+        try:
+            with open(self.cache_path, "r") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if cached.get("version") != CONTENT_HASH_CACHE_VERSION:
+            return {}
+        return cached.get("files", {})
+
+    def save_cache(self):
+        """Keep only the files seen in this run; rewrite the cache only when it changed."""
+        if not self.use_cache or self.seen == self.cache:
+            return
+        try:
+            write_json_atomic(self.cache_path, {"version": CONTENT_HASH_CACHE_VERSION, "files": self.seen})
+        except OSError as e:
+            logging.warning(f"Could not write content hash cache: {e}")
+
+    def hash_items(self, item_paths):
+        """
+        Content digest per item path ('f:...' for files, 'd:...' for folders).
+
+        Returns:
+            dict: path -> digest, or None if the item could not be read.
+        """
+        walks = {}
+        to_hash = {}
+        for item_path in dict.fromkeys(item_paths):
+            try:
+                walks[item_path] = walk_item(item_path)
+            except OSError as e:
+                logging.warning(f"Cannot read {item_path} for content comparison: {e}")
+                walks[item_path] = None
+                continue
+            for rel_path, kind, _value, file_stat in walks[item_path]:
+                if kind != "f":
+                    continue
+                file_path = os.path.join(item_path, rel_path) if rel_path else item_path
+                file_key = get_file_key(file_stat)
+                cached = self.cache.get(file_path)
+                if cached is not None and cached[:4] == file_key:
+                    self.seen[file_path] = cached
+                else:
+                    to_hash[file_path] = file_key
+
+        # Hash all uncached files of all items in one pool, so a single large folder is spread over the workers
+        file_digests = {file_path: self.seen[file_path][4] for file_path in self.seen}
+        failed = set()
+        if to_hash:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {file_path: executor.submit(hash_file, file_path) for file_path in to_hash}
+            now_ns = time.time_ns()
+            for file_path, future in futures.items():
+                try:
+                    file_digests[file_path] = future.result()
+                except (OSError, ValueError) as e:
+                    logging.warning(f"Cannot hash {file_path}: {e}")
+                    failed.add(file_path)
+                    continue
+                file_key = to_hash[file_path]
+                if now_ns - file_key[3] > RACY_MTIME_WINDOW_NS:
+                    self.seen[file_path] = file_key + [file_digests[file_path]]
+
+        digests = {}
+        for item_path, entries in walks.items():
+            digests[item_path] = None if entries is None else self.combine(item_path, entries, file_digests, failed)
+        self.save_cache()
+        return digests
+
+    def combine(self, item_path, entries, file_digests, failed):
+        if entries[0][1] != "d":
+            if entries[0][1] != "f" or item_path in failed:
+                return None
+            return "f:" + file_digests[item_path]
+
+        digest = new_digest()
+        for rel_path, kind, value, _file_stat in sorted(entries, key=lambda entry: entry[0]):
+            if kind == "f":
+                file_path = os.path.join(item_path, rel_path)
+                if file_path in failed:
+                    return None
+                value = file_digests[file_path]
+            digest.update(f"{rel_path}\0{kind}\0{value or ''}\n".encode("utf-8", "surrogateescape"))
+        return "d:" + digest.hexdigest()
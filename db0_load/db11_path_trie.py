@@ -0,0 +1,104 @@
+import os
+
+from .db06_scan_dir import get_entry_types
+
+TERMINAL = None  # Key marking a node as a managed path itself (path components are never None)
+
+
+def split_path(rel_path):
+    return [part for part in rel_path.split(os.sep) if part and part != "."]
+
+
+class PathTrie:
+    """
+    Trie of relative path components.
+
+    A node holding TERMINAL is a managed path; a node with other keys lies on
+    the way to deeper managed paths. Lookups are exact per component, so
+    `.config/nvim` never matches `.config/nvim-old` or `.config`.
+    """
+
+    def __init__(self, rel_paths=()):
+        self.root = {}
+        for rel_path in rel_paths:
+            self.insert(rel_path)
+
+    def insert(self, rel_path):
+        node = self.root
+        for part in split_path(rel_path):
+            node = node.setdefault(part, {})
+        node[TERMINAL] = True
+
+    def get_node(self, rel_path):
+        node = self.root
+        for part in split_path(rel_path):
+            node = node.get(part)
+            if node is None:
+                return None
+        return node
+
+    def __contains__(self, rel_path):
+        node = self.get_node(rel_path)
+        return node is not None and TERMINAL in node
+
+    def __bool__(self):
+        return bool(self.root)
+
+    def iter_branch_dirs(self, rel_dir=""):
+        """(relative dir, node) for every directory that contains managed paths below it."""
+        node = self.get_node(rel_dir) if rel_dir else self.root
+        pending = [(rel_dir, node)]
+        while pending:
+            rel_dir, node = pending.pop()
+            children = {name: child for name, child in node.items() if name is not TERMINAL}
+            if not children:
+                continue
+            yield rel_dir, node
+            for name, child in children.items():
+                pending.append((os.path.join(rel_dir, name), child))
+
+
+def get_child_names(node):
+    return {name for name in node if name is not TERMINAL}
+
+
+def scan_trie_entries(root_path, trie, resolver=None):
+    """
+    Item types of the nested managed paths below root_path, descending only into trie directories.
+
+    Each visited directory is listed once with os.scandir; entries that are not
+    in the trie are skipped, and only real (non-symlink) directories leading to
+    deeper managed paths are entered. Top-level managed paths are left to
+    scan_dot_entries(), which lists root_path itself.
+
+    Returns:
+        dict: Column arrays {"item_name": [...], "item_type": [...]} with
+        root-relative paths as names.
+    """
+    item_names = []
+    item_entries = []
+
+    pending = [
+        (name, os.path.join(root_path, name), child)
+        for name, child in trie.root.items()
+        if name is not TERMINAL and get_child_names(child) and not os.path.islink(os.path.join(root_path, name))
+    ]
+    while pending:
+        rel_dir, dir_path, node = pending.pop()
+        try:
+            entries = os.scandir(dir_path)
+        except OSError:
+            continue  # Missing, not a directory or unreadable: its managed paths are absent
+        with entries:
+            for entry in entries:
+                child = node.get(entry.name)
+                if child is None:
+                    continue
+                rel_path = os.path.join(rel_dir, entry.name)
+                if TERMINAL in child:
+                    item_names.append(rel_path)
+                    item_entries.append(entry)
+                if get_child_names(child) and entry.is_dir(follow_symlinks=False):
+                    pending.append((rel_path, entry.path, child))
+
+    return {"item_name": item_names, "item_type": get_entry_types(item_entries, resolver)}
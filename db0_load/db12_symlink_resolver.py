@@ -0,0 +1,187 @@
+import os
+import stat
+
+from collections import namedtuple
+
+# Result of resolving one path: final target, what it is, and how many symlinks were followed
+LinkResolution = namedtuple("LinkResolution", ["target_path", "target_kind", "chain_length"])
+
+# target_kind values; the last three mean the chain does not end in an existing item
+TARGET_KINDS = ("file", "folder", "other", "dangling", "loop", "error")
+SYMLINK_MAX_HOPS = 40  # Same limit as the kernel's ELOOP: longer chains are reported as loops
+
+LINK_ITEM_TYPES = {"file": "file_sym", "folder": "folder_sym"}
+
+
+class LinkResolutionError(Exception):
+    """A path that cannot be resolved: kind is 'dangling', 'loop' or 'error', path is where it failed."""
+
+    def __init__(self, kind, path):
+        super().__init__(f"{kind}: {path}")
+        self.kind = kind
+        self.path = path
+
+
+class LinkHopLimitError(LinkResolutionError):
+    """The resolution stack hit max_hops: a loop for the path it started from, unknown for the links in between."""
+
+    def __init__(self, path):
+        super().__init__("loop", path)
+
+
+def to_absolute_path(path):
+    """Absolute path without lexical '..' collapsing ('link/..' must resolve link first)."""
+    path = os.fspath(path)
+    if not path.startswith(os.sep):
+        path = os.getcwd() + os.sep + path
+    if "//" in path or path.endswith(os.sep):
+        path = os.sep + os.sep.join(part for part in path.split(os.sep) if part)
+    return path
+
+
+def join_path(real_dir, name):
+    return real_dir + name if real_dir == os.sep else real_dir + os.sep + name
+
+
+def get_target_kind(mode):
+    if stat.S_ISDIR(mode):
+        return "folder"
+    if stat.S_ISREG(mode):
+        return "file"
+    return "other"
+
+
+class SymlinkResolver:
+    """
+    Resolves batches of paths to their final targets, caching every resolved prefix.
+
+    Works like os.path.realpath(), one component at a time, but each absolute
+    prefix is resolved once per resolver: a home full of links into the same
+    repo lstat()s the repo's parent directories once, not once per link.
+    Cycles are detected explicitly (a link met again while it is still being
+    resolved) and missing targets are reported as dangling instead of
+    silently returning the unresolved path. A chain longer than max_hops is
+    reported as a loop whatever order the batch is resolved in: only results
+    that depend on the path alone are cached.
+
+    Results are a point-in-time snapshot: use one resolver per load, not
+    across runs.
+    """
+
+    def __init__(self, max_hops=SYMLINK_MAX_HOPS):
+        self.max_hops = max_hops
+        self.resolved = {os.sep: (os.sep, stat.S_IFDIR, 0)}  # path -> (real path, st_mode, hops) or LinkResolutionError
+
+    def resolve_links(self, paths, known_links=False):
+        """
+        Resolve a batch of paths.
+
+        Args:
+            paths (Iterable[str]): Paths to resolve.
+            known_links (bool): The caller already knows every path is a symlink
+                (e.g. from os.DirEntry.is_symlink()), so its lstat() is skipped.
+
+        Returns:
+            dict: path -> LinkResolution. A path that is not a symlink resolves
+            to itself with chain_length 0 (its parents may still be links).
+        """
+        resolve = self.resolve_known_link if known_links else self.resolve_path
+        resolutions = {}
+        for path in paths:
+            try:
+                real_path, mode, hops = resolve(to_absolute_path(path), set())
+            except LinkResolutionError as e:
+                resolutions[path] = LinkResolution(e.path, e.kind, 0)
+                continue
+            resolutions[path] = LinkResolution(real_path, get_target_kind(mode), hops)
+        return resolutions
+
+    def resolve_path(self, path, active_links):
+        """(real path, st_mode, hops) of an absolute path; raises LinkResolutionError."""
+        cached = self.resolved.get(path)
+        if cached is None:
+            try:
+                cached = self.resolve_uncached(path, active_links)
+            except LinkHopLimitError:
+                raise  # Depends on where the resolution started
+            except LinkResolutionError as e:
+                cached = e
+            self.resolved[path] = cached
+        if isinstance(cached, LinkResolutionError):
+            raise cached
+        return cached
+
+    def resolve_known_link(self, path, active_links):
+        """resolve_path() for a path known to be a symlink (one lstat() less per link)."""
+        cached = self.resolved.get(path)
+        if cached is not None:
+            return self.resolve_path(path, active_links)
+        parent, _, name = path.rpartition(os.sep)
+        real_parent, parent_mode, hops = self.resolve_path(parent or os.sep, active_links)
+        if not stat.S_ISDIR(parent_mode) or name in (".", ".."):
+            return self.resolve_path(path, active_links)
+        try:
+            resolved = self.follow_link(join_path(real_parent, name), real_parent, hops, active_links)
+        except LinkHopLimitError:
+            raise
+        except LinkResolutionError as e:
+            resolved = e
+        self.resolved[path] = resolved
+        return self.resolve_path(path, active_links)
+
+    def resolve_uncached(self, path, active_links):
+        parent, _, name = path.rpartition(os.sep)
+        real_parent, parent_mode, hops = self.resolve_path(parent or os.sep, active_links)
+        if not stat.S_ISDIR(parent_mode):
+            raise LinkResolutionError("dangling", join_path(real_parent, name))  # ENOTDIR
+        if name == ".":
+            return real_parent, parent_mode, hops
+        if name == "..":
+            return os.path.dirname(real_parent), stat.S_IFDIR, hops
+
+        candidate = join_path(real_parent, name)
+        try:
+            mode = os.lstat(candidate).st_mode
+        except (FileNotFoundError, NotADirectoryError):
+            raise LinkResolutionError("dangling", candidate)
+        except OSError:
+            raise LinkResolutionError("error", candidate)
+        if not stat.S_ISLNK(mode):
+            return candidate, mode, hops
+        return self.follow_link(candidate, real_parent, hops, active_links)
+
+    def follow_link(self, candidate, real_parent, hops, active_links):
+        if candidate in active_links:
+            raise LinkResolutionError("loop", candidate)
+        if len(active_links) >= self.max_hops:
+            raise LinkHopLimitError(candidate)  # Bounds the recursion; not cached for the links in between
+        try:
+            target = os.readlink(candidate)
+        except FileNotFoundError:
+            raise LinkResolutionError("dangling", candidate)
+        except OSError:
+            raise LinkResolutionError("error", candidate)
+        if not target.startswith(os.sep):
+            target = join_path(real_parent, target)  # Relative targets are relative to the link's (resolved) directory
+
+        active_links.add(candidate)
+        try:
+            real_target, target_mode, target_hops = self.resolve_path(to_absolute_path(target), active_links)
+        finally:
+            active_links.discard(candidate)
+        chain_length = hops + target_hops + 1
+        if chain_length > self.max_hops:
+            raise LinkResolutionError("loop", candidate)  # Same result whichever link of the chain was resolved first
+        return real_target, target_mode, chain_length
+
+
+def get_link_item_type(resolution):
+    """Item type of a symlink from its resolution: 'file_sym', 'folder_sym' or 'unknown'."""
+    return LINK_ITEM_TYPES.get(resolution.target_kind, "unknown")
+
+
+def resolve_link_item_types(link_paths, resolver=None):
+    """Item types of a batch of symlink paths, resolved in one resolver call."""
+    resolver = resolver or SymlinkResolver()
+    resolutions = resolver.resolve_links(link_paths, known_links=True)
+    return [get_link_item_type(resolutions[path]) for path in link_paths]
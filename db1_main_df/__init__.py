@@ -1,36 +1,29 @@
-from .db10_make_df_dict import (
-    build_full_output_dict,
-)
-
-from .db11_make_main_df import (
-    build_main_dataframe,
-    apply_output_grouping,
-    reorder_dfm_cols_perm,
-)
-
-# from .db05_get_filetype import (
-#     determine_item_type,
-#     is_symlink,
-#     is_alias,
-#     get_file_type,
-#     get_folder_type,
-#     resolve_item_type,
-#     detect_alias_type,
-#     detect_symlink_target_type,
-# )
-
-from .db13_merge import (
-    df_merge_sequence,
-    df_merge,
-    create_merge_key_post_merge1,
-)
-
-from .db14_merge_sup import (
-    get_next_unique_id,
-    consolidate_post_merge1,
-    consolidate_post_merge3,
-    print_main_df_build_hist,
-)
+from db5_global.db56_lazy_exports import lazy_exports
+
+# Exported name -> defining module; each module is imported on first access
+LAZY_EXPORTS = {
+    "build_full_output_dict": "db1_main_df.db10_make_df_dict",
+
+    "build_main_dataframe": "db1_main_df.db11_make_main_df",
+    "apply_output_grouping": "db1_main_df.db11_make_main_df",
+    "reorder_dfm_cols_perm": "db1_main_df.db11_make_main_df",
+
+    "LoadContext": "db1_main_df.db12_load_ctx",
+    "SOURCE_LOADERS": "db1_main_df.db12_load_ctx",
+
+    "df_merge_sequence": "db1_main_df.db13_merge",
+    "df_merge": "db1_main_df.db13_merge",
+    "create_merge_key_post_merge1": "db1_main_df.db13_merge",
+
+    "get_next_unique_id": "db1_main_df.db14_merge_sup",
+    "is_missing": "db1_main_df.db14_merge_sup",
+    "coalesce": "db1_main_df.db14_merge_sup",
+    "consolidate_post_merge1": "db1_main_df.db14_merge_sup",
+    "consolidate_post_merge3": "db1_main_df.db14_merge_sup",
+    "print_main_df_build_hist": "db1_main_df.db14_merge_sup",
+
+    "f_types_vals": "db5_global.db52_dtype_dict",
+}
 
 __all__ = [
     "build_full_output_dict",
@@ -46,11 +39,17 @@ __all__ = [
     # "detect_symlink_target_type",
     "apply_output_grouping",
     "reorder_dfm_cols_perm",
+    "LoadContext",
+    "SOURCE_LOADERS",
     "df_merge_sequence",
     "df_merge",
-    'create_merge_key_post_merge1,'
+    "create_merge_key_post_merge1",
     "get_next_unique_id",
+    "is_missing",
+    "coalesce",
     "consolidate_post_merge1",
     "consolidate_post_merge3",
     "print_main_df_build_hist",
-]
\ No newline at end of file
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, LAZY_EXPORTS)
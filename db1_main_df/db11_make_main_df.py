@@ -1,21 +1,20 @@
 import pandas as pd
 
-from db0_load.db00_load_rp import load_rp_dataframe
-from db0_load.db01_load_hm import load_hm_dataframe
-from db0_load.db02_load_db import load_dotbot_yaml_dataframe
-from db0_load.db03_load_cf import load_cf_dataframe
-
+from .db12_load_ctx import LoadContext
 from .db13_merge import df_merge_sequence
 
 from db5_global.db50_global_misc import print_debug_info
-from db5_global.db52_dtype_dict import f_types_vals
-
-def build_main_dataframe(verbose=False):
-    # Define individual DataFrames
-    repo_df = load_rp_dataframe()
-    home_df = load_hm_dataframe()
-    dotbot_df = load_dotbot_yaml_dataframe()
-    user_config_df = load_cf_dataframe()
+from db5_global.db52_dtype_dict import f_types_vals, astype_f_type, recode_categories
+from db5_global.db54_trace import traced_stage
+
+@traced_stage('build_main_dataframe')
+def build_main_dataframe(verbose=False, load_context=None):
+    # Define individual DataFrames (shared with the rest of the run through the load context)
+    load_context = load_context or LoadContext()
+    repo_df = load_context.repo_df
+    home_df = load_context.home_df
+    dotbot_df = load_context.dotbot_df
+    user_config_df = load_context.config_df
     main_df = repo_df.copy() # Initialize the main_dataframe from the REPO FOLDER
 
     # Create global fields
@@ -45,6 +44,7 @@ def build_main_dataframe(verbose=False):
     return full_main_dataframe
 
 
+@traced_stage('consolidate_item_type')
 def consolidate_item_type(df):
     """Resolve consolidated item_type for rows that do not originate in repo scan."""
     type_priority = [
@@ -61,7 +61,7 @@ def consolidate_item_type(df):
         return df
 
     # Use first non-null type across known sources.
-    df["item_type"] = df[available].bfill(axis=1).iloc[:, 0]
+    df["item_type"] = astype_f_type(df[available].bfill(axis=1).iloc[:, 0], "item_type")
 
     # Normalize variants used by symlink/alias sources for consistent display/type checks.
     normalize_map = {
@@ -70,10 +70,10 @@ def consolidate_item_type(df):
         "file_alias": "file",
         "folder_alias": "folder",
     }
-    df["item_type"] = df["item_type"].replace(normalize_map)
-    df["item_type"] = df["item_type"].astype(f_types_vals["item_type"]['dtype'])
+    df["item_type"] = recode_categories(df["item_type"], normalize_map)
     return df
 
+@traced_stage('apply_output_grouping')
 def apply_output_grouping(df):
     # Sort the entire DataFrame by 'sort_orig'
     df_sorted = df.sort_values('sort_orig', ascending=True)
@@ -0,0 +1,78 @@
+from db0_load.db00_load_rp import load_rp_dataframe
+from db0_load.db01_load_hm import load_hm_dataframe
+from db0_load.db02_load_db import load_dotbot_yaml_dataframe
+from db0_load.db03_load_cf import load_cf_dataframe
+from db0_load.db04_load_fx import load_fx_dataframe
+
+# Source name -> loader; each source is loaded at most once per LoadContext
+SOURCE_LOADERS = {
+    'rp': load_rp_dataframe,
+    'hm': load_hm_dataframe,
+    'db': load_dotbot_yaml_dataframe,
+    'cf': load_cf_dataframe,
+    'fx': load_fx_dataframe,
+}
+
+# Source name -> sources whose frames its loader takes as arguments (the home scan
+# descends into the Dotbot frame's nested destinations)
+SOURCE_DEPENDENCIES = {
+    'hm': ('db',),
+}
+
+
+class LoadContext:
+    """
+    Per-run cache of the source DataFrames.
+
+    Every consumer of a report run (main-frame build, unmatched items, fixtures)
+    reads the same loaded frame, so $HOME is scanned and each CSV/YAML parsed
+    once, and all consumers see the same unique_id values.
+    Frames are shared, not copied: callers must not modify them in place.
+    """
+
+    def __init__(self, loaders=None):
+        self.loaders = dict(SOURCE_LOADERS)
+        if loaders:
+            self.loaders.update(loaders)
+        self.frames = {}
+
+    def get(self, source):
+        if source not in self.loaders:
+            raise KeyError(f"Unknown load source: {source}")
+        if source not in self.frames:
+            dependency_frames = [self.get(dependency) for dependency in SOURCE_DEPENDENCIES.get(source, ())]
+            self.frames[source] = self.loaders[source](*dependency_frames)
+        return self.frames[source]
+
+    def invalidate(self, *sources):
+        """Drop memoized frames (all of them when no source is given), and the frames loaded from them."""
+        pending = list(sources or self.frames)
+        while pending:
+            source = pending.pop()
+            self.frames.pop(source, None)
+            pending.extend(dependent for dependent, dependencies in SOURCE_DEPENDENCIES.items()
+                           if source in dependencies and dependent in self.frames)
+
+    @property
+    def repo_df(self):
+        return self.get('rp')
+
+    @property
+    def home_df(self):
+        return self.get('hm')
+
+    @property
+    def dotbot_df(self):
+        return self.get('db')
+
+    @property
+    def config_df(self):
+        return self.get('cf')
+
+    @property
+    def fixture_index(self):
+        return self.get('fx')
+
+    @property
+    def fixtures_df(self):
+        return self.get('fx').df
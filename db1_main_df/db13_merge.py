@@ -1,11 +1,18 @@
+import os
 import pandas as pd
 import logging
 
 from db5_global.db52_dtype_dict import f_types_vals
-from .db14_merge_sup import consolidate_post_merge1, consolidate_post_merge3, print_main_df_build_hist
+from .db14_merge_sup import coalesce, consolidate_post_merge1, consolidate_post_merge3, print_main_df_build_hist
+from db5_global.db54_trace import traced_stage
 
+SHOW_MERGE_BUILD_HIST = False  # Set to True to print each merge's inputs/output (copies every frame)
+
+@traced_stage('df_merge_sequence')
 def df_merge_sequence(main_df, home_df, dotbot_df, user_config_df, print_df):
-    left_merge_field = 'item_name_rp'  # Use item_name_rp for the first merge
+    # Repo items linked only to nested destinations merge with the home row at that path
+    main_df = create_repo_merge_key(main_df, dotbot_df)
+    left_merge_field = 'item_name_rp_m_key'  # Use the repo name (or its nested home path) for the first merge
 
     # First merge: repo and home
     right_merge_field = 'item_name_hm'
@@ -33,8 +40,13 @@ def df_merge_sequence(main_df, home_df, dotbot_df, user_config_df, print_df):
 
     return main_df
 
-def df_merge(main_df, input_df, left_merge_field, right_merge_field, merge_type='outer'):
-    main_df_build_hist = {"df1": main_df.copy(), "df2": input_df.copy()}
+@traced_stage('df_merge')
+def df_merge(main_df, input_df, left_merge_field, right_merge_field, merge_type='outer', show_hist=None):
+    if show_hist is None:
+        show_hist = SHOW_MERGE_BUILD_HIST
+
+    # Only snapshot the build history when it will be printed; pd.merge already returns a new frame.
+    main_df_build_hist = {"df1": main_df.copy(), "df2": input_df.copy()} if show_hist else None
 
     try:
         merged_dataframe = pd.merge(
@@ -42,43 +54,70 @@ def df_merge(main_df, input_df, left_merge_field, right_merge_field, merge_type=
             left_on=left_merge_field,
             right_on=right_merge_field,
             how=merge_type
-        ).copy()
-
-        main_df_build_hist["df3"] = merged_dataframe.copy()
-        # print_main_df_build_hist(main_df_build_hist) # Print the build history 🟡
+        )
 
     except Exception as e:
         raise RuntimeError(f"Error during merge: {e}")
-    
+
+    if show_hist:
+        main_df_build_hist["df3"] = merged_dataframe.copy()
+        print_main_df_build_hist(main_df_build_hist) # Print the build history 🟡
+
     return merged_dataframe
 
+def create_repo_merge_key(main_df, dotbot_df):
+    """
+    Add item_name_rp_m_key: the repo item's name, or the nested home path Dotbot links it to.
+
+    A top-level repo item linked to a nested destination (`nvim` -> `.config/nvim`)
+    only appears in the home frame under that path. Items that Dotbot also links at
+    the top level keep their name; with several nested destinations the first wins.
+    """
+    links = dotbot_df[dotbot_df['item_name_rp_db'].notna() & dotbot_df['item_name_hm_db'].notna()]
+    is_top_level_source = ~links['item_name_rp_db'].str.contains(os.sep, regex=False)
+    is_nested_destination = links['item_name_hm_db'].str.contains(os.sep, regex=False)
+
+    top_level_links = links[is_top_level_source & ~is_nested_destination]
+    top_level_sources = set(zip(top_level_links['item_name_rp_db'], top_level_links['repo_scope_db'].astype(object)))
+
+    nested_links = links[is_top_level_source & is_nested_destination]
+    nested_targets = {}
+    for item_name_rp, repo_scope, item_name_hm in zip(
+        nested_links['item_name_rp_db'], nested_links['repo_scope_db'].astype(object), nested_links['item_name_hm_db']
+    ):
+        if (item_name_rp, repo_scope) not in top_level_sources:
+            nested_targets.setdefault((item_name_rp, repo_scope), item_name_hm)
+
+    repo_keys = [
+        nested_targets.get((item_name_rp, repo_scope), item_name_rp)
+        for item_name_rp, repo_scope in zip(main_df['item_name_rp'], main_df['repo_scope_rp'].astype(object))
+    ]
+    main_df['item_name_rp_m_key'] = pd.Series(repo_keys, index=main_df.index, dtype=main_df['item_name_rp'].dtype)
+    return main_df
+
 def create_merge_key_post_merge1(df):
-    # Add the new merge key column
-    df['item_name_m_key'] = df.apply(
-        lambda row: row['item_name_rp'] if not pd.isna(row['item_name_rp']) else row['item_name_hm'], axis=1
+    # Add the new merge key column; the home name first, so a repo item merged with
+    # its nested home path keys on that path
+    df['item_name_m_key'] = coalesce(
+        df['item_name_hm'], df['item_name_rp'], dtype=f_types_vals["item_name_rp"]['dtype']
     )
-    df["item_name_m_key"] = df["item_name_m_key"].astype(f_types_vals["item_name_rp"]['dtype'])
     
     return df
 
 def consolidate_merge_key_post_merge2(df):
     # Consolidate the merge key fields to handle <NA> values
-    df['item_name_db_m_key'] = df.apply(
-        lambda row: row['item_name_m_key'] if pd.isna(row['item_name_db_m_key']) else row['item_name_db_m_key'], axis=1
+    df['item_name_db_m_key'] = coalesce(
+        df['item_name_db_m_key'], df['item_name_m_key'], dtype=f_types_vals["item_name_rp"]['dtype']
     )
-    df["item_name_db_m_key"] = df["item_name_db_m_key"].astype(f_types_vals["item_name_rp"]['dtype'])
     
     return df
 
 def consolidate_merge_key_post_merge3(df):
     # Consolidate the merge key fields to handle <NA> values
-    df['item_name_cf_m_key'] = df.apply(
-        lambda row: row['item_name_db_m_key'] if pd.isna(row['item_name_cf_m_key']) else row['item_name_cf_m_key'], axis=1
-    )
-    df['item_name_cf_m_key'] = df.apply(
-        lambda row: row['item_name_m_key'] if pd.isna(row['item_name_cf_m_key']) else row['item_name_cf_m_key'], axis=1
+    df['item_name_cf_m_key'] = coalesce(
+        df['item_name_cf_m_key'], df['item_name_db_m_key'], df['item_name_m_key'],
+        dtype=f_types_vals["item_name_rp"]['dtype']
     )
-    df["item_name_cf_m_key"] = df["item_name_cf_m_key"].astype(f_types_vals["item_name_rp"]['dtype'])
     
     return df
 
@@ -87,6 +126,6 @@ def merge_key_final_cleanup(df):
     df['item_name'] = df['item_name_cf_m_key']
     
     # Drop the merge key fields
-    df = df.drop(columns=['item_name_m_key', 'item_name_db_m_key', 'item_name_cf_m_key'])
+    df = df.drop(columns=['item_name_rp_m_key', 'item_name_m_key', 'item_name_db_m_key', 'item_name_cf_m_key'])
     
     return df
\ No newline at end of file
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 # Add the unique ID generation code
@@ -9,28 +10,38 @@ def get_next_unique_id():
     current_unique_id += 1
     return unique_id
 
+# Values treated as missing by coalesce(), besides NA/NaN (compared stripped, case-insensitive)
+COALESCE_MISSING_TOKENS = ("", "none")
+
+def is_missing(series):
+    """Boolean mask of missing values: NA/NaN, empty strings and 'none'."""
+    missing = series.isna().to_numpy(dtype=bool)
+    if pd.api.types.is_numeric_dtype(series.dtype) or pd.api.types.is_bool_dtype(series.dtype):
+        return missing
+    tokens = series.astype("string").str.strip().str.lower()
+    return missing | tokens.isin(COALESCE_MISSING_TOKENS).to_numpy(dtype=bool, na_value=False)
+
+def coalesce(*columns, dtype=None):
+    """
+    Column-wise coalesce: per row, the first value that is not missing (see is_missing).
+
+    The last column is the fallback and is taken as-is, so rows where every
+    earlier column is missing keep that column's value. Columns must share an
+    index. The result has `dtype` (default: the first column's dtype).
+    """
+    result = columns[-1].to_numpy(dtype=object)
+    for column in reversed(columns[:-1]):
+        result = np.where(is_missing(column), result, column.to_numpy(dtype=object))
+    return pd.Series(result, index=columns[0].index, dtype=dtype or columns[0].dtype)
+
 def consolidate_post_merge1(main_df): # MERGE REQUIREMENT: Copies the priority name to item_name
-    def consolidate(row):
-        if pd.notna(row['item_name_rp']) and row['item_name_rp'] != "":
-            return row['item_name_rp']
-        elif pd.notna(row['item_name_hm']) and row['item_name_hm'] != "":
-            return row['item_name_hm']
-        else:
-            return row['item_name']  # If both are null, keep the original value
-
-    main_df['item_name'] = main_df.apply(consolidate, axis=1)
+    # If both are missing, keep the original value
+    main_df['item_name'] = coalesce(main_df['item_name_rp'], main_df['item_name_hm'], main_df['item_name'])
     return main_df
 
 def consolidate_post_merge3(main_df): # MERGE REQUIREMENT: Copies the priority name to item_name
-    def consolidate(row):
-        if pd.notna(row['item_name_rp_cf']) and row['item_name_rp_cf'] != "":
-            return row['item_name_rp_cf']
-        elif pd.notna(row['item_name_hm_cf']) and row['item_name_hm_cf'] != "":
-            return row['item_name_hm_cf']
-        else:
-            return row['item_name']  # If both are null, keep the original value
-
-    main_df['item_name'] = main_df.apply(consolidate, axis=1)
+    # If both are missing, keep the original value
+    main_df['item_name'] = coalesce(main_df['item_name_rp_cf'], main_df['item_name_hm_cf'], main_df['item_name'])
     return main_df
 
 def print_main_df_build_hist(df_dict):
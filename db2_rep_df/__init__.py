@@ -1,50 +1,40 @@
-from .db20_make_rpt_df import (
-    build_report_dataframe,
-    add_report_fields,
-    post_build_nan_replace,
-)
-from .db21_format_rows import (
-    insert_blank_rows,
-    sort_report_df,
-    filter_report_df,
-    sort_filter_report_df,
-)
-from .db22_format_cols import (
-    reorder_dfr_cols_perm,
-)
+from db5_global.db56_lazy_exports import lazy_exports
 
-from .db24_match_reg import (
-    detect_full_domain_match,   
-)
-from .db26_match_alert import (
-    detect_alerts,
-)
+# Exported name -> defining module; each module is imported on first access
+LAZY_EXPORTS = {
+    "build_report_dataframe": "db2_rep_df.db20_make_rpt_df",
+    "add_report_fields": "db2_rep_df.db20_make_rpt_df",
+    "post_build_nan_replace": "db2_rep_df.db20_make_rpt_df",
 
-from .db27_match_utils import (
-    normalize_missing_values,
-    get_consistent_name,
-)
+    "insert_blank_rows": "db2_rep_df.db21_format_rows",
+    "sort_report_df": "db2_rep_df.db21_format_rows",
+    "filter_report_df": "db2_rep_df.db21_format_rows",
+    "sort_filter_report_df": "db2_rep_df.db21_format_rows",
 
-# from .db35_status import (
-#     detect_status_master,
-#     get_status_checks_config,
-# )
-from .db36_rpt_mg3_oth import (
-    write_st_alert_value,
-    field_match_3_subsys,
-    subsystem_docs,
-    subsystem_db_all,
-)
-from .db39_mrg_match import (
-    consolidate_fields,
-    get_field_merge_rules,
-)
+    "reorder_dfr_cols_perm": "db2_rep_df.db22_format_cols",
 
-from .db40_term_disp import (
-    remove_consolidated_columns,
-    reorder_dfr_cols_for_cli,
-    print_dataframe_section,
-)
+    "detect_full_domain_match": "db2_rep_df.db24_match_reg",
+
+    "detect_content_drift": "db2_rep_df.db25_content_drift",
+
+    "detect_alerts": "db2_rep_df.db26_match_alert",
+
+    "normalize_missing_values": "db2_rep_df.db27_match_utils",
+    "get_consistent_name": "db2_rep_df.db27_match_utils",
+
+    "diff_report_dataframes": "db2_rep_df.db28_report_diff",
+    "hash_report_rows": "db2_rep_df.db28_report_diff",
+
+    "field_match_3_subsys": "db2_rep_df.db36_rpt_mg3_oth",
+    "subsystem_docs": "db2_rep_df.db36_rpt_mg3_oth",
+    "subsystem_db_all": "db2_rep_df.db36_rpt_mg3_oth",
+
+    "get_field_merge_rules": "db2_rep_df.db39_mrg_match",
+
+    "remove_consolidated_columns": "db2_rep_df.db40_term_disp",
+    "reorder_dfr_cols_for_cli": "db2_rep_df.db40_term_disp",
+    "print_dataframe_section": "db2_rep_df.db40_term_disp",
+}
 
 __all__ = [
     "build_report_dataframe",
@@ -57,17 +47,20 @@ __all__ = [
     "reorder_dfr_cols_perm",
     "detect_full_domain_match",
     "detect_alerts",
+    "detect_content_drift",
     "normalize_missing_values",
     "get_consistent_name",
-    "write_st_alert_value",
+    "diff_report_dataframes",
+    "hash_report_rows",
     "field_match_3_subsys",
     "subsystem_docs",
     "subsystem_db_all",
-    "consolidate_fields",
     "get_field_merge_rules",
     "detect_status_master",
     "get_status_checks_config",
     "remove_consolidated_columns",
     "reorder_dfr_cols_for_cli",
     "print_dataframe_section",
-]
\ No newline at end of file
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, LAZY_EXPORTS)
@@ -1,14 +1,16 @@
 import pandas as pd
 import numpy as np
 
-from db5_global.db52_dtype_dict import f_types_vals
+from db5_global.db52_dtype_dict import f_types_vals, astype_f_type
 
 from .db21_format_rows import insert_blank_rows, sort_filter_report_df
 from .db22_format_cols import reorder_dfr_cols_perm
 from .db24_match_reg import detect_full_domain_match
+from .db25_content_drift import detect_content_drift
 from .db26_match_alert import detect_alerts
 
 from .db40_term_disp import reorder_dfr_cols_for_cli
+from db5_global.db54_trace import traced_stage
 
 # Opt-in to the future behavior for downcasting
 try:
@@ -17,6 +19,7 @@ except Exception:
     # Older/newer pandas versions may not expose this option.
     pass
 
+@traced_stage('build_report_dataframe')
 def build_report_dataframe(main_df_dict, verbose=False):
     report_dataframe = main_df_dict['full_main_dataframe'].copy()
     report_dataframe = add_report_fields(report_dataframe)
@@ -26,6 +29,7 @@ def build_report_dataframe(main_df_dict, verbose=False):
 
     report_dataframe = detect_full_domain_match(report_dataframe)
     report_dataframe = detect_alerts(report_dataframe)
+    report_dataframe = detect_content_drift(report_dataframe)  # Opt-in: DOTREP_CONTENT_DRIFT=1
     report_dataframe = assign_dot_state(report_dataframe)
     report_dataframe = assign_nosym_sort(report_dataframe)
 
@@ -55,6 +59,7 @@ def build_report_dataframe(main_df_dict, verbose=False):
     return report_dataframe
 
 
+@traced_stage('add_report_fields')
 def add_report_fields(report_dataframe):
     df = report_dataframe
     new_columns = { # Define the new columns to add
@@ -119,18 +124,19 @@ def derive_dot_state(row):
     return 'NoSym'
 
 
+@traced_stage('assign_dot_state')
 def assign_dot_state(df):
     df['dot_state'] = df.apply(derive_dot_state, axis=1)
-    df['dot_state'] = df['dot_state'].astype(f_types_vals['dot_state']['dtype'])
+    df['dot_state'] = astype_f_type(df['dot_state'], 'dot_state')
     return df
 
 
 def assign_nosym_sort(df):
-    df['nosym_sort'] = df['dot_state'].apply(lambda v: 1 if str(v).strip() == 'NoSym' else 0)
-    df['nosym_sort'] = df['nosym_sort'].astype(f_types_vals['nosym_sort']['dtype'])
+    df['nosym_sort'] = (df['dot_state'] == 'NoSym').astype(f_types_vals['nosym_sort']['dtype'])  # Compared on category codes
     return df
 
 
+@traced_stage('post_build_nan_replace')
 def post_build_nan_replace(df): # Replace NaN vals
     for column in df.columns:
         if column in f_types_vals:
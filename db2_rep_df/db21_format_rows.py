@@ -2,7 +2,8 @@
 
 
 import pandas as pd
-from db5_global.db52_dtype_dict import f_types_vals
+from db5_global.db52_dtype_dict import f_types_vals, get_category_codes
+from db5_global.db54_trace import traced_stage
 
 def insert_blank_rows(df):
     """
@@ -68,8 +69,9 @@ def filter_report_df(df, hide_no_shows, hide_full_matches, hide_full_and_only, s
 def sort_report_df(df):
     # Keep subgroup ordering based on CSV sequence, then push NoSym items
     # to the bottom within each subgroup while preserving CSV order.
-    df.loc[:, 'cat_1_key'] = df['cat_1_cf'].astype('string').fillna('__uncat_1__')
-    df.loc[:, 'cat_2_key'] = df['cat_2_cf'].astype('string').fillna('__uncat_2__')
+    # Groups are keyed on category codes; uncategorized rows share code -1.
+    df.loc[:, 'cat_1_key'] = get_category_codes(df['cat_1_cf'], 'cat_1_cf')
+    df.loc[:, 'cat_2_key'] = get_category_codes(df['cat_2_cf'], 'cat_2_cf')
     df.loc[:, 'group_sort_key'] = (
         df.groupby(['cat_1_key', 'cat_2_key'], dropna=False)['sort_orig']
         .transform('min')
@@ -87,6 +89,7 @@ def sort_report_df(df):
     df = df.drop(columns=['cat_1_key', 'cat_2_key', 'group_sort_key', 'secondary_sort_key'])
     return df
 
+@traced_stage('sort_filter_report_df')
 def sort_filter_report_df(df, hide_no_shows, hide_full_matches, hide_full_and_only, show_mstat_f, show_mstat_t):
     df = filter_report_df(df, hide_no_shows, hide_full_matches, hide_full_and_only, show_mstat_f, show_mstat_t)
     df = sort_report_df(df)
@@ -1,5 +1,6 @@
 import pandas as pd
 import numpy as np
+from db5_global.db54_trace import traced_stage
 
 DEBUG = False  # Set to True to enable verbose dictionary debug output
 DISPLAY_MATCH_DETAIL_IN_ST_MISC = False  # Set to True to include debug status in st_misc field
@@ -116,25 +117,93 @@ def process_row(index, row):
 
     return dot_struc_value, m_status_result, st_match_symb_content, st_misc_content
 
+REPO_NAME_COLUMNS = ['item_name_rp', 'item_name_rp_db', 'item_name_rp_cf']
+HOME_NAME_COLUMNS = ['item_name_hm', 'item_name_hm_db', 'item_name_hm_cf']
+
+# Column-wise status codes for a single domain (repo or home)
+STATUS_NONE, STATUS_MATCH_SPECIAL, STATUS_MATCH = 0, 1, 2
+DEBUG_CHAR_CODES = np.array(['O', '_', 'X'], dtype=object)  # val == first, val missing, val differs
+
+def to_object_values(series):
+    """Return a numpy object array of the Series values with missing values as None."""
+    return series.to_numpy(dtype=object, na_value=None)
+
+def assign_debug_characters_cols(frame, columns):
+    """
+    Column-wise counterpart of assign_debug_characters for one domain.
+
+    Returns the debug characters (e.g. 'OO_') and the name status code
+    (STATUS_NONE, STATUS_MATCH_SPECIAL, STATUS_MATCH) for every row, plus the
+    first (filesystem) value used for the repo/home comparison.
+    """
+    values = [to_object_values(frame[col]) for col in columns]
+    first_value = values[0]
+    first_present = np.not_equal(first_value, None) & (first_value != '')
+
+    char_codes = []
+    for val in values:
+        missing = np.equal(val, None)
+        equal = ~missing & (val == first_value)
+        char_codes.append(np.where(equal, 0, np.where(missing, 1, 2)))
+
+    debug_characters = DEBUG_CHAR_CODES[char_codes[0]]
+    for codes in char_codes[1:]:
+        debug_characters = debug_characters + DEBUG_CHAR_CODES[codes]
+    debug_characters = np.where(first_present, debug_characters, '___').astype(object)
+
+    any_mismatch = np.logical_or.reduce([codes == 2 for codes in char_codes])
+    all_equal = np.logical_and.reduce([codes == 0 for codes in char_codes])
+    name_status = np.select(
+        [~first_present | any_mismatch, all_equal],
+        [STATUS_NONE, STATUS_MATCH],
+        default=STATUS_MATCH_SPECIAL,
+    )
+    return debug_characters, name_status, first_value
+
+def apply_matching_logic_cols(repo_name_status, home_name_status, repo_name, home_name):
+    """Column-wise counterpart of apply_matching_logic; returns arrays in the same order."""
+    both_match = (repo_name_status == STATUS_MATCH) & (home_name_status == STATUS_MATCH)
+    names_equal = both_match & (repo_name == home_name)
+    repo_only = (repo_name_status == STATUS_MATCH_SPECIAL) & (home_name_status == STATUS_NONE)
+    home_only = (repo_name_status == STATUS_NONE) & (home_name_status == STATUS_MATCH_SPECIAL)
+
+    conditions = [names_equal, both_match, repo_only, home_only]
+    dot_struc_value = np.select(conditions, ['rp>hm', None, 'rp', 'hm'], default=None)
+    debug_status = np.select(
+        conditions,
+        ['both_full_match', 'names_mismatch_between_repo_and_home', 'repo_only_full_match', 'home_only_full_match'],
+        default='no_full_match',
+    )
+    m_status_result = names_equal | repo_only | home_only
+    match_debug = np.select(conditions, ['OO', 'XX', 'o_', '_o'], default='XX')
+
+    return dot_struc_value, debug_status, m_status_result, match_debug
+
+@traced_stage('detect_full_domain_match')
 def detect_full_domain_match(report_dataframe):
-    report_dataframe['st_match_symb'] = ''
-    report_dataframe['st_misc'] = ''
-    for index, row in report_dataframe.iterrows():
-        try:
-            dot_struc_value, m_status_result, st_match_symb_content, st_misc_content = process_row(index, row)
-            if dot_struc_value is not None:
-                report_dataframe.at[index, 'dot_struc'] = dot_struc_value
-            report_dataframe.at[index, 'm_status_result'] = m_status_result
-            report_dataframe.at[index, 'st_match_symb'] = st_match_symb_content
-            report_dataframe.at[index, 'st_misc'] = st_misc_content
-            if DEBUG:
-                print_debug_info(index, row['item_name_rp'], row['item_name_hm'], row['item_name_rp_db'], row['item_name_hm_db'], dot_struc_value, st_misc_content)
-                if DEBUG:
-                    m_status_dict = make_status_match_log_dict(
-                        index, row, row['item_name_rp'], row['item_name_hm'], row['item_name_rp_cf'], row['item_name_hm_cf'],
-                        row['item_name_rp_db'], row['item_name_hm_db'], dot_struc_value, m_status_result, st_match_symb_content
-                    )
-                    print(m_status_dict)
-        except Exception as e:
-            print(f"Error processing index {index}: {e}")
-    return report_dataframe
\ No newline at end of file
+    """Compute dot_struc, m_status_result, st_match_symb and st_misc for the whole frame at once."""
+    repo_debug_characters, repo_name_status, repo_first = assign_debug_characters_cols(report_dataframe, REPO_NAME_COLUMNS)
+    home_debug_characters, home_name_status, home_first = assign_debug_characters_cols(report_dataframe, HOME_NAME_COLUMNS)
+
+    dot_struc_value, debug_status, m_status_result, match_debug = apply_matching_logic_cols(
+        repo_name_status, home_name_status, repo_first, home_first
+    )
+
+    st_match_symb_content = repo_debug_characters + ' | ' + home_debug_characters + ' | ' + match_debug.astype(object)
+
+    has_dot_struc = np.not_equal(dot_struc_value, None)
+    report_dataframe.loc[has_dot_struc, 'dot_struc'] = dot_struc_value[has_dot_struc]
+    report_dataframe['m_status_result'] = m_status_result
+    report_dataframe['st_match_symb'] = st_match_symb_content
+    report_dataframe['st_misc'] = debug_status.astype(object) if DISPLAY_MATCH_DETAIL_IN_ST_MISC else ''
+
+    if DEBUG:
+        for index, row in report_dataframe.iterrows():
+            dot_struc_row, m_status_row, st_match_symb_row, st_misc_row = process_row(index, row)
+            print_debug_info(index, row['item_name_rp'], row['item_name_hm'], row['item_name_rp_db'], row['item_name_hm_db'], dot_struc_row, st_misc_row)
+            m_status_dict = make_status_match_log_dict(
+                index, row, row['item_name_rp'], row['item_name_hm'], row['item_name_rp_cf'], row['item_name_hm_cf'],
+                row['item_name_rp_db'], row['item_name_hm_db'], dot_struc_row, m_status_row, st_match_symb_row
+            )
+            print(m_status_dict)
+    return report_dataframe
@@ -0,0 +1,78 @@
+import os
+import numpy as np
+import pandas as pd
+
+from db5_global.db52_dtype_dict import f_types_vals
+from db5_global.db54_trace import traced_stage
+
+# Opt-in content comparison of real repo/home copies (DOTREP_CONTENT_DRIFT=1)
+CONTENT_DRIFT_ENV = "DOTREP_CONTENT_DRIFT"
+DRIFT_COLUMN = 'st_drift'
+DRIFT_ITEM_TYPES = ['file', 'folder']  # Real items; a home symlink resolves to the repo copy itself
+
+
+def content_drift_enabled():
+    return str(os.getenv(CONTENT_DRIFT_ENV, "")).strip().lower() in {"1", "true", "t", "yes", "y", "on"}
+
+
+def get_drift_candidates(report_dataframe):
+    """Rows where both the repo and the home copy exist as real files or folders."""
+    return (
+        report_dataframe['item_name_rp'].notna().to_numpy(dtype=bool) &
+        report_dataframe['item_name_hm'].notna().to_numpy(dtype=bool) &
+        report_dataframe['item_type_rp'].isin(DRIFT_ITEM_TYPES).to_numpy(dtype=bool) &
+        report_dataframe['item_type_hm'].isin(DRIFT_ITEM_TYPES).to_numpy(dtype=bool)
+    )
+
+
+@traced_stage('detect_content_drift')
+def detect_content_drift(report_dataframe):
+    """
+    Add st_drift: 'same' or 'drift' where a real home copy sits next to its repo
+    copy, 'error' if either could not be read, missing elsewhere.
+
+    No-op unless DOTREP_CONTENT_DRIFT is set.
+    """
+    if not content_drift_enabled():
+        return report_dataframe
+
+    # Imported lazily: only needed when the stage is enabled
+    from db0_load.db00_load_rp import get_repo_scope_paths
+    from db0_load.db10_content_hash import ContentHasher
+
+    repo_scope_paths = get_repo_scope_paths()
+    home_path = os.path.expanduser("~")
+    candidates = np.flatnonzero(get_drift_candidates(report_dataframe))
+
+    pairs = []
+    for position in candidates:
+        row = report_dataframe.iloc[position]
+        repo_path = repo_scope_paths.get(row['repo_scope_rp'])
+        if repo_path is None:
+            continue
+        pairs.append((
+            position,
+            os.path.join(repo_path, row['item_name_rp']),
+            os.path.join(home_path, row['item_name_hm']),
+        ))
+
+    digests = ContentHasher().hash_items(
+        [repo_item for _, repo_item, _ in pairs] + [home_item for _, _, home_item in pairs]
+    )
+
+    drift_dtype = f_types_vals[DRIFT_COLUMN]['dtype']
+    codes = np.full(len(report_dataframe), -1, dtype=np.int8)
+    for position, repo_item, home_item in pairs:
+        repo_digest, home_digest = digests[repo_item], digests[home_item]
+        if repo_digest is None or home_digest is None:
+            status = 'error'
+        else:
+            status = 'same' if repo_digest == home_digest else 'drift'
+        codes[position] = drift_dtype.categories.get_loc(status)
+
+    drift = pd.Categorical.from_codes(codes, dtype=drift_dtype)
+    if DRIFT_COLUMN in report_dataframe.columns:
+        report_dataframe[DRIFT_COLUMN] = drift
+    else:
+        report_dataframe.insert(report_dataframe.columns.get_loc('st_alert') + 1, DRIFT_COLUMN, drift)
+    return report_dataframe
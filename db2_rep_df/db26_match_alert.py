@@ -4,7 +4,20 @@ import numpy as np
 
 # from .db24_match_reg import detect_full_domain_match
 from .db27_match_utils import normalize_missing_values, get_consistent_name
+from db5_global.db52_dtype_dict import f_types_vals
+from db5_global.db54_trace import traced_stage
 
+FS_TYPES = ['file', 'folder']
+
+# Alert names, highest precedence first
+ALERT_PRECEDENCE = [
+    'YAML Inconsistency',
+    'Home Folder New Item',
+    'Doc Only No FS',
+    'Symlink Overwrite',
+]
+
+@traced_stage('detect_alerts')
 def detect_alerts(report_dataframe):
     # Normalize missing values using the shared function
     columns_to_normalize = [
@@ -14,58 +27,58 @@ def detect_alerts(report_dataframe):
     ]
     report_dataframe = normalize_missing_values(report_dataframe, columns_to_normalize)
 
-    # Initialize the 'st_alert' column
-    report_dataframe['st_alert'] = pd.Series([np.nan] * len(report_dataframe), dtype='object')
-
-    # Iterate over each row in the DataFrame
-    for index, row in report_dataframe.iterrows():
-        try:
-            # Extract necessary fields
-            item_name_rp = row['item_name_rp']
-            item_name_hm = row['item_name_hm']
-            item_name_rp_db = row['item_name_rp_db']
-            item_name_hm_db = row['item_name_hm_db']
-            item_name_rp_cf = row['item_name_rp_cf']
-            item_name_hm_cf = row['item_name_hm_cf']
-            item_type_rp = row['item_type_rp']
-            item_type_hm = row['item_type_hm']
-
-            # Initialize alert as None
-            alert = None
+    # Build every alert as a boolean mask over whole columns
+    alert_masks = get_alert_masks(report_dataframe)
 
-            # Reuse existing matching results
-            m_status_result = row.get('m_status_result', False)
-            dot_struc = row.get('dot_struc', None)
+    # Pick the highest-precedence alert per row as a category code (-1 = no alert)
+    alert_dtype = f_types_vals['st_alert']['dtype']
+    alert_codes = np.select(
+        [alert_masks[name].to_numpy(dtype=bool) for name in ALERT_PRECEDENCE],
+        alert_dtype.categories.get_indexer(ALERT_PRECEDENCE),
+        default=-1,
+    )
+    report_dataframe['st_alert'] = pd.Series(
+        pd.Categorical.from_codes(alert_codes, dtype=alert_dtype),
+        index=report_dataframe.index,
+    )
 
-            # Apply alert logic only if no full match was found
-            if not m_status_result:
-                # Check for FS Home-only, with no match in docs
-                if pd.isna(item_name_rp) and pd.notna(item_name_hm):
-                    if pd.isna(item_name_rp_db) and pd.isna(item_name_hm_db) and pd.isna(item_name_rp_cf) and pd.isna(item_name_hm_cf):
-                        alert = 'Home Folder New Item'
-
-                # Check for Doc Only (no FS)
-                elif pd.isna(item_name_rp) and pd.isna(item_name_hm):
-                    if pd.notna(item_name_rp_db) or pd.notna(item_name_hm_db) or pd.notna(item_name_rp_cf) or pd.notna(item_name_hm_cf):
-                        alert = 'Doc Only No FS'
-
-                # Check for Symlink Overwrite (FS Repo and Home match but same type)
-                elif pd.notna(item_name_rp) and pd.notna(item_name_hm):
-                    if item_name_rp == item_name_hm:
-                        if item_type_rp in ['file', 'folder'] and item_type_hm in ['file', 'folder']:
-                            alert = 'Symlink Overwrite'
+    return report_dataframe
 
-                # Check for YAML Inconsistency (YAML Repo and Home match but different names(?))
-                if pd.notna(item_name_hm) and pd.notna(item_name_hm_db):
-                    if item_name_hm != item_name_hm_db:
-                        alert = 'YAML Inconsistency'
+def get_alert_masks(report_dataframe):
+    item_name_rp = report_dataframe['item_name_rp']
+    item_name_hm = report_dataframe['item_name_hm']
+    item_name_hm_db = report_dataframe['item_name_hm_db']
+    doc_names = report_dataframe[['item_name_rp_db', 'item_name_hm_db', 'item_name_rp_cf', 'item_name_hm_cf']]
 
-                # Assign the alert to the 'st_alert' column
-                if alert:
-                    report_dataframe.at[index, 'st_alert'] = alert
+    # Apply alert logic only if no full match was found (missing results count as matched)
+    if 'm_status_result' in report_dataframe.columns:
+        m_status_result = report_dataframe['m_status_result'].fillna(True).astype(bool)
+    else:
+        m_status_result = pd.Series(False, index=report_dataframe.index)
+    no_match = ~m_status_result
 
-        except Exception as e:
-            print(f"Error processing index {index}: {e}")
+    rp_missing = item_name_rp.isna()
+    hm_missing = item_name_hm.isna()
 
-    return report_dataframe
+    # FS Home-only, with no match in docs
+    home_only = rp_missing & ~hm_missing
+    # Doc Only (no FS)
+    doc_only = rp_missing & hm_missing
+    # FS Repo and Home match but both are real items (not a symlink in Home)
+    both_fs = ~rp_missing & ~hm_missing
 
+    return {
+        'Home Folder New Item': no_match & home_only & doc_names.isna().all(axis=1),
+        'Doc Only No FS': no_match & doc_only & doc_names.notna().any(axis=1),
+        'Symlink Overwrite': (
+            no_match & both_fs &
+            (item_name_rp == item_name_hm) &
+            report_dataframe['item_type_rp'].isin(FS_TYPES) &
+            report_dataframe['item_type_hm'].isin(FS_TYPES)
+        ),
+        # YAML Repo and Home match but different names(?)
+        'YAML Inconsistency': (
+            no_match & ~hm_missing & item_name_hm_db.notna() &
+            (item_name_hm != item_name_hm_db)
+        ),
+    }
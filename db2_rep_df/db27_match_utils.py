@@ -2,15 +2,20 @@
 import pandas as pd
 import numpy as np
 
+MISSING_VALUE_TOKENS = {'nan', '<NA>', 'NaN', 'None', 'NoneType', ''}
+
 def normalize_missing_values(df, columns):
     for col in columns:
-        # Convert to string and strip whitespace
-        df[col] = df[col].astype(str).str.strip()
+        # Normalize each distinct value once (these columns are low-cardinality).
+        # Missing values factorize to code -1, which picks the trailing '' below.
+        codes, uniques = pd.factorize(df[col])
+        cleaned = [str(val).strip() for val in uniques] + ['']
         # Replace common missing value representations with np.nan
-        df[col] = df[col].replace(
-            to_replace=['nan', '<NA>', 'NaN', 'None', 'NoneType', ''],
-            value=np.nan
+        cleaned = np.array(
+            [np.nan if val in MISSING_VALUE_TOKENS else val for val in cleaned],
+            dtype=object,
         )
+        df[col] = pd.Series(cleaned[codes], index=df.index, dtype=object)
     return df
 
 def get_consistent_name(names):
@@ -23,4 +28,4 @@ def get_consistent_name(names):
     if all(x == names_filtered[0] for x in names_filtered):
         return names_filtered[0]  # Return the consistent name
     else:
-        return None  # Names are inconsistent within the domain
\ No newline at end of file
+        return None  # Names are inconsistent within the domain
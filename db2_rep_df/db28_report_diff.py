@@ -0,0 +1,83 @@
+import pandas as pd
+from db5_global.db54_trace import traced_stage
+
+# Columns that change between runs without the item changing (IDs, presentation order)
+DIFF_IGNORED_COLUMNS = {'unique_id', 'sort_orig', 'sort_out', 'nosym_sort'}
+DIFF_KEY_COLUMN = 'item_name'
+DIFF_OUTPUT_COLUMNS = ['item_name', 'change', 'st_alert', 'st_alert_prev', 'dot_state', 'changed_columns']
+
+
+def get_diff_columns(df):
+    return [
+        column for column in df.columns
+        if column != DIFF_KEY_COLUMN
+        and column not in DIFF_IGNORED_COLUMNS
+        and not column.startswith('unique_id_')
+    ]
+
+
+def to_diff_frame(df, columns):
+    """
+    Report rows keyed by item_name with the compared columns as 'string'.
+
+    Comparing text keeps hashes stable across dtype changes between runs
+    (object vs category vs string) and covers the dict status columns.
+    Rows without a name are dropped; for duplicate names the first row wins.
+    """
+    df = df[df[DIFF_KEY_COLUMN].notna()].drop_duplicates(DIFF_KEY_COLUMN)
+    frame = df.reindex(columns=columns).astype('string')
+    frame.index = pd.Index(df[DIFF_KEY_COLUMN].astype('string'), name=DIFF_KEY_COLUMN)
+    return frame
+
+
+def hash_report_rows(frame):
+    """One uint64 per row (pandas' vectorized row hash), indexed by item_name."""
+    return pd.util.hash_pandas_object(frame.fillna('\0'), index=False)
+
+
+@traced_stage('diff_report_dataframes')
+def diff_report_dataframes(previous_df, current_df):
+    """
+    Compact delta between two report DataFrames, matched on item_name.
+
+    Returns:
+        DataFrame: One row per added, removed or changed item with its
+        current and previous alert and the names of the changed columns.
+        Unchanged items are omitted.
+    """
+    columns = sorted(set(get_diff_columns(previous_df)) | set(get_diff_columns(current_df)))
+    previous = to_diff_frame(previous_df, columns)
+    current = to_diff_frame(current_df, columns)
+    previous_hashes = hash_report_rows(previous)
+    current_hashes = hash_report_rows(current)
+
+    added = current.index.difference(previous.index, sort=False)
+    removed = previous.index.difference(current.index, sort=False)
+    common = current.index.intersection(previous.index, sort=False)
+    changed = common[current_hashes.loc[common].to_numpy() != previous_hashes.loc[common].to_numpy()]
+
+    # Only changed rows are compared column by column
+    differs = current.loc[changed].fillna('\0') != previous.loc[changed].fillna('\0')
+    changed_columns = [
+        ', '.join(differs.columns[row]) for row in differs.to_numpy(dtype=bool)
+    ]
+
+    def delta_rows(names, change, alert_source, changed_columns=''):
+        return pd.DataFrame({
+            'item_name': names,
+            'change': change,
+            'st_alert': current['st_alert'].reindex(names).to_numpy() if alert_source else pd.NA,
+            'st_alert_prev': previous['st_alert'].reindex(names).to_numpy(),
+            'dot_state': (current if alert_source else previous)['dot_state'].reindex(names).to_numpy(),
+            'changed_columns': changed_columns,
+        }, columns=DIFF_OUTPUT_COLUMNS)
+
+    deltas = [
+        delta_rows(added, 'added', True),
+        delta_rows(removed, 'removed', False),
+        delta_rows(changed, 'changed', True, changed_columns),
+    ]
+    deltas = [delta for delta in deltas if len(delta)]
+    if not deltas:
+        return pd.DataFrame(columns=DIFF_OUTPUT_COLUMNS, dtype='string')
+    return pd.concat([delta.astype('string') for delta in deltas], ignore_index=True)
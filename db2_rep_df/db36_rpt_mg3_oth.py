@@ -1,20 +1,12 @@
+import numpy as np
 import pandas as pd
 from db5_global.db52_dtype_dict import (
     f_types_vals, 
-    get_valid_item_types
+    get_valid_item_types,
+    get_category_codes,
+    SUBSYSTEM_STATUS_DTYPE,
 )
 
-def write_st_alert_value(report_dataframe, index, new_status):
-    current_status = report_dataframe.at[index, 'st_alert']
-    
-    # If there is already a status, overwrite it and add the red circle emoji as a flag
-    if not pd.isna(current_status) and current_status != '':
-        report_dataframe.at[index, 'st_alert'] = f"🔴 {new_status}"
-    else:
-        report_dataframe.at[index, 'st_alert'] = new_status
-    
-    return report_dataframe
-
 def field_match_3_subsys(report_dataframe):
     # Confirm Docs: Both docs match each other - YAML vs CSV
     try:
@@ -32,17 +24,28 @@ def field_match_3_subsys(report_dataframe):
 
     return report_dataframe
 
+def item_types_match(report_dataframe, column_a, column_b):
+    """Element-wise item type equality on shared category codes; missing never matches."""
+    codes_a = get_category_codes(report_dataframe[column_a], column_a)
+    codes_b = get_category_codes(report_dataframe[column_b], column_b)
+    return pd.Series((codes_a == codes_b) & (codes_a >= 0), index=report_dataframe.index)
+
+def to_subsystem_status(condition):
+    """'o' where the condition holds, else 'x', built directly from category codes."""
+    codes = np.where(condition.fillna(False).to_numpy(dtype=bool), 0, 1)
+    return pd.Series(pd.Categorical.from_codes(codes, dtype=SUBSYSTEM_STATUS_DTYPE), index=condition.index)
+
 def subsystem_docs(report_dataframe):
     # Use vectorized operations to check for equality and handle NaN values
     condition = (
         (report_dataframe['item_name_rp_cf'] == report_dataframe['item_name_rp_db']) &
-        (report_dataframe['item_type_rp_cf'] == report_dataframe['item_type_rp_db']) &
+        item_types_match(report_dataframe, 'item_type_rp_cf', 'item_type_rp_db') &
         (report_dataframe['item_name_hm_cf'] == report_dataframe['item_name_hm_db']) &
-        (report_dataframe['item_type_hm_cf'] == report_dataframe['item_type_hm_db'])
+        item_types_match(report_dataframe, 'item_type_hm_cf', 'item_type_hm_db')
     ).fillna(False)  # Treat NaN comparisons as False
 
     # Set 'st_docs' based on the condition
-    report_dataframe['st_docs'] = condition.map({True: 'o', False: 'x'})
+    report_dataframe['st_docs'] = to_subsystem_status(condition)
 
     return report_dataframe['st_docs']
 
@@ -54,11 +57,11 @@ def subsystem_db_all(report_dataframe):
 
     # Check if repo folder matches the corresponding entry in DotBot YAML
     repo_name_match = (report_dataframe['item_name_rp'] == report_dataframe['item_name_rp_db'])
-    repo_type_match = (report_dataframe['item_type_rp'] == report_dataframe['item_type_rp_db'])
+    repo_type_match = item_types_match(report_dataframe, 'item_type_rp', 'item_type_rp_db')
 
     # Check if home folder matches the corresponding entry in DotBot YAML
     home_name_match = (report_dataframe['item_name_hm'] == report_dataframe['item_name_hm_db'])
-    home_type_match = (report_dataframe['item_type_hm'] == report_dataframe['item_type_hm_db'])
+    home_type_match = item_types_match(report_dataframe, 'item_type_hm', 'item_type_hm_db')
 
     # Check for default values in any of the relevant fields
     default_check = (
@@ -73,7 +76,8 @@ def subsystem_db_all(report_dataframe):
     )
 
     # Set 'o' or 'x' based on name and type match and default check
-    report_dataframe['st_db_all'] = 'x'  # Default to 'x'
-    report_dataframe.loc[repo_name_match & repo_type_match & home_name_match & home_type_match & ~default_check, 'st_db_all'] = 'o'
+    report_dataframe['st_db_all'] = to_subsystem_status(
+        repo_name_match & repo_type_match & home_name_match & home_type_match & ~default_check
+    )
 
     return report_dataframe['st_db_all']
\ No newline at end of file
@@ -1,14 +1,42 @@
-from .db50_global_misc import (
-    print_debug_info
-)
+from db5_global.db56_lazy_exports import lazy_exports
 
-from .db52_dtype_dict import (
-    get_valid_item_types,
-    f_types_vals
-)
+# Exported name -> defining module; each module is imported on first access
+LAZY_EXPORTS = {
+    "print_debug_info": "db5_global.db50_global_misc",
+
+    "get_valid_item_types": "db5_global.db52_dtype_dict",
+    "f_types_vals": "db5_global.db52_dtype_dict",
+    "astype_f_type": "db5_global.db52_dtype_dict",
+    "get_unknown_category_mask": "db5_global.db52_dtype_dict",
+    "get_unknown_category_fallback": "db5_global.db52_dtype_dict",
+    "get_read_dtype": "db5_global.db52_dtype_dict",
+    "get_category_codes": "db5_global.db52_dtype_dict",
+    "recode_categories": "db5_global.db52_dtype_dict",
+
+    "traced_stage": "db5_global.db54_trace",
+    "trace_enabled": "db5_global.db54_trace",
+    "set_trace_format": "db5_global.db54_trace",
+    "reset_trace": "db5_global.db54_trace",
+    "get_trace_events": "db5_global.db54_trace",
+    "write_trace": "db5_global.db54_trace",
+}
 
 __all__ = [
     "get_valid_item_types",
     "f_types_vals",
-    "print_debug_info"
-]
\ No newline at end of file
+    "astype_f_type",
+    "get_unknown_category_mask",
+    "get_unknown_category_fallback",
+    "get_read_dtype",
+    "get_category_codes",
+    "recode_categories",
+    "print_debug_info",
+    "traced_stage",
+    "trace_enabled",
+    "set_trace_format",
+    "reset_trace",
+    "get_trace_events",
+    "write_trace",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, LAZY_EXPORTS)
@@ -1,4 +1,29 @@
 import numpy as np
+import pandas as pd
+
+# Categorical dtypes for low-cardinality columns.
+# Closed domains use a fixed category set shared by every column of the family, so
+# column-to-column comparisons and isin() run on the integer codes. Values outside
+# the set are rejected by astype_f_type() instead of silently becoming NaN; hand-edited
+# inputs map them to get_unknown_category_fallback() with a warning instead.
+ITEM_TYPE_CATEGORIES = [
+    'file', 'folder', 'file_sym', 'folder_sym', 'file_alias', 'folder_alias', 'alias', 'unknown', 'none',
+]
+DOT_STRUC_CATEGORIES = ['rp>hm', 'rp', 'hm']
+DOT_STATE_CATEGORIES = ['Synced', 'Local', 'NoSym']
+SUBSYSTEM_STATUS_CATEGORIES = ['o', 'x']
+DRIFT_CATEGORIES = ['same', 'drift', 'error']
+ALERT_CATEGORIES = ['YAML Inconsistency', 'Home Folder New Item', 'Doc Only No FS', 'Symlink Overwrite']
+
+ITEM_TYPE_DTYPE = pd.CategoricalDtype(ITEM_TYPE_CATEGORIES)
+DOT_STRUC_DTYPE = pd.CategoricalDtype(DOT_STRUC_CATEGORIES)
+DOT_STATE_DTYPE = pd.CategoricalDtype(DOT_STATE_CATEGORIES)
+SUBSYSTEM_STATUS_DTYPE = pd.CategoricalDtype(SUBSYSTEM_STATUS_CATEGORIES)
+ALERT_DTYPE = pd.CategoricalDtype(ALERT_CATEGORIES)
+DRIFT_DTYPE = pd.CategoricalDtype(DRIFT_CATEGORIES)
+
+# Open domains (user-defined repo scopes and config categories): categories are inferred per frame
+OPEN_CATEGORY_DTYPE = 'category'
 
 def get_valid_item_types():
     valid_types_repo = {
@@ -33,27 +58,27 @@ f_types_vals = {
     'item_name_home': {'dtype': 'string', 'default': np.nan},
 
     # Item Type Fields
-    'item_type': {'dtype': 'string', 'default': np.nan},
-    'item_type_rp': {'dtype': 'string', 'default': np.nan},
-    'item_type_hm': {'dtype': 'string', 'default': np.nan},
-    'item_type_rp_db': {'dtype': 'string', 'default': np.nan},
-    'item_type_hm_db': {'dtype': 'string', 'default': np.nan},
-    'item_type_rp_cf': {'dtype': 'string', 'default': np.nan},
-    'item_type_hm_cf': {'dtype': 'string', 'default': np.nan},
-    'item_type_repo': {'dtype': 'string', 'default': np.nan},
-    'item_type_home': {'dtype': 'string', 'default': np.nan},
-    'repo_scope_rp': {'dtype': 'string', 'default': np.nan},
-    'repo_scope_db': {'dtype': 'string', 'default': np.nan},
-    'repo_scope_cf': {'dtype': 'string', 'default': np.nan},
-    'dot_state': {'dtype': 'string', 'default': np.nan},
+    'item_type': {'dtype': ITEM_TYPE_DTYPE, 'default': np.nan},
+    'item_type_rp': {'dtype': ITEM_TYPE_DTYPE, 'default': np.nan},
+    'item_type_hm': {'dtype': ITEM_TYPE_DTYPE, 'default': np.nan},
+    'item_type_rp_db': {'dtype': ITEM_TYPE_DTYPE, 'default': np.nan},
+    'item_type_hm_db': {'dtype': ITEM_TYPE_DTYPE, 'default': np.nan},
+    'item_type_rp_cf': {'dtype': ITEM_TYPE_DTYPE, 'default': np.nan},
+    'item_type_hm_cf': {'dtype': ITEM_TYPE_DTYPE, 'default': np.nan},
+    'item_type_repo': {'dtype': ITEM_TYPE_DTYPE, 'default': np.nan},
+    'item_type_home': {'dtype': ITEM_TYPE_DTYPE, 'default': np.nan},
+    'repo_scope_rp': {'dtype': OPEN_CATEGORY_DTYPE, 'default': np.nan},
+    'repo_scope_db': {'dtype': OPEN_CATEGORY_DTYPE, 'default': np.nan},
+    'repo_scope_cf': {'dtype': OPEN_CATEGORY_DTYPE, 'default': np.nan},
+    'dot_state': {'dtype': DOT_STATE_DTYPE, 'default': np.nan},
 
     # Other Fields
     'git_rp': {'dtype': 'bool', 'default': np.nan},
-    'dot_struc': {'dtype': 'string', 'default': np.nan},
-    'dot_struc_cf': {'dtype': 'string', 'default': np.nan},
-    'cat_1_cf': {'dtype': 'string', 'default': np.nan},
-    'cat_1_name_cf': {'dtype': 'string', 'default': np.nan},
-    'cat_2_cf': {'dtype': 'string', 'default': np.nan},
+    'dot_struc': {'dtype': DOT_STRUC_DTYPE, 'default': np.nan},
+    'dot_struc_cf': {'dtype': DOT_STRUC_DTYPE, 'default': np.nan},
+    'cat_1_cf': {'dtype': OPEN_CATEGORY_DTYPE, 'default': np.nan},
+    'cat_1_name_cf': {'dtype': OPEN_CATEGORY_DTYPE, 'default': np.nan},
+    'cat_2_cf': {'dtype': OPEN_CATEGORY_DTYPE, 'default': np.nan},
     'comment_cf': {'dtype': 'string', 'default': np.nan},
     'no_show_cf': {'dtype': 'bool', 'default': np.nan},
     'sort_orig': {'dtype': 'Int64', 'default': 0},
@@ -61,9 +86,10 @@ f_types_vals = {
     'nosym_sort': {'dtype': 'Int64', 'default': 0},
 
     # Status Fields
-    'st_alert': {'dtype': 'string', 'default': np.nan},
-    'st_db_all': {'dtype': 'string', 'default': np.nan},
-    'st_docs': {'dtype': 'string', 'default': np.nan},
+    'st_alert': {'dtype': ALERT_DTYPE, 'default': np.nan},
+    'st_drift': {'dtype': DRIFT_DTYPE, 'default': np.nan},  # Only present with DOTREP_CONTENT_DRIFT
+    'st_db_all': {'dtype': SUBSYSTEM_STATUS_DTYPE, 'default': np.nan},
+    'st_docs': {'dtype': SUBSYSTEM_STATUS_DTYPE, 'default': np.nan},
     'st_misc': {'dtype': 'string', 'default': np.nan},
 
     # 'match_dict': {'dtype': 'object', 'default': {}},
@@ -75,3 +101,56 @@ f_types_vals = {
     'm_consol_result': {'dtype': 'bool', 'default': np.nan},
     'st_match_symb': {'dtype': 'string', 'default': ""},
 }
+
+
+def is_category_dtype(dtype):
+    return isinstance(dtype, pd.CategoricalDtype) or dtype == OPEN_CATEGORY_DTYPE
+
+
+def get_read_dtype(column):
+    """dtype to parse a column with (fixed categoricals are parsed as string, then validated by astype_f_type)."""
+    dtype = f_types_vals[column]['dtype']
+    return 'string' if isinstance(dtype, pd.CategoricalDtype) else dtype
+
+
+def get_unknown_category_mask(series, column):
+    """True where a value is present but outside the fixed category set of `column` (all False for open domains)."""
+    dtype = f_types_vals[column]['dtype']
+    if not isinstance(dtype, pd.CategoricalDtype):
+        return np.zeros(len(series), dtype=bool)
+    return (series.notna() & ~series.isin(dtype.categories)).to_numpy(dtype=bool)
+
+
+def get_unknown_category_fallback(column):
+    """Replacement for an out-of-set value: 'unknown' where the category set has it, else missing."""
+    return 'unknown' if 'unknown' in f_types_vals[column]['dtype'].categories else pd.NA
+
+
+def astype_f_type(series, column):
+    """Cast a Series to the registry dtype of `column`, rejecting values outside a fixed category set."""
+    dtype = f_types_vals[column]['dtype']
+    unknown = get_unknown_category_mask(series, column)
+    if unknown.any():
+        values = series[unknown]
+        rows = ', '.join(f"{label}={value!r}" for label, value in values.head(5).items())
+        raise ValueError(
+            f"Unexpected {column} value(s) at row {rows}{' ...' if len(values) > 5 else ''} "
+            f"(expected one of: {', '.join(dtype.categories)})"
+        )
+    return series.astype(dtype)
+
+
+def get_category_codes(series, column):
+    """Integer category codes of `series` under the registry dtype of `column` (-1 for missing)."""
+    if not isinstance(series.dtype, pd.CategoricalDtype) or series.dtype != f_types_vals[column]['dtype']:
+        series = astype_f_type(series, column)
+    return series.cat.codes.to_numpy()
+
+
+def recode_categories(series, mapping):
+    """Map values of a fixed-category Series onto other categories of the same dtype by remapping codes."""
+    categories = series.dtype.categories
+    code_map = categories.get_indexer([mapping.get(category, category) for category in categories])
+    codes = series.cat.codes.to_numpy()
+    new_codes = np.where(codes >= 0, code_map[codes], -1)
+    return pd.Series(pd.Categorical.from_codes(new_codes, dtype=series.dtype), index=series.index)
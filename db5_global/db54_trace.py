@@ -0,0 +1,131 @@
+import os
+import json
+import time
+import functools
+import threading
+
+# Per-stage timing trace (set DOTREP_TRACE=1 for JSON, DOTREP_TRACE=chrome for Chrome trace-event format)
+TRACE_ENV = "DOTREP_TRACE"
+TRACE_FORMATS = {"1": "json", "true": "json", "yes": "json", "on": "json", "json": "json", "chrome": "chrome"}
+
+TRACE_CONFIG = {'format': TRACE_FORMATS.get(str(os.getenv(TRACE_ENV, "")).strip().lower())}
+
+_trace_events = []
+_trace_lock = threading.Lock()
+_trace_local = threading.local()
+
+
+def trace_enabled():
+    return TRACE_CONFIG['format'] is not None
+
+
+def set_trace_format(trace_format):
+    """Enable ('json' or 'chrome') or disable (None) tracing at runtime."""
+    TRACE_CONFIG['format'] = trace_format
+
+
+def reset_trace():
+    with _trace_lock:
+        _trace_events.clear()
+
+
+def get_trace_events():
+    with _trace_lock:
+        return list(_trace_events)
+
+
+def describe_shape(value):
+    """Return (rows, cols) for a DataFrame/Series-like value, (len, None) for lists and sets."""
+    shape = getattr(value, 'shape', None)
+    if shape is not None:
+        return shape[0], (shape[1] if len(shape) > 1 else None)
+    if isinstance(value, tuple) and value:
+        return describe_shape(value[0])
+    if isinstance(value, (list, set)):
+        return len(value), None
+    return None, None
+
+
+def traced_stage(stage_name):
+    """
+    Decorator recording a stage's duration and input/output shapes when tracing is enabled.
+
+    The input shape is taken from the first DataFrame-like argument.
+    When tracing is disabled the wrapper adds a single dict lookup per call.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if TRACE_CONFIG['format'] is None:
+                return func(*args, **kwargs)
+
+            input_value = next((arg for arg in (*args, *kwargs.values()) if hasattr(arg, 'shape')), None)
+            rows_in, cols_in = describe_shape(input_value) if input_value is not None else (None, None)
+
+            depth = getattr(_trace_local, 'depth', 0)
+            _trace_local.depth = depth + 1
+            start_ns = time.perf_counter_ns()
+            try:
+                result = func(*args, **kwargs)
+            finally:
+                end_ns = time.perf_counter_ns()
+                _trace_local.depth = depth
+
+            rows_out, cols_out = describe_shape(result)
+            event = {
+                'stage': stage_name,
+                'start_us': start_ns // 1000,
+                'duration_us': (end_ns - start_ns) // 1000,
+                'depth': depth,
+                'thread': threading.get_ident(),
+                'rows_in': rows_in,
+                'cols_in': cols_in,
+                'rows_out': rows_out,
+                'cols_out': cols_out,
+            }
+            with _trace_lock:
+                _trace_events.append(event)
+            return result
+        return wrapper
+    return decorator
+
+
+def build_chrome_trace(events):
+    """Convert trace events to Chrome trace-event format (chrome://tracing, Perfetto)."""
+    pid = os.getpid()
+    return {
+        'traceEvents': [
+            {
+                'name': event['stage'],
+                'ph': 'X',
+                'ts': event['start_us'],
+                'dur': event['duration_us'],
+                'pid': pid,
+                'tid': event['thread'],
+                'args': {
+                    key: event[key]
+                    for key in ('rows_in', 'cols_in', 'rows_out', 'cols_out')
+                    if event[key] is not None
+                },
+            }
+            for event in events
+        ],
+        'displayTimeUnit': 'ms',
+    }
+
+
+def write_trace(output_path):
+    """Write the collected trace (in the configured format) and return the path, or None if disabled."""
+    trace_format = TRACE_CONFIG['format']
+    if trace_format is None:
+        return None
+
+    events = sorted(get_trace_events(), key=lambda event: event['start_us'])
+    if trace_format == 'chrome':
+        payload = build_chrome_trace(events)
+    else:
+        payload = {'stages': events}
+
+    with open(output_path, 'w') as f:
+        json.dump(payload, f, indent=1)
+    return output_path
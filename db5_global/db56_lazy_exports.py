@@ -0,0 +1,31 @@
+import sys
+import importlib
+
+
+def lazy_exports(package_name, exports):
+    """
+    Module-level __getattr__ and __dir__ (PEP 562) for a package whose re-exports load on first use.
+
+    `from db0_load import load_hm_dataframe` keeps working, but importing the
+    package (or any of its light submodules) no longer imports pandas, numpy
+    or jinja2 through every sibling module.
+
+    Args:
+        package_name (str): The package's __name__.
+        exports (dict): Exported name -> absolute name of the module defining it.
+
+    Returns:
+        tuple: (__getattr__, __dir__) to assign in the package's __init__.
+    """
+    def __getattr__(name):
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name), name)
+        setattr(sys.modules[package_name], name, value)  # Later lookups skip __getattr__
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package_name])) | set(exports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,13 @@
+import os
+
+# Input paths and switches shared by the loaders and the pandas-free --summary path
+CONFIG_CSV_PATH = "./data/dotrep_config.csv"
+FIXTURE_CSV_PATH = "./data/test_fixtures.csv"
+REPO_SCOPES_CSV_PATH = "./data/repo_scopes.csv"
+
+SHOW_FIXTURES_ENV = "DOTREP_SHOW_TEST_FIXTURES"
+TRUE_VALUES = {'1', 'true', 't', 'yes', 'y', 'on'}
+
+
+def should_show_fixtures_in_report():
+    return str(os.getenv(SHOW_FIXTURES_ENV, "")).strip().lower() in TRUE_VALUES
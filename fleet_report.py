@@ -0,0 +1,143 @@
+import os
+import glob
+import logging
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+# Fleet mode: one report per home directory, built in a bounded process pool
+FLEET_SUMMARY_BASE_NAME = "mac-dot-report_fleet_summary"
+FLEET_MAX_TASKS_PER_CHILD = 20  # Recycle workers to keep per-process memory bounded
+FLEET_SUMMARY_TEXT_COLUMNS = ['account', 'home_root', 'status', 'error']
+
+
+def expand_home_roots(home_root_args):
+    """Expand home roots and globs (e.g. '/home/*') into a sorted, de-duplicated list of directories."""
+    home_roots = set()
+    for home_root_arg in home_root_args:
+        matches = glob.glob(os.path.expanduser(home_root_arg)) or [home_root_arg]
+        for home_root in matches:
+            if os.path.isdir(home_root):
+                home_roots.add(os.path.abspath(home_root))
+            else:
+                logging.warning(f"Skipping home root (not a directory): {home_root}")
+    return sorted(home_roots)
+
+
+def get_account_names(home_roots):
+    """Map each home root to an output folder name (basename, de-duplicated with a suffix)."""
+    account_names = {}
+    used_names = set()
+    for home_root in home_roots:
+        base_name = os.path.basename(home_root.rstrip(os.sep)) or "root"
+        account_name = base_name
+        suffix = 2
+        while account_name in used_names:
+            account_name = f"{base_name}_{suffix}"
+            suffix += 1
+        used_names.add(account_name)
+        account_names[home_root] = account_name
+    return account_names
+
+
+def summarize_output_dict(main_df_dict):
+    """Reduce one account's output dict to a flat summary row."""
+    from db2_rep_df.db26_match_alert import ALERT_PRECEDENCE
+
+    report_df = main_df_dict['report_dataframe']
+    alert_counts = report_df['st_alert'].value_counts() if 'st_alert' in report_df.columns else {}
+
+    summary = {
+        'report_items': len(report_df),
+        'unmanaged_items': len(main_df_dict.get('fs_not_in_di', [])),
+        'missing_items': len(main_df_dict.get('di_not_in_fs', [])),
+    }
+    for alert_name in ALERT_PRECEDENCE:
+        column = 'alerts_' + alert_name.lower().replace(' ', '_')
+        summary[column] = int(alert_counts.get(alert_name, 0))
+    return summary
+
+
+def make_account_summary(home_root, account_name, error=None):
+    """Summary row of one account; with error, the row of a failed build."""
+    return {
+        'account': account_name,
+        'home_root': home_root,
+        'status': 'ok' if error is None else 'error',
+        'error': '' if error is None else f"{type(error).__name__}: {error}",
+    }
+
+
+def build_account_report(home_root, account_name, reports_dir, save_config):
+    """Worker entry point: build and save one account's report, return its summary row."""
+    # Every loader resolves '~' through $HOME, so point it at this account.
+    # Pin the cache first: it belongs to the operator, not to the scanned account's ~/.cache.
+    from db0_load.db08_scan_cache import SCAN_CACHE_DIR_ENV, get_scan_cache_dir
+    os.environ[SCAN_CACHE_DIR_ENV] = get_scan_cache_dir()
+    os.environ["HOME"] = home_root
+
+    from db1_main_df.db10_make_df_dict import build_full_output_dict
+    from report_gen import save_outputs
+
+    summary = make_account_summary(home_root, account_name)
+    try:
+        main_df_dict = build_full_output_dict()
+        save_outputs(main_df_dict, save_config, reports_dir=os.path.join(reports_dir, account_name))
+        summary.update(summarize_output_dict(main_df_dict))
+    except Exception as e:
+        summary = make_account_summary(home_root, account_name, e)
+
+    return summary
+
+
+def run_fleet(home_root_args, reports_dir, save_config, max_workers=None):
+    """
+    Build reports for many home directories in a process pool.
+
+    Args:
+        home_root_args (list[str]): Home roots and/or globs such as '/home/*'.
+        reports_dir (str): Base output directory; each account gets a sub-folder.
+        save_config (dict): Output toggles passed to save_outputs().
+        max_workers (int): Worker processes (defaults to the CPU count).
+
+    Returns:
+        str: Path of the aggregated summary CSV.
+    """
+    import pandas as pd
+    from report_gen import export_dataframe_to_csv
+
+    home_roots = expand_home_roots(home_root_args)
+    account_names = get_account_names(home_roots)
+    max_workers = max(1, min(max_workers or os.cpu_count() or 1, len(home_roots) or 1))
+    logging.info(f"Fleet run: {len(home_roots)} home directories, {max_workers} workers")
+
+    summaries = []
+    with ProcessPoolExecutor(max_workers=max_workers, max_tasks_per_child=FLEET_MAX_TASKS_PER_CHILD) as executor:
+        futures = {
+            executor.submit(build_account_report, home_root, account_names[home_root], reports_dir, save_config): home_root
+            for home_root in home_roots
+        }
+        for future in as_completed(futures):
+            try:
+                summary = future.result()
+            except Exception as e:
+                # The worker itself died (BrokenProcessPool after an OOM kill or a crash): record the account as failed
+                home_root = futures[future]
+                summary = make_account_summary(home_root, account_names[home_root], e)
+            if summary['status'] != 'ok':
+                logging.warning(f"Fleet report failed for {summary['home_root']}: {summary['error']}")
+            summaries.append(summary)
+
+    summary_df = pd.DataFrame(summaries)
+    if not summary_df.empty:
+        summary_df = summary_df.sort_values('account').reset_index(drop=True)
+        count_columns = [col for col in summary_df.columns if col not in FLEET_SUMMARY_TEXT_COLUMNS]
+        summary_df[count_columns] = summary_df[count_columns].astype('Int64')  # Failed accounts have no counts
+
+    os.makedirs(reports_dir, exist_ok=True)
+    timestamp = datetime.now().strftime('%y%m%d-%H%M%S')
+    summary_path = os.path.join(reports_dir, f"{timestamp}_{FLEET_SUMMARY_BASE_NAME}.csv")
+    export_dataframe_to_csv(summary_df, filename=summary_path)
+    logging.info(f"Fleet summary saved ({len(summaries)} accounts)")
+
+    return summary_path
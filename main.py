@@ -1,6 +1,5 @@
+import argparse
 import logging
-from db1_main_df.db10_make_df_dict import build_full_output_dict
-from report_gen import save_outputs
 
 # Configure logging
 logging.basicConfig(
@@ -8,13 +7,49 @@ logging.basicConfig(
     level=logging.INFO
 )
 
-def main():
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog='dotreport', description='Generate the mac dot report.')
+    parser.add_argument(
+        '--fleet', nargs='+', metavar='HOME_ROOT',
+        help="Build one report per home directory (paths or globs such as '/home/*')",
+    )
+    parser.add_argument(
+        '--workers', type=int, default=None,
+        help='Worker processes for --fleet (default: CPU count)',
+    )
+    parser.add_argument(
+        '--watch', action='store_true',
+        help='Keep running and rebuild the report when $HOME, a repo root or a data file changes (Linux)',
+    )
+    parser.add_argument(
+        '--summary', action='store_true',
+        help='Only print the unmanaged and missing item counts (fast; no report is written)',
+    )
+    args = parser.parse_args(argv)
+    if args.watch and args.fleet:
+        parser.error('--watch cannot be combined with --fleet')
+    if args.summary and (args.fleet or args.watch):
+        parser.error('--summary cannot be combined with --fleet or --watch')
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    # Fast path for shell prompts: no pandas, no outputs
+    if args.summary:
+        from summary_report import run_summary
+        run_summary()
+        return
+
     # Configuration options
     config = {
         'verbose_output': False,  # Set to True to enable DataFrame debug output
         'save_markdown': True,
         'save_report_csv': True,
-        'save_full_csv': False
+        'save_full_csv': False,
+        'compress_csv': False,  # Set to True to write the CSV outputs as .csv.gz
+        'save_snapshot': False,  # Set to True to also write a binary snapshot of both DataFrames
+        'save_diff': False,  # Set to True to write the changes since the previous run (keeps snapshots)
     }
     
     # Diagnostic: Show resolved output path
@@ -24,17 +59,34 @@ def main():
     env_var = "SRB_REPORTS_DIR" if os.getenv("SRB_REPORTS_DIR") else "./_output"
     path_obj = Path(reports_dir).resolve()
     print(f"Output directory: {env_var} (.../{path_obj.name})")
-    
-    main_df_dict = build_full_output_dict(verbose=config['verbose_output'])
 
     # Configuration to control which outputs to save
     save_config = {
         'save_markdown': config['save_markdown'],
         'save_report_csv': config['save_report_csv'],
-        'save_full_csv': config['save_full_csv']
+        'save_full_csv': config['save_full_csv'],
+        'compress_csv': config['compress_csv'],
+        'save_snapshot': config['save_snapshot'],
+        'save_diff': config['save_diff'],
     }
 
+    if args.fleet:
+        from fleet_report import run_fleet
+        run_fleet(args.fleet, reports_dir, save_config, max_workers=args.workers)
+        return
+
+    if args.watch:
+        from watch_report import run_watch
+        run_watch(save_config, reports_dir, verbose=config['verbose_output'])
+        return
+    
+    # Imported here so --help, --summary and argument errors skip pandas, numpy and jinja2
+    from db1_main_df.db10_make_df_dict import build_full_output_dict
+    from report_gen import save_outputs
+
+    main_df_dict = build_full_output_dict(verbose=config['verbose_output'])
+
     save_outputs(main_df_dict, save_config)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
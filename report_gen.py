@@ -1,17 +1,20 @@
+import io
 import os
+import gzip
+import pickle
+import struct
 import logging
+import functools
 import pandas as pd
 
 from datetime import datetime
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
 from pathlib import Path
+from db5_global.db54_trace import traced_stage, write_trace
 
-# Retrieve preferred reports directory (set in ~/.zshrc)
+# Retrieve preferred reports directory (set in ~/.zshrc); created by save_outputs(), not at import
 REPORTS_DIR = os.getenv("SRB_REPORTS_DIR", "./_output")
 
-# Ensure the directory exists
-Path(REPORTS_DIR).mkdir(parents=True, exist_ok=True)
-
 def format_output_path_display(path):
     """Format path for display: show env var name and abbreviated path"""
     env_var = "SRB_REPORTS_DIR" if os.getenv("SRB_REPORTS_DIR") else "./_output"
@@ -22,64 +25,320 @@ def format_output_path_display(path):
 USER_CONFIG_CSV_PATH = 'data'
 REPORT_TEMPLATE_J2 = 'report_md.jinja2'
 OUTPUT_BASE_NAME = "mac-dot-report"
+CSV_CHUNK_ROWS = 50_000  # Rows formatted per to_csv call when streaming; bounds the text buffer size
+RECORD_CHUNK_ROWS = 10_000  # Report rows converted to template records per batch
+TEMPLATE_CACHE_SUBDIR = "jinja"  # Compiled-template bytecode, under the scan cache directory
+SNAPSHOT_FRAMES = ['full_main_dataframe', 'report_dataframe']
+SNAPSHOT_MAGIC = b"DOTSNAP1"
+SNAPSHOT_ALIGN = 64  # Out-of-band buffers start on 64-byte boundaries
+SNAPSHOT_SUFFIX = ".snapshot"
+DIFF_SUFFIX = "_diff.csv"
 
-def generate_timestamped_output_paths(base_name):
+def generate_timestamped_output_paths(base_name, reports_dir=REPORTS_DIR):
     timestamp = datetime.now().strftime('%y%m%d-%H%M%S')
     
-    markdown_output_path = os.path.join(REPORTS_DIR, f"{timestamp}_{base_name}.md")
-    csv_output_path = os.path.join(REPORTS_DIR, f"{timestamp}_{base_name}.csv")
-    full_csv_output_path = os.path.join(REPORTS_DIR, f"{timestamp}_{base_name}_FULL_DF.csv")
+    markdown_output_path = os.path.join(reports_dir, f"{timestamp}_{base_name}.md")
+    csv_output_path = os.path.join(reports_dir, f"{timestamp}_{base_name}.csv")
+    full_csv_output_path = os.path.join(reports_dir, f"{timestamp}_{base_name}_FULL_DF.csv")
     
     return csv_output_path, full_csv_output_path, markdown_output_path
 
 # CONVERT DATAFRAMES TO OUTPUT FORMATS
+def get_template_bytecode_cache():
+    from db0_load.db08_scan_cache import get_scan_cache_dir
+    cache_dir = os.path.join(get_scan_cache_dir(), TEMPLATE_CACHE_SUBDIR)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+    except OSError as e:
+        logging.warning(f"Template bytecode cache disabled: {e}")
+        return None
+    return FileSystemBytecodeCache(cache_dir)
+
+@functools.lru_cache(maxsize=None)
+def get_report_environment(template_dir=USER_CONFIG_CSV_PATH):
+    """Jinja environment built once per process; compiled templates are also cached on disk."""
+    env = Environment(
+        loader=FileSystemLoader(template_dir),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        bytecode_cache=get_template_bytecode_cache(),
+    )
+    env.globals['pd'] = pd
+    return env
+
+def iter_report_records(df, chunk_rows=RECORD_CHUNK_ROWS):
+    """Yield df.to_dict(orient='records') rows, materializing at most `chunk_rows` dicts at a time."""
+    # Categorical columns yield NaN for missing values; as 'string' they yield None like the rest
+    category_columns = [column for column in df.columns if isinstance(df[column].dtype, pd.CategoricalDtype)]
+    for start in range(0, len(df), chunk_rows):
+        chunk = df.iloc[start:start + chunk_rows]
+        if category_columns:
+            chunk = chunk.astype({column: 'string' for column in category_columns})
+        yield from chunk.to_dict(orient='records')
+
+def iter_managed_records(df):
+    """Report rows that belong to a configured category (the items listed in the markdown body)."""
+    for record in iter_report_records(df):
+        cat_1_name = record.get('cat_1_name_cf')
+        if cat_1_name is not None and cat_1_name != 'None':
+            yield record
+
+@traced_stage('export_to_markdown')
 def export_to_markdown(output_file, df=None, fs_not_in_di=None, di_not_in_fs=None, test_fixtures=None):
     try:
         if df is None:
             raise ValueError("DataFrame 'df' must be provided")
 
-        env = Environment(
-            loader=FileSystemLoader(USER_CONFIG_CSV_PATH),
-            trim_blocks=True,
-            lstrip_blocks=True
-        )
-        env.globals['pd'] = pd
-
-        template = env.get_template(REPORT_TEMPLATE_J2)
-        rendered_markdown = template.render(
-            csv_data=df.to_dict(orient='records'),
+        template = get_report_environment().get_template(REPORT_TEMPLATE_J2)
+        rendered_chunks = template.generate(
+            managed_items=iter_managed_records(df),
             fs_not_in_di=fs_not_in_di if fs_not_in_di else [],
             di_not_in_fs=di_not_in_fs if di_not_in_fs else [],
             test_fixtures=test_fixtures if test_fixtures else [],
         )
 
-        with open(output_file, 'w') as file:
-            file.write(rendered_markdown)
+        # Stream the rendered chunks into a temp file, then rename into place
+        tmp_path = get_tmp_output_path(output_file)
+        try:
+            with open(tmp_path, 'x') as file:
+                file.writelines(rendered_chunks)
+            os.replace(tmp_path, output_file)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
 
         logging.info("Markdown report generated")
     except Exception as e:
         logging.error(f"Failed to export DataFrame to Markdown: {e}")
 
-def export_dataframe_to_csv(df, filename, columns=None):
+def get_tmp_output_path(output_path):
+    """Hidden temp path next to output_path (same filesystem, so os.replace is atomic)."""
+    output_dir, output_name = os.path.split(os.path.abspath(output_path))
+    return os.path.join(output_dir, f".{output_name}.{os.getpid()}.tmp")
+
+def get_csv_output_path(filename, compress=False):
+    return filename + ".gz" if compress and not filename.endswith(".gz") else filename
+
+def stream_dataframe_to_csv(df, filename, columns=None, chunk_rows=CSV_CHUNK_ROWS, compress=False):
+    """
+    Write df to CSV in chunks of `chunk_rows`, optionally gzip-compressed, atomically.
+
+    Rows go to a hidden temp file in the target directory, which is renamed over
+    `filename` only once complete, so readers never see a partial report.
+    Output is byte-identical to a single df.to_csv(index=False) call.
+
+    Returns:
+        str: The written path ('.gz' appended when compressing).
+    """
+    output_path = get_csv_output_path(filename, compress)
+    tmp_path = get_tmp_output_path(output_path)
+
+    try:
+        with open(tmp_path, 'xb') as raw_file:
+            # mtime=0 keeps the gzip header (and thus the file) reproducible
+            binary_file = gzip.GzipFile(fileobj=raw_file, mode='wb', mtime=0) if compress else raw_file
+            text_file = io.TextIOWrapper(binary_file, encoding='utf-8', newline='')
+            for start in range(0, max(len(df), 1), chunk_rows):
+                df.iloc[start:start + chunk_rows].to_csv(
+                    text_file, index=False, columns=columns, header=(start == 0)
+                )
+            text_file.flush()
+            text_file.detach()
+            if compress:
+                binary_file.close()  # Writes the gzip trailer; raw_file stays open
+            raw_file.flush()
+            os.fsync(raw_file.fileno())
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+    return output_path
+
+@traced_stage('export_dataframe_to_csv')
+def export_dataframe_to_csv(df, filename, columns=None, compress=False):
     try:
-        df.to_csv(filename, index=False, columns=columns)
+        output_path = stream_dataframe_to_csv(df, filename, columns=columns, compress=compress)
         logging.info("DataFrame exported to CSV")
+        return output_path
     except Exception as e:
         logging.error(f"Failed to export DataFrame to CSV: {e}")
 
+# BINARY SNAPSHOTS
+# Layout: magic | u64 pickle length | pickle (protocol 5) | u32 buffer count | (u64 offset, u64 length) * n | buffers
+# The pickle stores each frame with its exact dtypes (Int64, string, bool, object dicts);
+# numpy/extension-array data goes out-of-band as raw buffers and is not copied through the pickler.
+def _collect_out_of_band_buffer(buffers):
+    def callback(pickle_buffer):
+        try:
+            buffers.append(pickle_buffer.raw())
+            return False  # Out-of-band
+        except BufferError:
+            return True  # Non-contiguous buffer: keep it in-band
+    return callback
+
+def _aligned(offset):
+    return -(-offset // SNAPSHOT_ALIGN) * SNAPSHOT_ALIGN
+
+def write_dataframe_snapshot(frames, output_path):
+    """
+    Write a dict of DataFrames to a binary snapshot (atomic temp file + rename).
+
+    Args:
+        frames (dict[str, DataFrame]): Frames to store, e.g. the output dict subset.
+        output_path (str): Snapshot path.
+
+    Returns:
+        str: output_path
+    """
+    buffers = []
+    payload = pickle.dumps(
+        {'version': 1, 'frames': frames},
+        protocol=5,
+        buffer_callback=_collect_out_of_band_buffer(buffers),
+    )
+
+    header_size = len(SNAPSHOT_MAGIC) + 8 + len(payload) + 4 + 16 * len(buffers)
+    buffer_index = []
+    offset = _aligned(header_size)
+    for buffer in buffers:
+        buffer_index.append((offset, buffer.nbytes))
+        offset = _aligned(offset + buffer.nbytes)
+
+    tmp_path = get_tmp_output_path(output_path)
+    try:
+        with open(tmp_path, 'xb') as f:
+            f.write(SNAPSHOT_MAGIC)
+            f.write(struct.pack('<Q', len(payload)))
+            f.write(payload)
+            f.write(struct.pack('<I', len(buffers)))
+            for buffer_offset, buffer_length in buffer_index:
+                f.write(struct.pack('<QQ', buffer_offset, buffer_length))
+            for buffer, (buffer_offset, _) in zip(buffers, buffer_index):
+                f.write(b"\0" * (buffer_offset - f.tell()))
+                f.write(buffer)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+    return output_path
+
+def load_dataframe_snapshot(snapshot_path):
+    """
+    Load a snapshot written by write_dataframe_snapshot() and return its dict of DataFrames.
+
+    The file is read once into a writable buffer and the frames' arrays are views
+    into it. Snapshots are pickles: only load files this tool wrote.
+    """
+    with open(snapshot_path, 'rb') as f:
+        data = bytearray(os.fstat(f.fileno()).st_size)
+        f.readinto(data)
+
+    view = memoryview(data)
+    if bytes(view[:len(SNAPSHOT_MAGIC)]) != SNAPSHOT_MAGIC:
+        raise ValueError(f"Not a dot report snapshot: {snapshot_path}")
+
+    position = len(SNAPSHOT_MAGIC)
+    (payload_length,) = struct.unpack_from('<Q', view, position)
+    position += 8
+    payload = view[position:position + payload_length]
+    position += payload_length
+    (buffer_count,) = struct.unpack_from('<I', view, position)
+    position += 4
+
+    buffers = []
+    for _ in range(buffer_count):
+        buffer_offset, buffer_length = struct.unpack_from('<QQ', view, position)
+        position += 16
+        buffers.append(view[buffer_offset:buffer_offset + buffer_length])
+
+    snapshot = pickle.loads(payload, buffers=buffers)
+    return snapshot['frames']
+
+@traced_stage('save_snapshot')
+def save_snapshot(main_df_dict, snapshot_output_path):
+    frames = {name: main_df_dict[name] for name in SNAPSHOT_FRAMES if name in main_df_dict}
+    try:
+        write_dataframe_snapshot(frames, snapshot_output_path)
+        logging.info("DataFrame snapshot saved")
+        return snapshot_output_path
+    except Exception as e:
+        logging.error(f"Failed to save DataFrame snapshot: {e}")
+
+def find_previous_snapshot(reports_dir=REPORTS_DIR, base_name=OUTPUT_BASE_NAME):
+    """Newest timestamped snapshot in reports_dir, or None (timestamps sort lexically)."""
+    suffix = f"_{base_name}{SNAPSHOT_SUFFIX}"
+    try:
+        names = [name for name in os.listdir(reports_dir) if name.endswith(suffix)]
+    except OSError:
+        return None
+    return os.path.join(reports_dir, max(names)) if names else None
+
+def save_report_diff(main_df_dict, previous_snapshot_path, diff_output_path, compress=False):
+    """Write the delta between the previous run's report and this one; None if there is no previous run."""
+    from db2_rep_df.db28_report_diff import diff_report_dataframes
+
+    if previous_snapshot_path is None:
+        logging.info("No previous snapshot found; report diff starts with the next run")
+        return None
+    try:
+        previous_df = load_dataframe_snapshot(previous_snapshot_path)['report_dataframe']
+        report_diff = diff_report_dataframes(previous_df, main_df_dict['report_dataframe'])
+    except Exception as e:
+        logging.error(f"Failed to diff against previous snapshot: {e}")
+        return None
+    main_df_dict['report_diff'] = report_diff
+    output_path = export_dataframe_to_csv(report_diff, filename=diff_output_path, compress=compress)
+    logging.info(f"Report diff saved ({len(report_diff)} changed items)")
+    return output_path
+
 # SAVE OUTPUTS TO DISK
-def save_outputs(main_df_dict, config):
-    csv_output_path, full_csv_output_path, markdown_output_path = generate_timestamped_output_paths(OUTPUT_BASE_NAME)
+def save_outputs(main_df_dict, config, reports_dir=REPORTS_DIR):
+    Path(reports_dir).mkdir(parents=True, exist_ok=True)
+    csv_output_path, full_csv_output_path, markdown_output_path = generate_timestamped_output_paths(OUTPUT_BASE_NAME, reports_dir)
 
     # Log output directory once instead of spamming with full paths
-    logging.info(f"Output directory: {format_output_path_display(REPORTS_DIR)}")
+    logging.info(f"Output directory: {format_output_path_display(reports_dir)}")
 
     if config.get('save_markdown', True):
         save_markdown(main_df_dict, markdown_output_path)
+    compress_csv = config.get('compress_csv', False)
     if config.get('save_report_csv', True):
-        save_report_csv(main_df_dict, csv_output_path)
+        csv_output_path = save_report_csv(main_df_dict, csv_output_path, compress=compress_csv)
     if config.get('save_full_csv', True):
-        save_full_csv(main_df_dict, full_csv_output_path)
+        full_csv_output_path = save_full_csv(main_df_dict, full_csv_output_path, compress=compress_csv)
+
+    # The diff reads the previous run's snapshot, so diffing also keeps a snapshot for the next run
+    output_stem = os.path.splitext(markdown_output_path)[0]
+    diff_output_path = None
+    if config.get('save_diff', False):
+        diff_output_path = save_report_diff(
+            main_df_dict, find_previous_snapshot(reports_dir), output_stem + DIFF_SUFFIX, compress=compress_csv,
+        )
+
+    snapshot_output_path = None
+    if config.get('save_snapshot', False) or config.get('save_diff', False):
+        snapshot_output_path = save_snapshot(main_df_dict, output_stem + SNAPSHOT_SUFFIX)
+
+    # Stage timing trace (only written when DOTREP_TRACE is set)
+    trace_output_path = write_trace(output_stem + "_trace.json")
+    if trace_output_path:
+        logging.info("Stage trace saved")
+
+    return {
+        'markdown': markdown_output_path if config.get('save_markdown', True) else None,
+        'report_csv': csv_output_path if config.get('save_report_csv', True) else None,
+        'full_csv': full_csv_output_path if config.get('save_full_csv', True) else None,
+        'snapshot': snapshot_output_path,
+        'diff': diff_output_path,
+        'trace': trace_output_path,
+    }
 
 def save_markdown(main_df_dict, markdown_output_path):
     export_to_markdown(
@@ -90,13 +349,15 @@ def save_markdown(main_df_dict, markdown_output_path):
         test_fixtures=main_df_dict.get('test_fixtures', []),
     )
 
-def save_report_csv(main_df_dict, csv_output_path):
-    export_dataframe_to_csv(main_df_dict['report_dataframe'], filename=csv_output_path)
+def save_report_csv(main_df_dict, csv_output_path, compress=False):
+    output_path = export_dataframe_to_csv(main_df_dict['report_dataframe'], filename=csv_output_path, compress=compress)
     logging.info("Report CSV saved")
+    return output_path
 
-def save_full_csv(main_df_dict, full_csv_output_path):
+def save_full_csv(main_df_dict, full_csv_output_path, compress=False):
     if 'full_main_dataframe' in main_df_dict:
-        export_dataframe_to_csv(main_df_dict['full_main_dataframe'], filename=full_csv_output_path)
+        output_path = export_dataframe_to_csv(main_df_dict['full_main_dataframe'], filename=full_csv_output_path, compress=compress)
         logging.info("Full DataFrame CSV saved")
+        return output_path
     else:
         logging.warning("Warning: 'full_main_dataframe' key not found in main_df_dict. Full DataFrame not saved.")
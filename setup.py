@@ -3,7 +3,7 @@ from setuptools import setup, find_packages
 setup(
     name='mac-dot-report',
     version='0.1.0',
-    packages=find_packages(),
+    packages=find_packages(exclude=['benchmarks', 'tests']),
     install_requires=[
         'iniconfig==2.0.0',
         'Jinja2==3.1.4',
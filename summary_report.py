@@ -0,0 +1,101 @@
+import os
+import csv
+
+from db5_global.db58_settings import (
+    CONFIG_CSV_PATH,
+    FIXTURE_CSV_PATH,
+    TRUE_VALUES,
+    should_show_fixtures_in_report,
+)
+
+# Summary mode: unmanaged/missing counts from a plain $HOME listing and the CSVs, without pandas
+CONFIG_NAME_COLUMNS = ("item_name_rp_cf", "item_name_hm_cf")
+
+# Cells pandas.read_csv() reads as missing by default; the loaders drop the same names
+CSV_NA_VALUES = {
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+}
+
+
+def read_csv_rows(path):
+    with open(path, newline="") as f:
+        return list(csv.DictReader(f))
+
+
+def get_csv_value(row, column):
+    value = row.get(column)
+    return None if value is None or value in CSV_NA_VALUES else value
+
+
+def is_true(value):
+    return value is not None and value.strip().lower() in TRUE_VALUES
+
+
+def list_home_dot_names(home_path):
+    """Top-level dot item names, without classifying their types."""
+    with os.scandir(home_path) as entries:
+        return {entry.name for entry in entries if entry.name.startswith(".")}
+
+
+def get_config_item_names(config_path=CONFIG_CSV_PATH):
+    """Repo and home item names of the config rows, without 'none' placeholders (nested rows: home path only)."""
+    config_names = set()
+    for row in read_csv_rows(config_path):
+        home_name = get_csv_value(row, "item_name_hm_cf")
+        columns = ("item_name_hm_cf",) if home_name is not None and os.sep in home_name else CONFIG_NAME_COLUMNS
+        for column in columns:
+            item_name = get_csv_value(row, column)
+            if item_name is not None and item_name != "none":
+                config_names.add(item_name)
+    return config_names
+
+
+def get_hidden_fixture_names(fixture_path=FIXTURE_CSV_PATH, hide_enabled_fixtures=True):
+    """Names find_unmatched_items() leaves out: enabled fixtures when hidden, else those flagged suppress_unmatched."""
+    if not os.path.exists(fixture_path):
+        return set()
+    hidden_names = set()
+    for row in read_csv_rows(fixture_path):
+        item_name = (get_csv_value(row, "item_name") or "").strip()
+        if not item_name or not is_true(get_csv_value(row, "enabled")):
+            continue
+        if hide_enabled_fixtures or is_true(get_csv_value(row, "suppress_unmatched")):
+            hidden_names.add(item_name)
+    return hidden_names
+
+
+def count_unmatched_items(home_path=None, config_path=CONFIG_CSV_PATH, fixture_path=FIXTURE_CSV_PATH):
+    """
+    Count the report's unmatched items without building it.
+
+    Same rules as find_unmatched_items(): unmanaged items are in $HOME but
+    not in the config, missing items are in the config but not in $HOME,
+    and fixtures are hidden the same way. Nested config paths (e.g.
+    .config/nvim) count as present when they exist. Dotbot YAML is not
+    read, so a nested Dotbot target that the config does not name is not
+    counted as unmanaged.
+
+    Returns:
+        dict: {'unmanaged': int, 'missing': int}
+    """
+    home_path = home_path or os.path.expanduser("~")
+    config_names = get_config_item_names(config_path)
+    home_names = list_home_dot_names(home_path)
+    home_names.update(
+        item_name for item_name in config_names
+        if os.sep in item_name and os.path.lexists(os.path.join(home_path, item_name))
+    )
+    hidden_names = get_hidden_fixture_names(fixture_path, hide_enabled_fixtures=not should_show_fixtures_in_report())
+
+    return {
+        'unmanaged': len(home_names - config_names - hidden_names),
+        'missing': len(config_names - home_names - hidden_names),
+    }
+
+
+def run_summary():
+    """Print one line of counts; fast enough for shell prompts and login hooks."""
+    counts = count_unmatched_items()
+    print(f"{counts['unmanaged']} unmanaged, {counts['missing']} missing")
+    return counts
@@ -0,0 +1,70 @@
+import pytest
+
+from db0_load.db08_scan_cache import SCAN_CACHE_DIR_ENV, SCAN_CACHE_ENV
+from db1_main_df.db10_make_df_dict import find_unmatched_items
+from db1_main_df.db11_make_main_df import build_main_dataframe
+from db1_main_df.db12_load_ctx import LoadContext
+
+CONFIG_HEADER = ("item_name_rp_cf,item_name_hm_cf,dot_struc_cf,item_type_rp_cf,item_type_hm_cf,"
+                 "cat_1_cf,cat_1_name_cf,comment_cf,cat_2_cf,repo_scope_cf,no_show_cf")
+
+
+@pytest.fixture
+def nested_home(tmp_path, monkeypatch):
+    """Home whose Dotbot config links top-level repo items to nested destinations."""
+    home = tmp_path / "home"
+    repo = home / "dotfiles"
+    (repo / "nvim").mkdir(parents=True)
+    (repo / ".ssh_config").write_text("Host *\n")
+    (repo / ".zshrc").write_text("")
+    (repo / "install.conf.yaml").write_text(
+        "- link:\n"
+        "    ~/.zshrc: ~/dotfiles/.zshrc\n"
+        "    ~/.config/nvim: ~/dotfiles/nvim  # folder\n"
+        "    ~/.ssh/config: ~/dotfiles/.ssh_config\n"
+    )
+    (home / ".config").mkdir()
+    (home / ".ssh").mkdir()
+    (home / ".zshrc").symlink_to(repo / ".zshrc")
+    (home / ".config" / "nvim").symlink_to(repo / "nvim")
+    (home / ".ssh" / "config").symlink_to(repo / ".ssh_config")
+
+    data = tmp_path / "data"
+    data.mkdir()
+    (data / "repo_scopes.csv").write_text("repo_scope,repo_path,enabled\npublic,~/dotfiles,TRUE\n")
+    (data / "dotrep_config.csv").write_text(
+        CONFIG_HEADER + "\n"
+        ".zshrc,.zshrc,rp>hm,file,file_sym,term,Terminal,,zsh,public,FALSE\n"
+        "nvim,.config/nvim,rp>hm,folder,folder_sym,term,Terminal,,nvim,public,FALSE\n"
+        ".ssh_config,.ssh/config,rp>hm,file,file_sym,term,Terminal,,ssh,public,FALSE\n"
+    )
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setenv(SCAN_CACHE_ENV, "0")
+    monkeypatch.setenv(SCAN_CACHE_DIR_ENV, str(tmp_path / "cache"))
+    return home
+
+
+def test_top_level_source_joins_nested_destination(nested_home):
+    load_context = LoadContext()
+    main_df = build_main_dataframe(load_context=load_context).set_index("item_name")
+
+    assert "nvim" not in main_df.index  # No Dotbot-only row under the repo name
+    for item_name, item_type in ((".config/nvim", "folder_sym"), (".ssh/config", "file_sym")):
+        row = main_df.loc[item_name]
+        assert row["item_name_hm"] == item_name
+        assert row["item_type_hm"] == item_type
+        assert row["item_name_hm_db"] == item_name
+        assert row["item_name_hm_cf"] == item_name
+    # The repo scan lists dot items only, so `nvim` has no repo row to merge
+    assert main_df.loc[".ssh/config", "item_name_rp"] == ".ssh_config"
+    assert main_df.loc[".zshrc", "item_name_rp"] == ".zshrc"
+
+
+def test_nested_destination_not_unmatched(nested_home):
+    load_context = LoadContext()
+    fs_not_in_di, di_not_in_fs = find_unmatched_items(load_context.home_df, load_context.config_df)
+
+    unmatched_names = {item["item_name"] for item in fs_not_in_di + di_not_in_fs}
+    assert unmatched_names == {".config", ".ssh"}  # Undocumented parent directories only
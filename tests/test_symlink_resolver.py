@@ -0,0 +1,79 @@
+import os
+
+import pytest
+
+from db0_load.db12_symlink_resolver import SYMLINK_MAX_HOPS, SymlinkResolver
+
+
+def make_chain(tmp_path, length):
+    """ch1 -> ch2 -> ... -> ch<length> -> file; returns the link paths in chain order."""
+    (tmp_path / "file").write_text("")
+    links = [str(tmp_path / f"ch{i}") for i in range(1, length + 1)]
+    os.symlink("file", links[-1])
+    for link, target in zip(links, links[1:]):
+        os.symlink(os.path.basename(target), link)
+    return links
+
+
+def resolve(resolver, path):
+    resolution = resolver.resolve_links([path])[path]
+    return resolution.target_kind, resolution.chain_length
+
+
+def test_chain_within_limit(tmp_path):
+    links = make_chain(tmp_path, 3)
+    resolution = SymlinkResolver().resolve_links(links)
+
+    assert [resolution[link].chain_length for link in links] == [3, 2, 1]
+    assert {resolution[link].target_path for link in links} == {os.path.realpath(tmp_path / "file")}
+
+
+@pytest.mark.parametrize("first", [1, 7, 10, 46])
+def test_long_chain_independent_of_order(tmp_path, first):
+    links = make_chain(tmp_path, SYMLINK_MAX_HOPS + 6)
+    expected = {
+        index: ("loop", 0) if len(links) - index + 1 > SYMLINK_MAX_HOPS else ("file", len(links) - index + 1)
+        for index in (1, 6, 7, 10, 46)
+    }
+
+    resolver = SymlinkResolver()
+    resolve(resolver, links[first - 1])  # Warm the cache from a different starting point
+    assert {index: resolve(resolver, links[index - 1]) for index in expected} == expected
+    assert resolve(SymlinkResolver(), links[6]) == ("file", SYMLINK_MAX_HOPS)
+
+
+def test_loops(tmp_path):
+    os.symlink("self", tmp_path / "self")
+    os.symlink("b", tmp_path / "a")
+    os.symlink("a", tmp_path / "b")
+    os.symlink("a", tmp_path / "into_loop")
+    resolution = SymlinkResolver().resolve_links([str(tmp_path / name) for name in ("self", "a", "b", "into_loop")])
+
+    assert {path: result.target_kind for path, result in resolution.items()} == {
+        str(tmp_path / name): "loop" for name in ("self", "a", "b", "into_loop")
+    }
+
+
+def test_dangling(tmp_path):
+    (tmp_path / "file").write_text("")
+    os.symlink("missing", tmp_path / "dangling")
+    os.symlink("dangling", tmp_path / "to_dangling")
+    os.symlink("file/child", tmp_path / "under_file")
+    resolution = SymlinkResolver().resolve_links([str(tmp_path / name) for name in ("dangling", "to_dangling", "under_file")])
+
+    assert {path: result.target_kind for path, result in resolution.items()} == {
+        str(tmp_path / name): "dangling" for name in ("dangling", "to_dangling", "under_file")
+    }
+    assert resolution[str(tmp_path / "to_dangling")].target_path == os.path.join(os.path.realpath(tmp_path), "missing")
+
+
+def test_link_through_linked_directory(tmp_path):
+    (tmp_path / "real").mkdir()
+    (tmp_path / "real" / "file").write_text("")
+    os.symlink("real", tmp_path / "dir_link")
+    os.symlink("dir_link/../real/file", tmp_path / "file_link")
+    resolution = SymlinkResolver().resolve_links([str(tmp_path / "file_link")])[str(tmp_path / "file_link")]
+
+    assert resolution.target_path == os.path.realpath(tmp_path / "file_link")
+    assert resolution.target_kind == "file"
+    assert resolution.chain_length == 2
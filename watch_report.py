@@ -0,0 +1,277 @@
+import os
+import time
+import errno
+import select
+import struct
+import ctypes
+import ctypes.util
+import logging
+
+# Watch mode: rebuild the report when a source changes (Linux inotify via ctypes)
+WATCH_DEBOUNCE_SECONDS = 0.1  # Quiet period that ends a burst of events
+WATCH_MAX_DELAY_SECONDS = 0.5  # Rebuild after this long even if events keep arriving
+
+# inotify(7) constants
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = os.O_CLOEXEC
+
+INOTIFY_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+INOTIFY_READ_SIZE = 64 * 1024
+
+# Directory entries appearing, disappearing or being renamed (all the scanners look at)
+ENTRY_CHANGE_MASK = IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO
+# Files rewritten in place or replaced by rename (config files edited by hand)
+FILE_CHANGE_MASK = ENTRY_CHANGE_MASK | IN_CLOSE_WRITE
+WATCH_ROOT_MASK = FILE_CHANGE_MASK | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+
+ALL_SOURCES = ('rp', 'hm', 'db', 'cf', 'fx')
+
+
+class Inotify:
+    """Minimal ctypes binding for inotify_init1 / inotify_add_watch / inotify_rm_watch."""
+
+    def __init__(self):
+        libc_name = ctypes.util.find_library("c")
+        if libc_name is None:
+            raise OSError("Watch mode requires Linux inotify (libc not found)")
+        self.libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(self.libc, "inotify_init1"):
+            raise OSError("Watch mode requires Linux inotify")
+        self.libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+
+        self.fd = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            self.raise_errno("inotify_init1")
+
+    def raise_errno(self, call, path=None):
+        err = ctypes.get_errno()
+        raise OSError(err, f"{call} failed: {os.strerror(err)}", path)
+
+    def add_watch(self, path, mask):
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            self.raise_errno("inotify_add_watch", path)
+        return wd
+
+    def rm_watch(self, wd):
+        self.libc.inotify_rm_watch(self.fd, wd)  # Fails harmlessly if the kernel already dropped it
+
+    def read_events(self):
+        """Drain pending events as (wd, mask, name) tuples; [] when nothing is queued."""
+        try:
+            data = os.read(self.fd, INOTIFY_READ_SIZE)
+        except BlockingIOError:
+            return []
+        events = []
+        offset = 0
+        while offset < len(data):
+            wd, mask, _cookie, name_len = INOTIFY_EVENT_HEADER.unpack_from(data, offset)
+            offset += INOTIFY_EVENT_HEADER.size
+            name = data[offset:offset + name_len].rstrip(b"\0").decode("utf-8", "surrogateescape")
+            offset += name_len
+            events.append((wd, mask, name))
+        return events
+
+    def close(self):
+        os.close(self.fd)
+
+
+def get_watch_targets(dotbot_df=None):
+    """
+    Directories to watch, each mapped to the loader sources its entries feed.
+
+    Watching directories (not files) also catches editors that save by
+    writing a temp file and renaming it over the original. Nested target
+    directories come from the loaded Dotbot frame (none without it).
+
+    Returns:
+        dict: directory -> {'role': str, 'sources': tuple}
+    """
+    from db0_load.db00_load_rp import get_repo_scope_paths
+    from db0_load.db02_load_db import get_dotbot_target_trie
+    from db0_load.db11_path_trie import get_child_names
+
+    home_path = os.path.expanduser("~")
+    repo_scope_paths = get_repo_scope_paths()
+    targets = {home_path: {'role': 'home', 'sources': ('hm',)}}
+    for repo_path in repo_scope_paths.values():
+        # Repo entries feed the repo scan and the Dotbot link types/globs
+        targets.setdefault(os.path.abspath(repo_path), {'role': 'repo', 'sources': ('rp', 'db')})
+    targets.setdefault(get_data_dir(), {'role': 'data', 'sources': ()})
+
+    if dotbot_df is None:
+        return targets
+
+    # Directories below $HOME holding nested Dotbot targets; only their managed names matter
+    for rel_dir, node in get_dotbot_target_trie(dotbot_df).iter_branch_dirs():
+        if rel_dir:
+            targets.setdefault(os.path.join(home_path, rel_dir), {
+                'role': 'nested', 'sources': ('hm',), 'names': get_child_names(node),
+            })
+    return targets
+
+
+def get_data_dir():
+    from db0_load.db03_load_cf import CONFIG_CSV_PATH
+    return os.path.dirname(os.path.abspath(CONFIG_CSV_PATH))
+
+
+def get_data_file_sources():
+    """Basename -> sources for the files in data/ that the loaders read."""
+    from db0_load.db00_load_rp import REPO_SCOPES_CSV_PATH
+    from db0_load.db03_load_cf import CONFIG_CSV_PATH
+    from db0_load.db04_load_fx import FIXTURE_CSV_PATH
+
+    return {
+        os.path.basename(CONFIG_CSV_PATH): ('cf',),
+        os.path.basename(FIXTURE_CSV_PATH): ('fx',),
+        os.path.basename(REPO_SCOPES_CSV_PATH): ('rp', 'db'),
+    }
+
+
+def classify_event(target, mask, name, data_file_sources):
+    """Loader sources affected by one inotify event on a watched directory."""
+    from db0_load.db09_dotbot_conf import DOTBOT_CONFIG_NAMES
+
+    if mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+        return set(target['sources'])
+    if name.endswith('.tmp'):
+        return set()  # Atomic-write temp files (the report writers' and editors') are not items
+    if target['role'] == 'data':
+        return set(data_file_sources.get(name, ())) if mask & FILE_CHANGE_MASK else set()
+    if target['role'] == 'repo' and name in DOTBOT_CONFIG_NAMES:
+        # The LoadContext also reloads hm, whose nested paths come from the Dotbot frame
+        return {'db'} if mask & FILE_CHANGE_MASK else set()
+    if target['role'] == 'nested':
+        return set(target['sources']) if name in target['names'] and mask & ENTRY_CHANGE_MASK else set()
+    if not name.startswith('.'):
+        return set()  # Only root-level dot items are scanned
+    if target['role'] == 'repo' and name == '.gitignore':
+        return {'rp'} if mask & FILE_CHANGE_MASK else set()
+    return set(target['sources']) if mask & ENTRY_CHANGE_MASK else set()
+
+
+class ReportWatcher:
+    """Keeps one LoadContext alive and rebuilds the outputs when watched sources change."""
+
+    def __init__(self, save_config, reports_dir, verbose=False,
+                 debounce=WATCH_DEBOUNCE_SECONDS, max_delay=WATCH_MAX_DELAY_SECONDS):
+        from db1_main_df.db12_load_ctx import LoadContext
+
+        self.save_config = save_config
+        self.reports_dir = reports_dir
+        self.verbose = verbose
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.load_context = LoadContext()
+        self.inotify = Inotify()
+        self.poller = select.poll()
+        self.poller.register(self.inotify.fd, select.POLLIN)
+        self.watches = {}  # wd -> (path, target)
+        self.data_file_sources = get_data_file_sources()
+
+    def sync_watches(self):
+        """(Re)register watches for the current targets, dropping ones no longer configured."""
+        try:
+            dotbot_df = self.load_context.dotbot_df  # Shared with the rebuild: configs are parsed once
+        except Exception as e:
+            # Still watch the roots, so the edit fixing a broken config is seen
+            logging.error(f"Dotbot config load failed: {e}")
+            dotbot_df = None
+        targets = get_watch_targets(dotbot_df)
+        watched_paths = {path: wd for wd, (path, _target) in self.watches.items()}
+        for path, wd in watched_paths.items():
+            if path not in targets:
+                self.inotify.rm_watch(wd)
+                self.watches.pop(wd, None)
+        for path, target in targets.items():
+            try:
+                wd = self.inotify.add_watch(path, WATCH_ROOT_MASK)
+            except OSError as e:
+                if e.errno in (errno.ENOENT, errno.ENOTDIR):
+                    logging.info(f"Watch target not found: {path}")
+                    continue
+                raise
+            self.watches[wd] = (path, target)
+
+    def rebuild(self, sources):
+        from db1_main_df.db10_make_df_dict import build_full_output_dict
+        from db5_global.db54_trace import reset_trace
+        from report_gen import save_outputs
+
+        started = time.perf_counter()
+        self.load_context.invalidate(*sources)
+        # Picks up new repo roots and newly created nested target dirs from the reloaded Dotbot frame
+        self.sync_watches()
+        reset_trace()
+        try:
+            main_df_dict = build_full_output_dict(verbose=self.verbose, load_context=self.load_context)
+            save_outputs(main_df_dict, self.save_config, reports_dir=self.reports_dir)
+        except Exception as e:
+            # Keep watching: the next edit may fix a broken config
+            logging.error(f"Report rebuild failed: {e}")
+            self.load_context.invalidate()
+            return
+        logging.info(f"Report rebuilt in {time.perf_counter() - started:.2f}s (reloaded: {', '.join(sorted(sources)) or 'none'})")
+
+    def wait_for_changes(self):
+        """Block until a burst of events has settled; return the affected sources."""
+        sources = set()
+        first_event_at = None
+        timeout_ms = None  # Idle: block in poll() without waking up
+        while True:
+            if not self.poller.poll(timeout_ms):
+                if first_event_at is not None:
+                    return sources
+                continue
+            for wd, mask, name in self.inotify.read_events():
+                if mask & IN_Q_OVERFLOW:
+                    sources.update(ALL_SOURCES)
+                    continue
+                if wd not in self.watches:
+                    continue
+                path, target = self.watches[wd]
+                if mask & IN_IGNORED:
+                    self.watches.pop(wd, None)  # Directory removed; re-added by sync_watches if it returns
+                    sources.update(target['sources'])
+                    continue
+                event_sources = classify_event(target, mask, name, self.data_file_sources)
+                if event_sources:
+                    logging.debug(f"Watch event in {path}: {name or '.'} -> {sorted(event_sources)}")
+                sources.update(event_sources)
+            if not sources:
+                continue  # Only irrelevant events so far; keep idling
+            now = time.monotonic()
+            if first_event_at is None:
+                first_event_at = now
+            remaining = self.max_delay - (now - first_event_at)
+            if remaining <= 0:
+                return sources
+            timeout_ms = int(min(self.debounce, remaining) * 1000)
+
+    def run(self):
+        self.rebuild(set(ALL_SOURCES))
+        logging.info(f"Watching {len(self.watches)} directories for changes (Ctrl-C to stop)")
+        try:
+            while True:
+                self.rebuild(self.wait_for_changes())
+        except KeyboardInterrupt:
+            logging.info("Watch mode stopped")
+        finally:
+            self.inotify.close()
+
+
+def run_watch(save_config, reports_dir, verbose=False):
+    """Build the report, then rebuild it whenever $HOME, a repo root or a data file changes."""
+    ReportWatcher(save_config, reports_dir, verbose=verbose).run()